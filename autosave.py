@@ -0,0 +1,161 @@
+"""자동 저장 모듈 - 편집이 멈추면 작업 스레드에서 변경 사항을 기록
+
+마지막 편집 후 일정 시간(기본 2초)이 지나면 DataManager의 스냅샷을 떠서
+QThreadPool 작업 스레드에서 저장합니다. 저장은 한 번에 하나만 진행하며,
+저장 중에 생긴 변경은 저장이 끝난 뒤 다시 예약합니다.
+"""
+
+import time
+from typing import List, Dict, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from data_manager import DataManager
+
+
+class _SaveSignals(QObject):
+    """작업 스레드에서 GUI 스레드로 완료를 알리는 시그널"""
+
+    done = pyqtSignal(object)  # 완료된 _SaveTask
+
+
+class _SaveTask(QRunnable):
+    """스냅샷 하나를 저장소에 기록하는 작업"""
+
+    def __init__(self, data_manager: DataManager, snapshot: Dict, records: List[Dict]):
+        super().__init__()
+        self.data_manager = data_manager
+        self.snapshot = snapshot
+        self.records = records
+        self.signals = _SaveSignals()
+        # 작업 결과 (run() 종료 후 유효)
+        self.latency_ms = 0.0
+        self.error: Optional[str] = None
+
+    def run(self):
+        start = time.perf_counter()
+        try:
+            self.data_manager.write_snapshot(self.snapshot, self.records)
+        except Exception as e:
+            self.error = str(e)
+        self.latency_ms = (time.perf_counter() - start) * 1000
+        self.signals.done.emit(self)
+
+
+class AutoSaver(QObject):
+    """디바운스된 백그라운드 자동 저장 컨트롤러"""
+
+    # 상태 값
+    CLEAN = "clean"
+    DIRTY = "dirty"
+    SAVING = "saving"
+    SAVED = "saved"
+    FAILED = "failed"
+
+    state_changed = pyqtSignal(str)
+    save_failed = pyqtSignal(str)
+
+    def __init__(self, data_manager: DataManager, delay_ms: int = 2000, parent: Optional[QObject] = None):
+        """
+        Args:
+            data_manager (DataManager): 저장할 데이터 매니저
+            delay_ms (int): 마지막 편집 후 저장까지 기다리는 시간 (ms)
+            parent (Optional[QObject]): 부모 객체
+        """
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.state = self.CLEAN
+        self.last_latency_ms = 0.0
+        self.last_error = ""
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._task: Optional[_SaveTask] = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.save_now)
+
+    @property
+    def is_saving(self) -> bool:
+        """저장이 진행 중인지 여부"""
+        return self._task is not None
+
+    def schedule(self) -> None:
+        """편집이 있었음을 알리고 자동 저장을 (다시) 예약합니다."""
+        if not self.data_manager.has_unsaved_changes():
+            return
+        if not self.is_saving:
+            self._set_state(self.DIRTY)
+        self._timer.start()
+
+    def cancel(self) -> None:
+        """예약된 자동 저장을 취소합니다 (진행 중인 저장은 계속됨)."""
+        self._timer.stop()
+        if not self.is_saving and self.data_manager.has_unsaved_changes():
+            self._set_state(self.DIRTY)
+
+    def save_now(self) -> None:
+        """예약을 기다리지 않고 백그라운드 저장을 시작합니다."""
+        self._timer.stop()
+        if self.is_saving or not self.data_manager.has_unsaved_changes():
+            return  # 진행 중인 저장이 끝나면 _complete에서 다시 확인
+        snapshot, records = self.data_manager.take_snapshot()
+        task = _SaveTask(self.data_manager, snapshot, records)
+        task.setAutoDelete(False)
+        task.signals.done.connect(self._complete)
+        self._task = task
+        self._set_state(self.SAVING)
+        self._pool.start(task)
+
+    def flush(self) -> None:
+        """진행 중인 저장을 기다린 뒤 남은 변경 사항을 GUI 스레드에서 바로 저장합니다.
+
+        프로그램 종료나 다시 불러오기 전에 호출합니다.
+
+        Raises:
+            Exception: 저장에 실패한 경우
+        """
+        self._timer.stop()
+        self.wait()
+        if self.data_manager.has_unsaved_changes():
+            start = time.perf_counter()
+            try:
+                self.data_manager.save_data()
+            except Exception as e:
+                self.last_error = str(e)
+                self._set_state(self.FAILED)
+                raise
+            self.last_latency_ms = (time.perf_counter() - start) * 1000
+            self._set_state(self.SAVED)
+
+    def wait(self) -> None:
+        """진행 중인 백그라운드 저장이 끝날 때까지 기다립니다."""
+        if self._task is None:
+            return
+        self._pool.waitForDone()
+        # 큐에 쌓인 완료 시그널을 기다리지 않고 결과를 바로 정리
+        self._complete(self._task)
+
+    def _complete(self, task: _SaveTask) -> None:
+        """저장 작업 결과를 반영합니다 (작업마다 한 번만)."""
+        if task is not self._task:
+            return
+        self._task = None
+        if task.error is not None:
+            # 기록하지 못한 레코드는 다음 저장 때 다시 시도
+            self.data_manager.restore_pending(task.records)
+            self.last_error = task.error
+            self._set_state(self.FAILED)
+            self.save_failed.emit(task.error)
+            return
+        self.last_latency_ms = task.latency_ms
+        self.last_error = ""
+        self._set_state(self.SAVED)
+        if self.data_manager.has_unsaved_changes():
+            self.schedule()
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        self.state_changed.emit(state)
@@ -3,12 +3,17 @@
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, 
                               QLineEdit, QPushButton, QComboBox, QTextEdit,
                               QFileDialog, QColorDialog, QMessageBox, QWidget,
-                              QCheckBox, QScrollArea, QInputDialog, QFrame)
+                              QCheckBox, QScrollArea, QInputDialog, QFrame,
+                              QListWidget, QListWidgetItem)
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QColor, QFont
-from typing import Optional, Dict, List
-import re
-from datetime import datetime
+from typing import Optional, Dict, List, Set
+import events
+from dates import current_month_ordinal, is_valid_date
+from events import ChangeEvent
+from facet_index import QUARTER, SHAPE
+from models import node_date
+from query import parse_query
 
 
 class ModernDialog(QDialog):
@@ -329,22 +334,6 @@ class NodeDialog(ModernDialog):
             self.attached_file = filename
             self.file_label.setText(filename)
     
-    def _validate_date(self, date_str: str) -> bool:
-        """날짜 양식 검증: YY.MM 또는 YY.Qn 형식만 허용"""
-        date_str = date_str.strip().upper()
-        
-        # YY.Qn 형식 검증 (예: 24.Q1, 24.Q2)
-        quarter_pattern = r'^\d{2}\.Q[1-4]$'
-        if re.match(quarter_pattern, date_str):
-            return True
-        
-        # YY.MM 형식 검증 (예: 24.10, 24.01)
-        month_pattern = r'^\d{2}\.(0[1-9]|1[0-2]|\d)$'
-        if re.match(month_pattern, date_str):
-            return True
-        
-        return False
-    
     def _on_confirm(self):
         date = self.date_input.text().strip()
         content = self.content_input.text().strip()
@@ -375,7 +364,7 @@ class NodeDialog(ModernDialog):
             return
         
         # 날짜 양식 검증
-        if not self._validate_date(date):
+        if not is_valid_date(date):
             msg = QMessageBox(self)
             msg.setIcon(QMessageBox.Icon.Warning)
             msg.setWindowTitle("날짜 형식 오류")
@@ -422,11 +411,17 @@ class NodeDialog(ModernDialog):
 
 
 class DateFilterDialog(ModernDialog):
-    """날짜 필터 다이얼로그"""
+    """날짜 필터 다이얼로그
     
-    def __init__(self, parent=None):
+    data_manager를 넘기면 분기마다 해당 노드/마일스톤 수를 함께 표시합니다.
+    """
+    
+    QUARTERS = ["Q1 (1~3월)", "Q2 (4~6월)", "Q3 (7~9월)", "Q4 (10~12월)"]
+    
+    def __init__(self, parent=None, data_manager=None):
         super().__init__(parent, "날짜 필터")
-        self.setFixedSize(400, 250)
+        self.data_manager = data_manager
+        self.setFixedSize(480 if data_manager is not None else 400, 250)
         self.result = None
         
         from datetime import datetime
@@ -447,8 +442,11 @@ class DateFilterDialog(ModernDialog):
         
         layout.addWidget(QLabel("분기 선택"))
         self.quarter_combo = QComboBox()
-        self.quarter_combo.addItems(["Q1 (1~3월)", "Q2 (4~6월)", "Q3 (7~9월)", "Q4 (10~12월)"])
+        self.quarter_combo.addItems(self.QUARTERS)
         layout.addWidget(self.quarter_combo)
+        if data_manager is not None:
+            self.year_combo.currentTextChanged.connect(self._update_quarter_counts)
+            self._update_quarter_counts(self.year_combo.currentText())
         
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
@@ -468,9 +466,19 @@ class DateFilterDialog(ModernDialog):
         layout.addLayout(btn_layout)
         self.setLayout(layout)
     
+    def _update_quarter_counts(self, year_text: str):
+        """선택한 년도의 분기별 노드/마일스톤 수 표시 (패싯 색인 조회)"""
+        facets = self.data_manager.facet_index
+        year = int(year_text) % 100
+        for i, label in enumerate(self.QUARTERS):
+            value = (year, i + 1)
+            node_count = facets.node_count(QUARTER, value)
+            if node_count:
+                label += f" · ■ {node_count}개 노드 / {facets.milestone_count(QUARTER, value)}개 마일스톤"
+            self.quarter_combo.setItemText(i, label)
+    
     def _on_apply(self):
-        quarter_text = self.quarter_combo.currentText()
-        quarter = int(quarter_text.split()[0][1])  # "Q1 (1~3월)" -> 1
+        quarter = self.quarter_combo.currentIndex() + 1  # "Q1 (1~3월)" -> 1
         
         self.result = {
             "year": int(self.year_combo.currentText()),
@@ -480,17 +488,60 @@ class DateFilterDialog(ModernDialog):
 
 
 class SearchFilterDialog(ModernDialog):
-    """검색 및 필터 다이얼로그"""
+    """검색 및 필터 다이얼로그
     
-    def __init__(self, parent=None):
+    data_manager를 넘기면 초성/오타 허용 빠른 찾기가 함께 표시되며,
+    결과를 선택하면 result에 해당 마일스톤 ID 필터가 담깁니다.
+    settings를 넘기면 현재 검색 조건을 입력란에 채워 둡니다.
+    """
+    
+    MAX_FUZZY_RESULTS = 30
+    
+    def __init__(self, parent=None, data_manager=None, settings: Optional[Dict] = None):
         super().__init__(parent, "검색 및 필터")
-        self.setFixedSize(450, 360)
+        self.data_manager = data_manager
+        settings = settings or {}
+        self.setFixedSize(450, 720 if data_manager is not None else 440)
         self.result = None
         
         layout = QVBoxLayout()
         layout.setSpacing(15)
         layout.setContentsMargins(30, 30, 30, 30)
         
+        if data_manager is not None:
+            layout.addWidget(QLabel("빠른 찾기 (초성·오타 허용)"))
+            self.fuzzy_input = QLineEdit()
+            self.fuzzy_input.setPlaceholderText("예: ㄴㄱㄱ, 노광귀")
+            self.fuzzy_input.textChanged.connect(self._on_fuzzy_changed)
+            layout.addWidget(self.fuzzy_input)
+            
+            self.fuzzy_list = QListWidget()
+            self.fuzzy_list.setFixedHeight(200)
+            self.fuzzy_list.setStyleSheet("""
+                QListWidget {
+                    background: white;
+                    border: 1px solid #d2d2d7;
+                    border-radius: 8px;
+                    color: #1d1d1f;
+                    font-size: 13px;
+                }
+                QListWidget::item {
+                    padding: 6px;
+                }
+                QListWidget::item:selected {
+                    background: #E3F2FD;
+                    color: #1d1d1f;
+                }
+            """)
+            self.fuzzy_list.itemActivated.connect(self._on_fuzzy_selected)
+            self.fuzzy_list.itemDoubleClicked.connect(self._on_fuzzy_selected)
+            layout.addWidget(self.fuzzy_list)
+        
+        layout.addWidget(QLabel("쿼리 (필드: shape, color, date, category, title, content)"))
+        self.query_input = QLineEdit()
+        self.query_input.setPlaceholderText("예: shape:★ date:24.Q3..25.Q1 content:반입 -category:R&D")
+        layout.addWidget(self.query_input)
+        
         layout.addWidget(QLabel("제목, 부제목 검색"))
         self.keyword_input = QLineEdit()
         self.keyword_input.setPlaceholderText("제목, 부제목에서 검색")
@@ -503,9 +554,22 @@ class SearchFilterDialog(ModernDialog):
         
         layout.addWidget(QLabel("모양 필터"))
         self.shape_combo = QComboBox()
-        self.shape_combo.addItems(["전체"] + NodeDialog.SHAPES)
+        self.shape_combo.addItem("전체", None)
+        # 모양별 노드 수 표시 (패싯 색인 조회)
+        shape_counts = data_manager.facet_index.values(SHAPE) if data_manager is not None else {}
+        for shape in NodeDialog.SHAPES:
+            count = shape_counts.get(shape, 0)
+            self.shape_combo.addItem(f"{shape} · {count}개 노드" if data_manager is not None else shape,
+                                     shape)
         layout.addWidget(self.shape_combo)
         
+        self.query_input.setText(settings.get("query", ""))
+        self.keyword_input.setText(settings.get("keyword", ""))
+        self.content_input.setText(settings.get("content_keyword", ""))
+        shape_index = self.shape_combo.findData(settings.get("shape"))
+        if shape_index > 0:
+            self.shape_combo.setCurrentIndex(shape_index)
+        
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
         
@@ -524,11 +588,50 @@ class SearchFilterDialog(ModernDialog):
         layout.addLayout(btn_layout)
         self.setLayout(layout)
     
+    def _on_fuzzy_changed(self, text: str):
+        """빠른 찾기 - 입력할 때마다 점수 순 결과 표시"""
+        self.fuzzy_list.clear()
+        query = text.strip()
+        if not query:
+            return
+        for hit in self.data_manager.fuzzy_search(query, self.MAX_FUZZY_RESULTS):
+            milestone = self.data_manager.get_milestone(hit.milestone_id)
+            if milestone is None:
+                continue
+            if hit.node_id:
+                label = f"📍 {milestone.get('title', '')} › {hit.text}"
+            else:
+                label = f"📋 {hit.text}"
+            item = QListWidgetItem(label)
+            item.setData(Qt.ItemDataRole.UserRole, (hit.milestone_id, milestone.get("title", "")))
+            self.fuzzy_list.addItem(item)
+    
+    def _on_fuzzy_selected(self, item: QListWidgetItem):
+        """빠른 찾기 결과 선택 - 해당 마일스톤으로 필터링"""
+        milestone_id, milestone_title = item.data(Qt.ItemDataRole.UserRole)
+        self.result = {
+            "milestone_id": milestone_id,
+            "milestone_title": milestone_title
+        }
+        self.accept()
+    
     def _on_apply(self):
+        # 빠른 찾기에서 엔터를 누르면 선택한(없으면 첫 번째) 결과로 이동
+        if (self.data_manager is not None and self.fuzzy_list.count()
+                and (self.fuzzy_input.hasFocus() or self.fuzzy_list.hasFocus())):
+            self._on_fuzzy_selected(self.fuzzy_list.currentItem() or self.fuzzy_list.item(0))
+            return
+        query = self.query_input.text().strip()
+        try:
+            parse_query(query)
+        except ValueError as e:
+            QMessageBox.warning(self, "쿼리 오류", str(e))
+            return
         self.result = {
+            "query": query,
             "keyword": self.keyword_input.text().strip(),
             "content_keyword": self.content_input.text().strip(),
-            "shape": None if self.shape_combo.currentText() == "전체" else self.shape_combo.currentText()
+            "shape": self.shape_combo.currentData()
         }
         self.accept()
 
@@ -827,6 +930,15 @@ class KeywordBlock(QWidget):
         
         self.setLayout(layout)
         self.load_keywords()
+        
+        # 키워드가 바뀔 때만 목록을 다시 그림
+        if self.data_manager:
+            self.data_manager.subscribe(self._on_data_changed)
+    
+    def _on_data_changed(self, changes: List[ChangeEvent]):
+        """데이터 변경 알림 - 키워드 변경만 반영"""
+        if any(change.kind == events.KEYWORDS_CHANGED for change in changes):
+            self.load_keywords()
     
     def load_keywords(self):
         """키워드 목록 불러오기 - 선택 상태 보존"""
@@ -866,8 +978,8 @@ class KeywordBlock(QWidget):
         if ok and text.strip():
             keyword = text.strip()
             if keyword not in self.keyword_checkboxes:
+                # 목록은 데이터 변경 알림(_on_data_changed)에서 다시 그림
                 self.data_manager.add_keyword(keyword)
-                self.load_keywords()
                 self._emit_selected_keywords()
     
     def _delete_selected_keywords(self):
@@ -881,7 +993,6 @@ class KeywordBlock(QWidget):
             )
             if reply == QMessageBox.StandardButton.Yes:
                 self.data_manager.delete_keywords(selected)
-                self.load_keywords()
                 self._emit_selected_keywords()
     
     def _emit_selected_keywords(self):
@@ -974,6 +1085,26 @@ class MilestoneListBlock(QWidget):
             # 빈 공간 채우기
             self.list_layout.addStretch()
     
+    def append_milestones(self, milestones: List[Dict]):
+        """목록 끝에 카드 추가 - 검색 결과를 나눠 받으며 표시할 때 사용
+        
+        Args:
+            milestones (List[Dict]): 이어서 표시할 마일스톤
+        """
+        if not milestones:
+            return
+        if not self.milestone_cards:
+            # 빈 목록 안내를 치우고 새로 그림
+            self.update_milestones(milestones)
+            return
+        for milestone in milestones:
+            card = self._create_milestone_card(milestone)
+            if milestone["id"] == self.selected_milestone_id:
+                self._set_card_selected(card, True)
+            # 마지막 빈 공간(stretch) 앞에 삽입
+            self.list_layout.insertWidget(len(self.milestone_cards), card)
+            self.milestone_cards[milestone["id"]] = card
+    
     def _create_milestone_card(self, milestone: Dict) -> QFrame:
         """마일스톤 카드 생성 - 클릭 시 단일 선택"""
         card = QFrame()
@@ -1017,38 +1148,77 @@ class MilestoneListBlock(QWidget):
         
         return card
     
-    def _on_card_clicked(self, milestone_id: str):
-        """카드 클릭 시 단일 선택 처리"""
-        # 이전에 선택된 카드의 스타일 해제
-        if self.selected_milestone_id and self.selected_milestone_id in self.milestone_cards:
-            prev_card = self.milestone_cards[self.selected_milestone_id]
-            prev_card.setStyleSheet("""
+    def patch_milestones(self, milestones: List[Dict], changed_ids: Set[str]):
+        """바뀐 마일스톤의 카드만 다시 만들어 목록 갱신 - 나머지 카드는 그대로 유지
+        
+        Args:
+            milestones (List[Dict]): 표시할 (필터링된) 마일스톤 전체 목록
+            changed_ids (Set[str]): 추가/수정/삭제된 마일스톤 ID
+        """
+        # 빈 목록 안내가 들어가고 빠지는 경우는 전체를 다시 그림
+        if not milestones or not self.milestone_cards:
+            self.update_milestones(milestones)
+            return
+        
+        # 목록에서 빠진 카드 제거
+        visible_ids = {m["id"] for m in milestones}
+        for milestone_id in [mid for mid in self.milestone_cards if mid not in visible_ids]:
+            card = self.milestone_cards.pop(milestone_id)
+            self.list_layout.removeWidget(card)
+            card.deleteLater()
+        
+        # 바뀌었거나 새로 보이는 카드를 목록 순서 위치에 삽입
+        for index, milestone in enumerate(milestones):
+            milestone_id = milestone["id"]
+            old_card = self.milestone_cards.get(milestone_id)
+            if old_card is not None and milestone_id not in changed_ids:
+                continue
+            if old_card is not None:
+                self.list_layout.removeWidget(old_card)
+                old_card.deleteLater()
+            card = self._create_milestone_card(milestone)
+            if milestone_id == self.selected_milestone_id:
+                self._set_card_selected(card, True)
+            self.list_layout.insertWidget(index, card)
+            self.milestone_cards[milestone_id] = card
+    
+    def _set_card_selected(self, card: QFrame, selected: bool):
+        """카드의 선택 스타일 적용"""
+        if selected:
+            card.setStyleSheet("""
                 QFrame#milestone_card {
                     background: white;
-                    border: 2px solid #e8e8ed;
+                    border: 2px solid #007AFF;
                     border-radius: 8px;
                     padding: 12px;
                 }
                 QFrame#milestone_card:hover {
-                    border: 2px solid #86868b;
+                    border: 2px solid #007AFF;
                 }
             """)
-        
-        # 새로운 카드 선택
-        self.selected_milestone_id = milestone_id
-        if milestone_id in self.milestone_cards:
-            card = self.milestone_cards[milestone_id]
+        else:
             card.setStyleSheet("""
                 QFrame#milestone_card {
                     background: white;
-                    border: 2px solid #007AFF;
+                    border: 2px solid #e8e8ed;
                     border-radius: 8px;
                     padding: 12px;
                 }
                 QFrame#milestone_card:hover {
-                    border: 2px solid #007AFF;
+                    border: 2px solid #86868b;
                 }
             """)
+    
+    def _on_card_clicked(self, milestone_id: str):
+        """카드 클릭 시 단일 선택 처리"""
+        # 이전에 선택된 카드의 스타일 해제
+        if self.selected_milestone_id and self.selected_milestone_id in self.milestone_cards:
+            self._set_card_selected(self.milestone_cards[self.selected_milestone_id], False)
+        
+        # 새로운 카드 선택
+        self.selected_milestone_id = milestone_id
+        if milestone_id in self.milestone_cards:
+            self._set_card_selected(self.milestone_cards[milestone_id], True)
         
         # 시그널 발송
         self.milestone_selected.emit(milestone_id)
@@ -1056,18 +1226,7 @@ class MilestoneListBlock(QWidget):
     def clear_selection(self):
         """선택 해제"""
         if self.selected_milestone_id and self.selected_milestone_id in self.milestone_cards:
-            card = self.milestone_cards[self.selected_milestone_id]
-            card.setStyleSheet("""
-                QFrame#milestone_card {
-                    background: white;
-                    border: 2px solid #e8e8ed;
-                    border-radius: 8px;
-                    padding: 12px;
-                }
-                QFrame#milestone_card:hover {
-                    border: 2px solid #86868b;
-                }
-            """)
+            self._set_card_selected(self.milestone_cards[self.selected_milestone_id], False)
         
         self.selected_milestone_id = None
     
@@ -1082,8 +1241,11 @@ class ThisMonthBlock(QWidget):
     
     milestone_clicked = pyqtSignal(str)  # KPI 카드에서 마일스톤 ID를 전달
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, data_manager=None):
         super().__init__(parent)
+        self.data_manager = data_manager
+        self.kpi_cards: Dict[str, "ClickableKPICard"] = {}  # node_id -> KPI 카드 (표시 순서)
+        self._current_month = current_month_ordinal()
         
         self.setStyleSheet("""
             QWidget {
@@ -1123,35 +1285,83 @@ class ThisMonthBlock(QWidget):
         layout.addWidget(scroll_area)
         
         self.setLayout(layout)
+        
+        # 노드 변경은 해당 카드만 다시 만듦
+        if self.data_manager:
+            self.data_manager.subscribe(self._on_data_changed)
     
-    def update_nodes(self, milestones: List[Dict]):
+    def update_nodes(self):
         """이번달 노드들로 KPI 차트 업데이트 - 2열 그리드"""
         # 기존 KPI 카드 제거
-        while self.kpi_layout.count():
-            item = self.kpi_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        for card in self.kpi_cards.values():
+            card.deleteLater()
+        self.kpi_cards.clear()
         
-        # 이번달 추출
-        today = datetime.now()
-        current_year = today.year % 100  # 24, 25 등
-        current_month = today.month
+        # 이번달 추출 (분기 노드는 분기에 이번달이 포함되면 해당) - 날짜 색인으로 조회
+        self._current_month = current_month_ordinal()
         
-        this_month_nodes = []
-        for milestone in milestones:
-            milestone_id = milestone.get("id", "")
-            milestone_title = milestone.get("title", "")
-            for node in milestone.get("nodes", []):
-                date_str = node.get("date", "")
-                if self._is_this_month(date_str, current_year, current_month):
-                    this_month_nodes.append({
-                        "milestone_id": milestone_id,
-                        "milestone_title": milestone_title,
-                        "node": node
-                    })
+        for milestone, node in self.data_manager.nodes_in_month_range(
+                self._current_month, self._current_month):
+            self.kpi_cards[node["id"]] = self._create_kpi_card(
+                milestone.get("id", ""), milestone.get("title", ""), node)
+        
+        self._layout_cards()
+    
+    def _on_data_changed(self, changes: List[ChangeEvent]):
+        """데이터 변경 알림 - 바뀐 노드의 카드만 추가/교체/제거"""
+        changed = False
+        for change in changes:
+            if change.kind in events.NODE_EVENTS:
+                changed |= self._patch_node(change.node_id)
+            elif change.kind in events.MILESTONE_EVENTS:
+                changed |= self._patch_milestone(change.milestone_id)
+        if changed:
+            self._layout_cards()
+    
+    def _patch_node(self, node_id: str) -> bool:
+        """노드 하나의 카드를 현재 데이터에 맞춤 (카드가 바뀌면 True)"""
+        entry = self.data_manager.get_node(node_id)
+        card = None
+        if entry is not None and self._is_this_month(entry[1]):
+            milestone, node = entry
+            card = self._create_kpi_card(milestone["id"], milestone.get("title", ""), node)
+        
+        old_card = self.kpi_cards.get(node_id)
+        if old_card is None and card is None:
+            return False
+        if old_card is not None:
+            old_card.deleteLater()
+        if card is None:
+            del self.kpi_cards[node_id]
+        else:
+            self.kpi_cards[node_id] = card  # 기존 카드 자리(순서) 유지
+        return True
+    
+    def _patch_milestone(self, milestone_id: str) -> bool:
+        """마일스톤 추가/수정/삭제 시 그 마일스톤의 카드를 맞춤 (제목 변경 반영 포함)"""
+        node_ids = [nid for nid, card in self.kpi_cards.items() if card.milestone_id == milestone_id]
+        milestone = self.data_manager.get_milestone(milestone_id)
+        if milestone is not None:
+            node_ids.extend(node["id"] for node in milestone.get("nodes", []))
+        changed = False
+        for node_id in dict.fromkeys(node_ids):
+            changed |= self._patch_node(node_id)
+        return changed
+    
+    def _is_this_month(self, node: Dict) -> bool:
+        """노드 날짜가 이번달을 포함하는지 확인"""
+        parsed = node_date(node)
+        return parsed is not None and parsed.contains(self._current_month)
+    
+    def _layout_cards(self):
+        """KPI 카드를 2열 그리드로 배치 (카드 위젯은 다시 만들지 않음)"""
+        while self.kpi_layout.count():
+            widget = self.kpi_layout.takeAt(0).widget()
+            if widget is not None and not isinstance(widget, ClickableKPICard):
+                widget.deleteLater()
         
         # KPI 카드 생성 - 2열 그리드로 배치
-        if not this_month_nodes:
+        if not self.kpi_cards:
             no_data_label = QLabel("이번달 일정이 없습니다.")
             no_data_label.setStyleSheet("color: #86868b; font-size: 13px; padding: 20px;")
             no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -1159,8 +1369,7 @@ class ThisMonthBlock(QWidget):
         else:
             row = 0
             col = 0
-            for item in this_month_nodes:
-                kpi_card = self._create_kpi_card(item["milestone_id"], item["milestone_title"], item["node"])
+            for kpi_card in self.kpi_cards.values():
                 self.kpi_layout.addWidget(kpi_card, row, col)
                 
                 # 다음 위치 계산 (2열)
@@ -1169,37 +1378,6 @@ class ThisMonthBlock(QWidget):
                     col = 0
                     row += 1
     
-    def _is_this_month(self, date_str: str, current_year: int, current_month: int) -> bool:
-        """날짜가 이번달인지 확인 (월 또는 분기)"""
-        try:
-            parts = date_str.strip().upper().split(".")
-            if len(parts) != 2:
-                return False
-            
-            year = int(parts[0])
-            if year != current_year:
-                return False
-            
-            # 월 형식 (YY.MM)
-            if "Q" not in date_str:
-                month = int(parts[1])
-                return month == current_month
-            
-            # 분기 형식 (YY.Qn)
-            if parts[1].startswith("Q"):
-                quarter = int(parts[1][1])  # "Q4" -> 4
-                # 분기별 월 계산
-                quarter_months = {
-                    1: [1, 2, 3],
-                    2: [4, 5, 6],
-                    3: [7, 8, 9],
-                    4: [10, 11, 12]
-                }
-                return current_month in quarter_months.get(quarter, [])
-        except:
-            pass
-        return False
-    
     def _create_kpi_card(self, milestone_id: str, milestone_title: str, node: Dict) -> QWidget:
         """KPI 카드 생성 - 클릭 가능, 고정 크기, 메모 2줄"""
         card = ClickableKPICard(milestone_id, milestone_title, node, parent=self)
@@ -1634,3 +1812,213 @@ class MilestoneTreeDialog(ModernDialog):
         self.selected_milestone_id = milestone_id
         self.milestone_selected.emit(milestone_id)
         self.accept()  # 다이얼로그 닫기
+
+
+class MergeConflictDialog(ModernDialog):
+    """병합 충돌 다이얼로그 - 충돌마다 우리 쪽/상대 쪽 값 중 하나를 선택"""
+    
+    def __init__(self, parent=None, conflicts: List = None):
+        super().__init__(parent, "🔀 병합 충돌")
+        self.setFixedSize(720, 560)
+        self.conflicts = conflicts or []
+        self.take_theirs = set()  # 상대 쪽을 선택한 충돌의 key
+        self.choice_combos = []
+        
+        layout = QVBoxLayout()
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(15)
+        
+        desc_label = QLabel(f"양쪽에서 다르게 바뀐 항목이 {len(self.conflicts)}개 있습니다. "
+                            "항목마다 유지할 값을 선택하세요")
+        desc_label.setStyleSheet("font-size: 13px; color: #86868b;")
+        desc_label.setWordWrap(True)
+        layout.addWidget(desc_label)
+        
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+        
+        scroll_content = QWidget()
+        scroll_layout = QVBoxLayout(scroll_content)
+        scroll_layout.setSpacing(10)
+        scroll_layout.setContentsMargins(0, 0, 0, 0)
+        for conflict in self.conflicts:
+            scroll_layout.addWidget(self._create_conflict_row(conflict))
+        scroll_layout.addStretch()
+        
+        scroll_area.setWidget(scroll_content)
+        layout.addWidget(scroll_area)
+        
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        
+        cancel_btn = QPushButton("취소")
+        cancel_btn.setObjectName("secondary")
+        cancel_btn.setFixedWidth(100)
+        cancel_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(cancel_btn)
+        
+        apply_btn = QPushButton("병합")
+        apply_btn.setFixedWidth(100)
+        apply_btn.setDefault(True)
+        apply_btn.clicked.connect(self._on_apply)
+        btn_layout.addWidget(apply_btn)
+        
+        layout.addLayout(btn_layout)
+        self.setLayout(layout)
+    
+    def _create_conflict_row(self, conflict) -> QWidget:
+        """충돌 하나를 표시하는 행 생성"""
+        row = QFrame()
+        row.setStyleSheet("""
+            QFrame {
+                background: #f5f5f7;
+                border: 1px solid #e8e8ed;
+                border-radius: 8px;
+            }
+            QLabel {
+                border: none;
+                background: transparent;
+            }
+        """)
+        row_layout = QVBoxLayout(row)
+        row_layout.setContentsMargins(12, 10, 12, 10)
+        row_layout.setSpacing(6)
+        
+        if conflict.kind == "delete":
+            target = "노드" if conflict.node_id else "마일스톤"
+            side = "우리 쪽" if conflict.ours is None else "상대 쪽"
+            title = f"{side}에서 삭제한 {target}를 다른 쪽에서 수정했습니다"
+            ours = "삭제" if conflict.ours is None else "수정본 유지"
+            theirs = "삭제" if conflict.theirs is None else "수정본 유지"
+        else:
+            target = "노드" if conflict.node_id else "마일스톤"
+            title = f"{target}의 '{conflict.field}' 값이 양쪽에서 다르게 바뀌었습니다"
+            ours = self._format_value(conflict.ours)
+            theirs = self._format_value(conflict.theirs)
+        
+        title_label = QLabel(title)
+        title_label.setStyleSheet("font-size: 13px; font-weight: bold; color: #1d1d1f;")
+        row_layout.addWidget(title_label)
+        
+        location = f"마일스톤 {conflict.milestone_id}"
+        if conflict.node_id:
+            location += f" · 노드 {conflict.node_id}"
+        location_label = QLabel(location)
+        location_label.setStyleSheet("font-size: 11px; color: #86868b;")
+        row_layout.addWidget(location_label)
+        
+        combo = QComboBox()
+        combo.addItems([f"우리 쪽: {ours}", f"상대 쪽: {theirs}"])
+        row_layout.addWidget(combo)
+        self.choice_combos.append((conflict, combo))
+        return row
+    
+    @staticmethod
+    def _format_value(value) -> str:
+        """충돌 값을 한 줄로 표시 (긴 값은 줄임)"""
+        if value is None:
+            return "(없음)"
+        text = str(value).replace("\n", " ")
+        return text if len(text) <= 60 else text[:57] + "..."
+    
+    def _on_apply(self):
+        self.take_theirs = {conflict.key for conflict, combo in self.choice_combos
+                            if combo.currentIndex() == 1}
+        self.accept()
+
+
+class MemoSearchDialog(ModernDialog):
+    """메모 검색 다이얼로그 - 노드 메모를 관련도 순으로 검색하고 마일스톤으로 이동"""
+    
+    milestone_selected = pyqtSignal(str)  # 선택된 결과의 마일스톤 ID
+    
+    MAX_RESULTS = 100
+    
+    def __init__(self, parent=None, data_manager=None):
+        super().__init__(parent, "📝 메모 검색")
+        self.setFixedSize(640, 600)
+        self.data_manager = data_manager
+        
+        layout = QVBoxLayout()
+        layout.setSpacing(15)
+        layout.setContentsMargins(30, 30, 30, 30)
+        
+        layout.addWidget(QLabel("메모 내용 검색"))
+        search_layout = QHBoxLayout()
+        self.query_input = QLineEdit()
+        self.query_input.setPlaceholderText("회의 메모에서 검색 (관련도 순)")
+        self.query_input.returnPressed.connect(self._on_search)
+        search_layout.addWidget(self.query_input)
+        
+        search_btn = QPushButton("검색")
+        search_btn.setFixedWidth(100)
+        search_btn.clicked.connect(self._on_search)
+        search_layout.addWidget(search_btn)
+        layout.addLayout(search_layout)
+        
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("font-size: 12px; color: #86868b;")
+        layout.addWidget(self.status_label)
+        
+        self.result_list = QListWidget()
+        self.result_list.setWordWrap(True)
+        self.result_list.setStyleSheet("""
+            QListWidget {
+                background: white;
+                border: 1px solid #d2d2d7;
+                border-radius: 8px;
+                color: #1d1d1f;
+                font-size: 13px;
+            }
+            QListWidget::item {
+                padding: 8px;
+                border-bottom: 1px solid #f5f5f7;
+            }
+            QListWidget::item:selected {
+                background: #E3F2FD;
+                color: #1d1d1f;
+            }
+        """)
+        self.result_list.itemActivated.connect(self._on_result_selected)
+        self.result_list.itemDoubleClicked.connect(self._on_result_selected)
+        layout.addWidget(self.result_list)
+        
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        
+        close_btn = QPushButton("닫기")
+        close_btn.setObjectName("secondary")
+        close_btn.setFixedWidth(100)
+        close_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(close_btn)
+        
+        layout.addLayout(btn_layout)
+        self.setLayout(layout)
+    
+    def _on_search(self):
+        """검색 실행 - 결과마다 마일스톤/노드와 메모 스니펫 표시"""
+        self.result_list.clear()
+        query = self.query_input.text().strip()
+        if not query:
+            self.status_label.setText("")
+            return
+        hits = self.data_manager.search_memos(query, self.MAX_RESULTS)
+        for hit in hits:
+            milestone = self.data_manager.get_milestone(hit.milestone_id)
+            entry = self.data_manager.get_node(hit.node_id)
+            if milestone is None or entry is None:
+                continue
+            content = entry[1].get("content", "")
+            date = entry[1].get("date", "")
+            item = QListWidgetItem(
+                f"📍 {milestone.get('title', '')} › {content} ({date})\n{hit.snippet}")
+            item.setData(Qt.ItemDataRole.UserRole, hit.milestone_id)
+            self.result_list.addItem(item)
+        self.status_label.setText(f"{self.result_list.count()}개 결과 (더블클릭하면 마일스톤으로 이동)"
+                                  if hits else "검색 결과가 없습니다.")
+    
+    def _on_result_selected(self, item: QListWidgetItem):
+        """결과 선택 - 해당 마일스톤으로 이동"""
+        self.milestone_selected.emit(item.data(Qt.ItemDataRole.UserRole))
+        self.accept()
@@ -1,54 +1,470 @@
 """데이터 관리 모듈 - raw.json 파일 읽기/쓰기 및 데이터 구조 관리"""
 
-import json
-import os
-from typing import Dict, List, Optional
-from datetime import datetime
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import events
+from date_index import DateIndex
+from diff import changed_milestone_ids, diff_data
+from events import ChangeEvent
+from facet_index import FacetIndex
+from fuzzy_search import FuzzyIndex, SearchHit
+from ids import IdAllocator
+from journal import replay
+from json_stream import LazyMilestone
+from memo_search import MemoHit, MemoIndex, MemoIndexBuild, make_snippet
+from models import Node
+from query import parse_query, plan_query
+from saved_views import SavedViews
+from storage import StorageBackend, create_storage
+from text_index import TextIndex
+from undo import UndoHistory
+
+
+# 메모 검색 색인 파일 접미사 (raw.json → raw.json.memoindex)
+MEMO_INDEX_SUFFIX = ".memoindex"
+
+# 저장된 보기 파일 접미사 (raw.json → raw.json.views)
+VIEWS_SUFFIX = ".views"
 
 
 class DataManager:
-    """raw.json 파일의 읽기/쓰기 등 데이터 처리 로직을 담당하는 클래스"""
+    """raw.json 파일의 읽기/쓰기 등 데이터 처리 로직을 담당하는 클래스
+
+    모든 변경은 변경 레코드로 만들어져 메모리 데이터에 반영되고,
+    저장 시 저장소 백엔드(storage.py)에 전달됩니다. 기본 백엔드는
+    raw.json 스냅샷 + 저널이며, .db 파일을 지정하면 SQLite를 사용합니다.
+    불러올 때는 마일스톤 헤더만 즉시 파싱하고 노드는 처음 접근할 때
+    파싱합니다(json_stream.LazyMilestone). 노드는 인덱싱할 때 메모리를
+    적게 쓰는 읽기 전용 models.Node로 바뀝니다.
+    """
     
-    def __init__(self, filename: str = "raw.json"):
+    def __init__(self, filename: str = "raw.json", backup_count: int = 3,
+                 storage: Optional[StorageBackend] = None):
         """
         Args:
-            filename (str): 저장할 JSON 파일명 (기본값: raw.json)
+            filename (str): 저장할 데이터 파일명 (기본값: raw.json)
+            backup_count (int): 유지할 백업 세대 수 (0이면 백업하지 않음)
+            storage (Optional[StorageBackend]): 사용할 저장소 백엔드
+                (지정하지 않으면 파일 확장자에 맞춰 생성)
         """
         self.filename = filename
+        self.storage = storage or create_storage(filename, backup_count)
         self.data = {"milestones": [], "keywords": []}
+        # ID 인덱스 - 마일스톤/노드를 O(1)로 찾기 위한 보조 자료구조
+        self._milestone_index: Dict[str, Dict] = {}
+        self._node_index: Dict[str, Tuple[Dict, Dict]] = {}
+        # 마일스톤 ID → 리스트 위치 (_position_stale_from 이후 위치는 다시 계산해야 함)
+        self._positions: Dict[str, int] = {}
+        self._position_stale_from = 0
+        # 아직 저장소에 기록되지 않은 변경 레코드
+        self._pending: List[Dict] = []
+        # 중복 ID를 고친 경우 등 전체를 다시 기록해야 하는지 여부
+        self._needs_compact = False
+        self._id_allocator = IdAllocator()
+        # 저장소 쓰기는 한 번에 하나만 (백그라운드 자동 저장과 직접 저장 직렬화)
+        self._save_lock = threading.Lock()
+        # 변경 알림을 받을 리스너 (트랜잭션마다 한 번, 변경 이벤트 리스트 전달)
+        self._listeners: List[Callable[[List[ChangeEvent]], None]] = []
+        # 진행 중인 트랜잭션의 (변경 레코드, 역방향 레코드) 목록
+        self._transaction: Optional[List[Tuple[Dict, Optional[Dict]]]] = None
+        # 실행 취소/다시 실행 기록 (트랜잭션마다 역방향 레코드만 저장)
+        self.history = UndoHistory()
+        # 실행 취소/다시 실행으로 적용 중인지 ("undo", "redo" 또는 None)
+        self._history_mode: Optional[str] = None
+        # 마지막으로 읽거나 쓴 시점의 저장 파일 상태 (외부 변경 감지용)
+        self._disk_signature: Tuple = ()
+        # 외부 변경을 반영 중인지 (저장/실행 취소 기록 생략)
+        self._applying_external = False
+        # 데이터 버전 - 데이터가 바뀔 때마다(트랜잭션, 불러오기, 전체 교체) 1씩 증가
+        self.version = 0
+        # 제목/부제목/노드 내용 검색 색인 (트랜잭션마다 바뀐 마일스톤만 갱신)
+        self.text_index = TextIndex()
+        self.fuzzy_index = FuzzyIndex()
+        self.memo_index = MemoIndex()
+        self.date_index = DateIndex()
+        self.facet_index = FacetIndex()
+        # 이름을 붙여 저장한 필터 (결과는 트랜잭션마다 바뀐 마일스톤만 갱신)
+        self.saved_views = SavedViews()
+        self._reset_search_indexes(loaded=False)
     
-    def load_data(self) -> Dict:
-        """raw.json 파일을 불러옵니다.
+    def load_data(self, on_milestone: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """저장된 데이터를 불러오고 저널의 변경 사항을 재적용합니다.
+        
+        Args:
+            on_milestone (Optional[Callable]): 마일스톤 헤더가 파싱될 때마다
+                호출되는 콜백 (점진적 표시용)
         
         Returns:
             Dict: 불러온 데이터 딕셔너리
         """
         try:
-            if os.path.exists(self.filename):
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    self.data = json.load(f)
+            if self.storage.exists():
+                self._disk_signature = self.storage.signature()
+                self.data, records = self.storage.load(on_milestone)
                 # keywords 필드가 없으면 추가
                 if "keywords" not in self.data:
                     self.data["keywords"] = []
+                self._needs_compact = False
+                self.history.clear()
+                self._rebuild_index()
+                for record in records:
+                    self._apply_record(record)
+                self.version += 1
+                self._reset_search_indexes(loaded=True)
+                self._pending = []
                 return self.data
             else:
                 return {"milestones": [], "keywords": []}
         except Exception as e:
             raise Exception(f"raw.json 파일을 불러올 수 없습니다: {str(e)}")
     
-    def save_data(self, data: Dict) -> None:
-        """현재 데이터를 raw.json 파일에 저장합니다.
+    def save_data(self, data: Optional[Dict] = None) -> None:
+        """변경 사항을 저장합니다.
+        
+        기록되지 않은 변경 레코드만 저장소에 전달합니다. JSON 백엔드는
+        이를 저널에 추가하고, 저널이 커지면 스냅샷으로 합칩니다.
+        
+        Args:
+            data (Optional[Dict]): 교체할 전체 데이터 딕셔너리
+                (지정하면 현재 데이터를 대체하고 전체를 다시 기록)
+        """
+        try:
+            if data is not None and data is not self.data:
+                self.data = data
+                self.history.clear()
+                self._rebuild_index()
+                self.version += 1
+                self._reset_search_indexes(loaded=False)
+                self.compact()
+                return
+            if self._needs_compact:
+                self.compact()
+                return
+            with self._save_lock:
+                self.storage.save(self.data, self._pending)
+                self._disk_signature = self.storage.signature()
+            self._pending = []
+        except Exception as e:
+            raise Exception(f"데이터 저장 중 오류 발생: {str(e)}")
+    
+    def take_snapshot(self) -> Tuple[Dict, Optional[List[Dict]]]:
+        """백그라운드 저장용 스냅샷을 만들고 대기 중인 변경 레코드를 꺼냅니다.
+        
+        데이터를 수정하는 스레드(GUI 스레드)에서 호출합니다. 노드 딕셔너리는
+        수정되지 않고 교체만 되므로, 마일스톤과 노드 리스트만 얕게 복사하면
+        이후의 편집과 독립적인 스냅샷이 됩니다.
+        
+        Returns:
+            Tuple[Dict, Optional[List[Dict]]]: (스냅샷 데이터, 변경 레코드)
+                전체를 다시 기록해야 하면 변경 레코드 대신 None
+        """
+        records, self._pending = self._pending, []
+        if self._needs_compact:
+            self._needs_compact = False
+            records = None
+        snapshot = dict(self.data)
+        snapshot["milestones"] = [snapshot_milestone(m) for m in self.data.get("milestones", [])]
+        snapshot["keywords"] = list(self.data.get("keywords", []))
+        return snapshot, records
+    
+    def write_snapshot(self, snapshot: Dict, records: Optional[List[Dict]]) -> None:
+        """take_snapshot()으로 꺼낸 변경 사항을 저장소에 기록합니다.
+        
+        작업 스레드에서 호출할 수 있습니다. 실패하면 restore_pending()으로
+        레코드를 되돌려야 합니다.
         
         Args:
-            data (Dict): 저장할 데이터 딕셔너리
+            snapshot (Dict): take_snapshot()이 반환한 스냅샷 데이터
+            records (Optional[List[Dict]]): take_snapshot()이 반환한 변경 레코드
+                (None이면 스냅샷 전체를 기록)
         """
         try:
-            self.data = data
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with self._save_lock:
+                if records is None:
+                    self.storage.compact(snapshot)
+                else:
+                    self.storage.save(snapshot, records)
+                self._disk_signature = self.storage.signature()
         except Exception as e:
             raise Exception(f"데이터 저장 중 오류 발생: {str(e)}")
     
+    def restore_pending(self, records: Optional[List[Dict]]) -> None:
+        """기록하지 못한 변경 레코드를 저장 대기 목록 앞에 되돌립니다.
+        
+        Args:
+            records (Optional[List[Dict]]): write_snapshot()에 실패한 변경 레코드
+                (None이면 다음 저장 때 전체를 다시 기록)
+        """
+        if records is None:
+            self._needs_compact = True
+        else:
+            self._pending[:0] = records
+    
+    def compact(self) -> None:
+        """현재 데이터 전체를 저장소에 새로 기록합니다 (JSON은 저널을 비움)."""
+        self._needs_compact = False
+        try:
+            with self._save_lock:
+                self.storage.compact(self.data)
+                self._disk_signature = self.storage.signature()
+        except Exception:
+            self._needs_compact = True
+            raise
+        self._pending = []
+    
+    def has_external_changes(self) -> bool:
+        """마지막으로 읽거나 쓴 뒤 다른 프로그램이 저장 파일을 바꿨는지 확인합니다.
+        
+        파일 크기와 수정 시각만 비교하므로 주기적으로 호출해도 됩니다.
+        
+        Returns:
+            bool: 저장 파일이 바뀌었으면 True
+        """
+        return self.storage.signature() != self._disk_signature
+    
+    def apply_external_changes(self) -> int:
+        """다른 프로그램이 바꾼 저장 파일과 메모리 데이터의 차이만 반영합니다.
+        
+        디스크의 데이터를 다시 읽어 ID 기준으로 비교하고, 바뀐 마일스톤과
+        노드만 하나의 트랜잭션으로 적용합니다. 반영한 변경은 이미 디스크에
+        있으므로 다시 저장하지 않고 실행 취소 기록에도 남기지 않습니다.
+        아직 저장하지 않은 로컬 변경이 있는 마일스톤(및 키워드)은 로컬
+        내용을 유지합니다.
+        
+        Returns:
+            int: 반영한 변경 레코드 수
+        """
+        signature = self.storage.signature()
+        if signature == self._disk_signature:
+            return 0
+        try:
+            # 색인이나 ID 복구 없이 디스크의 스냅샷에 저널만 재적용한 상태와 비교
+            target, journal_records = self.storage.peek()
+            target = replay(target, journal_records)
+            target.setdefault("keywords", [])
+        except Exception as e:
+            raise Exception(f"변경된 파일을 불러올 수 없습니다: {str(e)}")
+        
+        local_ids = changed_milestone_ids(self._pending)
+        local_keywords = any(r.get("op") == "set_keywords" for r in self._pending)
+        records = [
+            record for record in diff_data(self.data, target)
+            if not (changed_milestone_ids([record]) & local_ids)
+            and not (record["op"] == "set_keywords" and local_keywords)
+        ]
+        
+        self._applying_external = True
+        try:
+            with self.transaction():
+                for record in records:
+                    self._commit(record)
+        finally:
+            self._applying_external = False
+        self._disk_signature = signature
+        return len(records)
+
+    def apply_merged(self, merged: Dict) -> int:
+        """병합 결과(merge.merge_data)와 메모리 데이터의 차이를 반영합니다.
+
+        바뀐 마일스톤과 노드만 하나의 트랜잭션으로 적용하므로 일반 편집처럼
+        저장되고 한 번에 실행 취소할 수 있습니다.
+
+        Args:
+            merged (Dict): 병합된 데이터
+
+        Returns:
+            int: 반영한 변경 레코드 수
+        """
+        records = diff_data(self.data, merged)
+        with self.transaction():
+            for record in records:
+                self._commit(record)
+        return len(records)
+
+    def backup_filename(self, generation: int = 0) -> str:
+        """백업 파일 경로를 반환합니다.
+        
+        Args:
+            generation (int): 백업 세대 (0이 가장 최근)
+        
+        Returns:
+            str: 백업 파일 경로 (백업을 만들지 않는 백엔드는 빈 문자열)
+        """
+        return self.storage.backup_filename(generation)
+    
+    def has_unsaved_changes(self) -> bool:
+        """저장되지 않은 변경 사항이 있는지 확인합니다.
+        
+        Returns:
+            bool: 저장 대기 중인 변경 레코드가 있으면 True
+        """
+        return bool(self._pending) or self._needs_compact
+    
+    def milestone_ids_in_month_range(self, first: int, last: int) -> Set[str]:
+        """월 범위와 겹치는 날짜의 노드를 가진 마일스톤 ID를 조회합니다.
+        
+        날짜 색인(date_index)으로 찾습니다. 색인을 아직 만들지 않았고
+        저장소가 지원하면(SQLite) 노드를 파싱하지 않도록 조회를 저장소에 맡깁니다.
+        
+        Args:
+            first (int): 시작 월 서수 (연도*12 + 월-1)
+            last (int): 끝 월 서수
+        
+        Returns:
+            Set[str]: 마일스톤 ID 집합
+        """
+        if not self.date_index.is_built and not self.has_unsaved_changes():
+            result = self.storage.milestone_ids_in_month_range(first, last)
+            if result is not None:
+                return result
+        return self.date_index.milestone_ids_in_range(first, last)
+    
+    def nodes_in_month_range(self, first: int, last: int) -> List[Tuple[Dict, Dict]]:
+        """월 범위와 겹치는 날짜의 노드를 데이터 순서대로 조회합니다.
+        
+        Args:
+            first (int): 시작 월 서수
+            last (int): 끝 월 서수
+        
+        Returns:
+            List[Tuple[Dict, Dict]]: (마일스톤, 노드) 튜플 리스트
+        """
+        node_ids = self.date_index.node_ids_in_range(first, last)
+        if not node_ids:
+            return []
+        milestone_ids = self.date_index.milestone_ids_in_range(first, last)
+        result = []
+        for milestone in self.data.get("milestones", []):
+            if milestone["id"] in milestone_ids:
+                result.extend((milestone, node) for node in milestone.get("nodes", [])
+                              if node["id"] in node_ids)
+        return result
+    
+    def milestone_ids_with_heading(self, text: str) -> Set[str]:
+        """제목 또는 부제목에 텍스트가 포함된 마일스톤 ID를 조회합니다.
+        
+        대소문자를 구분하지 않으며, 전체를 훑지 않고 역색인(text_index)으로 찾습니다.
+        
+        Args:
+            text (str): 찾을 텍스트
+        
+        Returns:
+            Set[str]: 마일스톤 ID 집합
+        """
+        return self.text_index.search_headings(text)
+    
+    def milestone_ids_with_content(self, text: str) -> Set[str]:
+        """노드 내용 중 하나에 텍스트가 포함된 마일스톤 ID를 조회합니다.
+        
+        Args:
+            text (str): 찾을 텍스트 (대소문자 구분 없음)
+        
+        Returns:
+            Set[str]: 마일스톤 ID 집합
+        """
+        return self.text_index.search_contents(text)
+    
+    def query(self, text: str) -> List[Dict]:
+        """검색 쿼리(예: "shape:★ date:24.Q3..25.Q1 content:반입 -category:R&D")에
+        해당하는 마일스톤을 데이터 순서대로 조회합니다.
+        
+        조건은 색인으로 추정한 선택도 순으로 실행합니다 (query.py 참고).
+        
+        Args:
+            text (str): 검색 쿼리
+        
+        Returns:
+            List[Dict]: 마일스톤 리스트
+        
+        Raises:
+            ValueError: 쿼리를 해석할 수 없는 경우
+        """
+        ids = self.query_ids(text)
+        return [m for m in self.data.get("milestones", []) if m["id"] in ids]
+    
+    def query_ids(self, text: str) -> Set[str]:
+        """검색 쿼리에 해당하는 마일스톤 ID 집합을 조회합니다.
+        
+        Args:
+            text (str): 검색 쿼리
+        
+        Returns:
+            Set[str]: 마일스톤 ID 집합
+        
+        Raises:
+            ValueError: 쿼리를 해석할 수 없는 경우
+        """
+        return plan_query(parse_query(text), self).execute()
+    
+    def fuzzy_search(self, query: str, limit: int = 50) -> List[SearchHit]:
+        """초성 또는 오타를 허용해 제목/부제목과 노드 내용을 검색합니다.
+        
+        Args:
+            query (str): 검색어 (자음으로만 되어 있으면 초성 검색)
+            limit (int): 최대 결과 수
+        
+        Returns:
+            List[SearchHit]: 점수가 높은 순서의 결과 (fuzzy_search.SearchHit)
+        """
+        return self.fuzzy_index.search(query, limit)
+    
+    def search_memos(self, query: str, limit: int = 50) -> List[MemoHit]:
+        """노드 메모를 BM25 점수 순으로 검색합니다.
+        
+        Args:
+            query (str): 검색어
+            limit (int): 최대 결과 수
+        
+        Returns:
+            List[MemoHit]: 점수가 높은 순서의 결과 (메모 스니펫 포함)
+        """
+        hits = []
+        for milestone_id, node_id, score in self.memo_index.search(query, self.get_milestone, limit):
+            entry = self._find_node_entry(milestone_id, node_id)
+            if entry is not None:
+                hits.append(MemoHit(score, milestone_id, node_id,
+                                    make_snippet(entry[1].get("memo", ""), query)))
+        return hits
+    
+    def start_memo_index_build(self) -> Optional[MemoIndexBuild]:
+        """작업 스레드에서 메모 색인을 불러오거나 만들 빌드를 반환합니다.
+        
+        마일스톤의 얕은 사본을 넘기므로 빌드가 실행되는 동안 편집해도 됩니다.
+        저장되지 않은 변경이 없으면 새로 만든 색인을 작업 스레드에서 바로 기록합니다.
+        
+        Returns:
+            Optional[MemoIndexBuild]: 실행한 뒤 install_memo_index()로 넘길 빌드
+                (색인을 이미 만들었으면 None)
+        """
+        save_signature = None if self.has_unsaved_changes() else self._disk_signature
+        return self.memo_index.start_build(
+            (snapshot_milestone(milestone) for milestone in self.get_milestones()), save_signature)
+    
+    def install_memo_index(self, build: MemoIndexBuild) -> bool:
+        """실행을 마친 메모 색인 빌드를 반영합니다 (GUI 스레드에서 호출).
+        
+        Args:
+            build (MemoIndexBuild): start_memo_index_build()가 반환해 실행한 빌드
+        
+        Returns:
+            bool: 반영했는지 여부 (그사이 다시 불러왔거나 검색하면서 이미 만들었으면 False)
+        """
+        return self.memo_index.install(build, self.get_milestone)
+    
+    def save_search_indexes(self) -> None:
+        """메모 색인을 데이터 파일 옆에 기록합니다 (다음 실행 때 재사용).
+        
+        저장되지 않은 변경이 있으면 파일과 색인이 어긋나므로 기록하지 않습니다.
+        """
+        if self.has_unsaved_changes():
+            return
+        try:
+            self.memo_index.save(self._disk_signature)
+        except Exception as e:
+            raise Exception(f"검색 색인 저장 중 오류 발생: {str(e)}")
+    
     def get_milestones(self) -> List[Dict]:
         """모든 마일스톤 목록을 반환합니다.
         
@@ -57,26 +473,55 @@ class DataManager:
         """
         return self.data.get("milestones", [])
     
-    def add_milestone(self, title: str, subtitle: str, category: str = "") -> Dict:
+    def get_milestone(self, milestone_id: str) -> Optional[Dict]:
+        """ID로 마일스톤을 조회합니다.
+        
+        Args:
+            milestone_id (str): 마일스톤 ID
+        
+        Returns:
+            Optional[Dict]: 마일스톤 데이터 (없으면 None)
+        """
+        return self._milestone_index.get(milestone_id)
+    
+    def get_node(self, node_id: str) -> Optional[Tuple[Dict, Dict]]:
+        """ID로 노드와 소속 마일스톤을 조회합니다.
+        
+        아직 노드가 로드되지 않은 마일스톤의 노드는 찾지 않습니다.
+        
+        Args:
+            node_id (str): 노드 ID
+        
+        Returns:
+            Optional[Tuple[Dict, Dict]]: (마일스톤, 노드) 튜플 (없으면 None)
+        """
+        return self._node_index.get(node_id)
+    
+    def add_milestone(self, title: str, subtitle: str, category: str = "",
+                      milestone_id: Optional[str] = None) -> Dict:
         """새로운 마일스톤을 추가합니다.
         
         Args:
             title (str): 마일스톤 제목
             subtitle (str): 마일스톤 부제목
             category (str): 마일스톤 카테고리 (선택사항)
+            milestone_id (Optional[str]): reserve_ids()로 예약한 ID (없으면 새로 발급)
         
         Returns:
             Dict: 생성된 마일스톤 데이터
         """
-        milestone = {
-            "id": self._generate_id(),
-            "title": title,
-            "subtitle": subtitle,
-            "category": category,
-            "nodes": []
-        }
-        self.data["milestones"].append(milestone)
-        return milestone
+        milestone_id = milestone_id or self._generate_id()
+        self._commit({
+            "op": "add_milestone",
+            "milestone": {
+                "id": milestone_id,
+                "title": title,
+                "subtitle": subtitle,
+                "category": category,
+                "nodes": []
+            }
+        })
+        return self._milestone_index[milestone_id]
     
     def update_milestone(self, milestone_id: str, title: str, subtitle: str, category: str = "") -> None:
         """마일스톤을 수정합니다.
@@ -87,13 +532,15 @@ class DataManager:
             subtitle (str): 수정할 부제목
             category (str): 수정할 카테고리 (선택사항)
         """
-        for milestone in self.data["milestones"]:
-            if milestone["id"] == milestone_id:
-                milestone["title"] = title
-                milestone["subtitle"] = subtitle
-                milestone["category"] = category
-                return
-        raise ValueError(f"마일스톤을 찾을 수 없습니다: {milestone_id}")
+        if milestone_id not in self._milestone_index:
+            raise ValueError(f"마일스톤을 찾을 수 없습니다: {milestone_id}")
+        self._commit({
+            "op": "update_milestone",
+            "id": milestone_id,
+            "title": title,
+            "subtitle": subtitle,
+            "category": category
+        })
     
     def delete_milestone(self, milestone_id: str) -> None:
         """마일스톤을 삭제합니다.
@@ -101,11 +548,11 @@ class DataManager:
         Args:
             milestone_id (str): 삭제할 마일스톤의 ID
         """
-        self.data["milestones"] = [
-            m for m in self.data["milestones"] if m["id"] != milestone_id
-        ]
+        if milestone_id not in self._milestone_index:
+            return
+        self._commit({"op": "delete_milestone", "id": milestone_id})
     
-    def add_node(self, milestone_id: str, node_data: Dict) -> Dict:
+    def add_node(self, milestone_id: str, node_data: Dict) -> Node:
         """특정 마일스톤에 노드를 추가합니다.
         
         Args:
@@ -113,17 +560,16 @@ class DataManager:
             node_data (Dict): 노드 데이터
         
         Returns:
-            Dict: 생성된 노드 데이터
+            Node: 생성된 노드 (dict처럼 읽기 가능)
         """
-        for milestone in self.data["milestones"]:
-            if milestone["id"] == milestone_id:
-                node = {
-                    "id": self._generate_id(),
-                    **node_data
-                }
-                milestone["nodes"].append(node)
-                return node
-        raise ValueError(f"마일스톤을 찾을 수 없습니다: {milestone_id}")
+        if milestone_id not in self._milestone_index:
+            raise ValueError(f"마일스톤을 찾을 수 없습니다: {milestone_id}")
+        node = {
+            "id": self._generate_id(),
+            **node_data
+        }
+        self._commit({"op": "add_node", "milestone_id": milestone_id, "node": node})
+        return self._node_index[node["id"]][1]
     
     def update_node(self, milestone_id: str, node_id: str, node_data: Dict) -> None:
         """노드를 수정합니다.
@@ -133,13 +579,20 @@ class DataManager:
             node_id (str): 노드 ID
             node_data (Dict): 수정할 노드 데이터
         """
-        for milestone in self.data["milestones"]:
-            if milestone["id"] == milestone_id:
-                for i, node in enumerate(milestone["nodes"]):
-                    if node["id"] == node_id:
-                        milestone["nodes"][i] = {"id": node_id, **node_data}
-                        return
-        raise ValueError(f"노드를 찾을 수 없습니다: {node_id}")
+        entry = self._find_node_entry(milestone_id, node_id)
+        if entry is None:
+            raise ValueError(f"노드를 찾을 수 없습니다: {node_id}")
+        # 바뀌지 않은 값은 이전 노드의 객체를 그대로 써서 실행 취소 기록과 공유
+        old_node = entry[1]
+        node = {"id": node_id}
+        for key, value in node_data.items():
+            old_value = old_node.get(key)
+            node[key] = old_value if old_value == value else value
+        self._commit({
+            "op": "update_node",
+            "milestone_id": milestone_id,
+            "node": node
+        })
     
     def delete_node(self, milestone_id: str, node_id: str) -> None:
         """노드를 삭제합니다.
@@ -148,20 +601,485 @@ class DataManager:
             milestone_id (str): 마일스톤 ID
             node_id (str): 삭제할 노드 ID
         """
-        for milestone in self.data["milestones"]:
-            if milestone["id"] == milestone_id:
-                milestone["nodes"] = [
-                    n for n in milestone["nodes"] if n["id"] != node_id
-                ]
+        if self._find_node_entry(milestone_id, node_id) is None:
+            return
+        self._commit({"op": "delete_node", "milestone_id": milestone_id, "node_id": node_id})
+    
+    def subscribe(self, listener: Callable[[List[ChangeEvent]], None]) -> None:
+        """데이터 변경 알림을 받을 리스너를 등록합니다.
+        
+        Args:
+            listener (Callable): 트랜잭션이 끝날 때마다 변경 이벤트
+                (events.ChangeEvent) 리스트와 함께 한 번 호출되는 함수
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+    
+    def unsubscribe(self, listener: Callable[[List[ChangeEvent]], None]) -> None:
+        """등록한 리스너를 제거합니다."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """여러 변경을 하나의 트랜잭션으로 묶습니다.
+        
+        블록 안의 변경은 즉시 메모리에 반영되어 다음 변경이 앞선 결과를 볼 수
+        있고, 각 변경은 반영 전에 검증됩니다. 블록이 예외로 끝나면 모든 변경을
+        역방향 레코드로 되돌리고 아무것도 저장하거나 알리지 않습니다. 정상
+        종료하면 변경 레코드를 한 번에 저장 대기 목록(SQLite는 한 번의 SQL
+        트랜잭션)으로 넘기고 리스너에게 한 번만 알립니다. 중첩하면 가장
+        바깥 트랜잭션에 합쳐집니다.
+        
+        사용 예:
+            with data_manager.transaction():
+                for milestone_id in selected_ids:
+                    data_manager.delete_milestone(milestone_id)
+        """
+        if self._transaction is not None:
+            yield
+            return
+        self._transaction = []
+        try:
+            yield
+        except BaseException:
+            entries, self._transaction = self._transaction, None
+            self._rollback(entries)
+            raise
+        entries, self._transaction = self._transaction, None
+        if entries:
+            self._publish(entries)
+    
+    def _publish(self, entries: List[Tuple[Dict, Optional[Dict]]]) -> None:
+        """완료된 트랜잭션의 변경을 저장 대기 목록에 넘기고 리스너에게 알립니다."""
+        # 외부 변경은 이미 디스크에 있으므로 저장과 실행 취소 기록을 생략
+        if not self._applying_external:
+            records = [record for record, _ in entries]
+            if self.storage.writes_immediately:
+                try:
+                    with self._save_lock:
+                        self.storage.save(self.data, records)
+                        self._disk_signature = self.storage.signature()
+                except Exception:
+                    self._rollback(entries)
+                    raise
+            else:
+                self._pending.extend(records)
+            inverses = [inverse for _, inverse in entries if inverse is not None]
+            if self._history_mode == "undo":
+                self.history.push_redo(inverses)
+            elif self._history_mode == "redo":
+                self.history.push_undo(inverses)
+            else:
+                self.history.record(inverses)
+        changes = [self._event_of(record, inverse)
+                   for record, inverse in entries if inverse is not None]
+        if not changes:
+            return
+        self.version += 1
+        # 리스너가 검색하기 전에 색인부터 갱신
+        changed_ids = {change.milestone_id for change in changes
+                       if change.kind != events.KEYWORDS_CHANGED}
+        if changed_ids:
+            self.text_index.update(changed_ids, self.get_milestone)
+            self.fuzzy_index.update(changed_ids, self.get_milestone)
+            self.memo_index.update(changed_ids, self.get_milestone)
+            self.date_index.update(changed_ids, self.get_milestone)
+            self.facet_index.update(changed_ids, self.get_milestone)
+        # 바뀐 마일스톤이 없어도(키워드 목록만 변경) 보기 결과를 새 버전으로 표시
+        self.saved_views.update(changed_ids, self.get_milestone)
+        for listener in list(self._listeners):
+            listener(changes)
+    
+    def can_undo(self) -> bool:
+        """실행 취소할 변경이 있는지 여부"""
+        return self.history.can_undo()
+    
+    def can_redo(self) -> bool:
+        """다시 실행할 변경이 있는지 여부"""
+        return self.history.can_redo()
+    
+    def undo(self) -> bool:
+        """마지막 트랜잭션을 되돌립니다.
+        
+        되돌리는 변경도 일반 변경과 같이 저장되고 리스너에게 알려집니다.
+        
+        Returns:
+            bool: 되돌린 변경이 있으면 True
+        """
+        inverses = self.history.pop_undo()
+        if inverses is None:
+            return False
+        self._replay(inverses, "undo")
+        return True
+    
+    def redo(self) -> bool:
+        """마지막으로 되돌린 트랜잭션을 다시 적용합니다.
+        
+        Returns:
+            bool: 다시 적용한 변경이 있으면 True
+        """
+        records = self.history.pop_redo()
+        if records is None:
+            return False
+        self._replay(records, "redo")
+        return True
+    
+    def _replay(self, inverses: List[Dict], mode: str) -> None:
+        """기록된 역방향 레코드를 역순으로 하나의 트랜잭션으로 적용합니다.
+        
+        적용한 레코드의 역방향은 반대쪽 기록(실행 취소 ↔ 다시 실행)에 쌓입니다.
+        """
+        if self._transaction is not None:
+            raise Exception("트랜잭션 안에서는 실행 취소/다시 실행할 수 없습니다")
+        self._history_mode = mode
+        try:
+            with self.transaction():
+                for inverse in reversed(inverses):
+                    self._commit(inverse)
+        except Exception as e:
+            # 적용하지 못한 단계는 원래 기록으로 되돌려 다시 시도할 수 있게 함
+            if mode == "undo":
+                self.history.push_undo(inverses)
+            else:
+                self.history.push_redo(inverses)
+            raise Exception(f"변경을 되돌릴 수 없습니다: {str(e)}")
+        finally:
+            self._history_mode = None
+    
+    def _rollback(self, entries: List[Tuple[Dict, Optional[Dict]]]) -> None:
+        """반영한 변경들을 역순으로 되돌립니다."""
+        for _, inverse in reversed(entries):
+            if inverse is not None:
+                self._apply_record(inverse)
+    
+    def _commit(self, record: Dict) -> None:
+        """변경 레코드를 데이터에 반영합니다.
+        
+        트랜잭션 밖에서 호출되면 변경 하나짜리 트랜잭션으로 처리합니다.
+        """
+        with self.transaction():
+            inverse = self._inverse_of(record)
+            self._apply_record(record)
+            self._transaction.append((record, inverse))
+    
+    def _inverse_of(self, record: Dict) -> Optional[Dict]:
+        """레코드를 반영하기 전 상태로 되돌리는 역방향 레코드를 만듭니다.
+        
+        Args:
+            record (Dict): 반영할 변경 레코드
+        
+        Returns:
+            Optional[Dict]: 역방향 레코드 (레코드가 아무것도 바꾸지 않으면 None)
+        """
+        op = record.get("op")
+        
+        if op == "add_milestone":
+            old = self._milestone_index.get(record["milestone"]["id"])
+            if old is None:
+                return {"op": "delete_milestone", "id": record["milestone"]["id"]}
+            return {"op": "add_milestone", "milestone": snapshot_milestone(old)}
+        
+        if op in ("update_milestone", "delete_milestone", "move_milestone"):
+            old = self._milestone_index.get(record["id"])
+            if old is None:
+                return None
+            if op == "move_milestone":
+                position = self._position_of(old)
+                if position == min(record["position"], len(self.data["milestones"]) - 1):
+                    return None
+                return {"op": "move_milestone", "id": record["id"], "position": position}
+            if op == "delete_milestone":
+                # 노드를 먼저 불러 둠 (삭제 후에는 지연 로더가 저장소에서 읽을 수 없음)
+                old.get("nodes")
+                return {"op": "add_milestone", "milestone": snapshot_milestone(old),
+                        "position": self._position_of(old)}
+            # 바뀐 필드만 담음 (바뀐 것이 없으면 되돌릴 것도 없음)
+            delta = {field: old.get(field, "") for field in ("title", "subtitle", "category")
+                     if field in record and old.get(field, "") != record[field]}
+            if not delta:
+                return None
+            return {"op": "update_milestone", "id": record["id"], **delta}
+        
+        if op in ("add_node", "update_node", "delete_node"):
+            milestone_id = record["milestone_id"]
+            node_id = record["node_id"] if op == "delete_node" else record["node"]["id"]
+            entry = self._find_node_entry(milestone_id, node_id)
+            if entry is None:
+                if op == "add_node" and milestone_id in self._milestone_index:
+                    return {"op": "delete_node", "milestone_id": milestone_id, "node_id": node_id}
+                return None
+            milestone, old_node = entry
+            if op == "delete_node":
+                position = next(i for i, n in enumerate(milestone["nodes"]) if n is old_node)
+                return {"op": "add_node", "milestone_id": milestone_id,
+                        "node": old_node, "position": position}
+            # Node는 불변이므로 복사하지 않고 이전 객체를 그대로 보관
+            return {"op": "update_node", "milestone_id": milestone_id, "node": old_node}
+        
+        if op == "set_keywords":
+            return {"op": "set_keywords", "keywords": list(self.data.get("keywords", []))}
+        
+        return None
+    
+    @staticmethod
+    def _event_of(record: Dict, inverse: Dict) -> ChangeEvent:
+        """반영된 레코드와 그 역방향 레코드로 변경 이벤트를 만듭니다.
+        
+        추가 레코드는 기존 항목을 덮어쓸 수도 있으므로(멱등 적용),
+        역방향이 삭제일 때만 '추가'로, 그 외에는 '수정'으로 분류합니다.
+        """
+        op = record["op"]
+        if op == "add_milestone":
+            kind = (events.MILESTONE_ADDED if inverse["op"] == "delete_milestone"
+                    else events.MILESTONE_UPDATED)
+            return ChangeEvent(kind, record["milestone"]["id"])
+        if op in ("update_milestone", "move_milestone"):
+            return ChangeEvent(events.MILESTONE_UPDATED, record["id"])
+        if op == "delete_milestone":
+            return ChangeEvent(events.MILESTONE_REMOVED, record["id"])
+        if op == "add_node":
+            kind = events.NODE_ADDED if inverse["op"] == "delete_node" else events.NODE_UPDATED
+            return ChangeEvent(kind, record["milestone_id"], record["node"]["id"])
+        if op == "update_node":
+            return ChangeEvent(events.NODE_UPDATED, record["milestone_id"], record["node"]["id"])
+        if op == "delete_node":
+            return ChangeEvent(events.NODE_REMOVED, record["milestone_id"], record["node_id"])
+        return ChangeEvent(events.KEYWORDS_CHANGED)
+    
+    def _apply_record(self, record: Dict) -> None:
+        """변경 레코드 하나를 데이터와 인덱스에 반영합니다.
+        
+        저널 재적용 시에도 사용되므로, 같은 레코드를 두 번 적용해도
+        결과가 같도록(멱등) 처리합니다.
+        
+        Args:
+            record (Dict): 변경 레코드
+        """
+        op = record.get("op")
+        milestones = self.data["milestones"]
+        
+        if op == "add_milestone":
+            # 레코드는 저널에 그대로 남으므로 복사본을 데이터로 사용
+            source = record["milestone"]
+            milestone = {**source, "nodes": list(source.get("nodes", []))}
+            old = self._milestone_index.get(milestone["id"])
+            if old is not None:
+                position = self._position_of(old)
+                self._unindex_milestone(old)
+                milestones[position] = milestone
+            elif "position" in record:
+                position = min(record["position"], len(milestones))
+                milestones.insert(position, milestone)
+                self._invalidate_positions(position)
+            else:
+                position = len(milestones)
+                milestones.append(milestone)
+            self._index_milestone(milestone)
+            if position < self._position_stale_from:
+                self._positions[milestone["id"]] = position
+            elif position == self._position_stale_from == len(milestones) - 1:
+                self._positions[milestone["id"]] = position
+                self._position_stale_from += 1
+        
+        elif op == "update_milestone":
+            milestone = self._milestone_index.get(record["id"])
+            if milestone is not None:
+                # 레코드에 있는 필드만 반영 (역방향 레코드는 바뀐 필드만 가짐)
+                for field in ("title", "subtitle", "category"):
+                    if field in record:
+                        milestone[field] = record[field]
+        
+        elif op == "move_milestone":
+            # 리스트에서 뺀 뒤 position 자리에 다시 넣음 (노드와 인덱스는 그대로)
+            milestone = self._milestone_index.get(record["id"])
+            if milestone is not None:
+                old_position = self._position_of(milestone)
+                del milestones[old_position]
+                position = min(record["position"], len(milestones))
+                milestones.insert(position, milestone)
+                self._invalidate_positions(min(old_position, position))
+        
+        elif op == "delete_milestone":
+            milestone = self._milestone_index.get(record["id"])
+            if milestone is not None:
+                position = self._position_of(milestone)
+                self._unindex_milestone(milestone)
+                del milestones[position]
+                self._positions.pop(record["id"], None)
+                self._invalidate_positions(position)
+        
+        elif op in ("add_node", "update_node"):
+            milestone = self._milestone_index.get(record["milestone_id"])
+            if milestone is None:
+                return
+            nodes = milestone["nodes"]  # 지연 로드된 노드를 먼저 인덱싱
+            node = Node.from_dict(record["node"])
+            entry = self._node_index.get(node["id"])
+            if entry is not None and entry[0] is milestone:
+                for i, n in enumerate(nodes):
+                    if n is entry[1]:
+                        nodes[i] = node
+                        break
+            elif op == "add_node":
+                if "position" in record:
+                    nodes.insert(record["position"], node)
+                else:
+                    nodes.append(node)
+            else:
+                return
+            self._node_index[node["id"]] = (milestone, node)
+        
+        elif op == "delete_node":
+            if self._find_node_entry(record["milestone_id"], record["node_id"]) is None:
                 return
+            entry = self._node_index.pop(record["node_id"])
+            if entry is not None:
+                milestone, old_node = entry
+                milestone["nodes"] = [n for n in milestone["nodes"] if n is not old_node]
+        
+        elif op == "set_keywords":
+            self.data["keywords"] = list(record.get("keywords", []))
+    
+    def _position_of(self, milestone: Dict) -> int:
+        """마일스톤 리스트에서 객체의 위치를 찾습니다.
+        
+        위치 맵(_positions)으로 찾고, 삽입/삭제로 밀린 구간은 처음 조회할 때
+        그 구간만 다시 계산합니다.
+        """
+        milestones = self.data["milestones"]
+        milestone_id = milestone.get("id")
+        position = self._positions.get(milestone_id)
+        if position is None or position >= self._position_stale_from:
+            self._refresh_positions(self._position_stale_from)
+            position = self._positions.get(milestone_id)
+        if position is None or position >= len(milestones) or milestones[position] is not milestone:
+            # 리스트가 맵 밖에서 바뀐 경우 - 전체를 다시 계산
+            self._refresh_positions(0)
+            position = self._positions.get(milestone_id)
+            if position is None or milestones[position] is not milestone:
+                raise ValueError(f"마일스톤을 찾을 수 없습니다: {milestone_id}")
+        return position
+    
+    def _refresh_positions(self, start: int) -> None:
+        """start 이후 마일스톤들의 위치를 다시 계산합니다."""
+        milestones = self.data["milestones"]
+        positions = self._positions
+        for i in range(start, len(milestones)):
+            positions[milestones[i]["id"]] = i
+        self._position_stale_from = len(milestones)
+    
+    def _invalidate_positions(self, start: int) -> None:
+        """삽입/삭제로 start 이후 위치가 밀렸음을 표시합니다."""
+        self._position_stale_from = min(self._position_stale_from, start)
+    
+    def _find_node_entry(self, milestone_id: str, node_id: str) -> Optional[Tuple[Dict, Dict]]:
+        """마일스톤에 속한 노드의 인덱스 항목을 찾습니다 (필요 시 노드 로드)."""
+        milestone = self._milestone_index.get(milestone_id)
+        if milestone is None:
+            return None
+        milestone.get("nodes")  # 지연 로드 시 on_load 콜백이 노드를 인덱싱
+        entry = self._node_index.get(node_id)
+        if entry is None or entry[0] is not milestone:
+            return None
+        return entry
+    
+    def _index_milestone(self, milestone: Dict) -> None:
+        """마일스톤과 소속 노드들을 인덱스에 등록합니다.
+        
+        노드가 아직 로드되지 않은 마일스톤은 로드 시점에 노드를 등록합니다.
+        이미 다른 마일스톤이 쓰는 ID면 새 ID로 고칩니다.
+        """
+        milestone_id = milestone["id"]
+        existing = self._milestone_index.get(milestone_id)
+        if existing is not None and existing is not milestone:
+            milestone_id = milestone["id"] = self._repair_id()
+        else:
+            self._id_allocator.observe(milestone_id)
+        self._milestone_index[milestone_id] = milestone
+        if isinstance(milestone, LazyMilestone) and not milestone.is_loaded:
+            milestone.set_on_load(self._index_nodes)
+            return
+        self._index_nodes(milestone)
+    
+    def _index_nodes(self, milestone: Dict) -> None:
+        """마일스톤의 노드들을 Node 객체로 바꾸고 노드 인덱스에 등록합니다.
+        
+        이미 다른 노드가 쓰는 ID면 새 ID로 고칩니다.
+        """
+        nodes = milestone.get("nodes", [])
+        node_index = self._node_index
+        observe = self._id_allocator.observe
+        for i, node in enumerate(nodes):
+            if not isinstance(node, Node):
+                node = nodes[i] = Node(node)
+            entry = node_index.get(node["id"])
+            if entry is not None and entry[1] is not node:
+                node = nodes[i] = Node({**node.to_dict(), "id": self._repair_id()})
+            else:
+                observe(node["id"])
+            node_index[node["id"]] = (milestone, node)
+    
+    def _unindex_milestone(self, milestone: Dict) -> None:
+        """마일스톤과 소속 노드들을 인덱스에서 제거합니다."""
+        self._milestone_index.pop(milestone.get("id"), None)
+        if isinstance(milestone, LazyMilestone):
+            if not milestone.is_loaded:
+                milestone.set_on_load(None)
+                return
+        for node in milestone.get("nodes", []):
+            self._node_index.pop(node.get("id"), None)
+    
+    def _reset_search_indexes(self, loaded: bool) -> None:
+        """검색 색인을 현재 데이터 기준으로 다시 만듭니다.
+        
+        Args:
+            loaded (bool): 데이터를 저장소에서 막 불러왔는지 여부
+                (저장된 메모 색인은 불러온 파일 상태와 같을 때만 재사용)
+        """
+        self.text_index.reset(self.get_milestones)
+        self.fuzzy_index.reset(self.get_milestones)
+        self.date_index.reset(self.get_milestones)
+        self.facet_index.reset(self.get_milestones)
+        self.memo_index.reset(self.get_milestones, self.filename + MEMO_INDEX_SUFFIX,
+                              self._disk_signature if loaded else None)
+        self.saved_views.reset(self.filename + VIEWS_SUFFIX, self)
+    
+    def _rebuild_index(self) -> None:
+        """마일스톤/노드 ID 인덱스를 전체 데이터로부터 다시 구성합니다."""
+        self._milestone_index = {}
+        self._node_index = {}
+        self._positions = {}
+        self._position_stale_from = 0
+        for milestone in self.data.get("milestones", []):
+            self._index_milestone(milestone)
     
     def _generate_id(self) -> str:
         """유니크 ID를 생성합니다.
         
         Returns:
-            str: 타임스탬프 기반 ID
+            str: 단조 증가하는 타임스탬프 기반 ID (ids.IdAllocator)
         """
-        return str(int(datetime.now().timestamp() * 1000000))
+        return self._id_allocator.next_id()
+    
+    def _repair_id(self) -> str:
+        """중복 ID를 대체할 새 ID를 발급하고 전체 재기록을 예약합니다."""
+        self._needs_compact = True
+        return self._id_allocator.next_id()
+    
+    def reserve_ids(self, count: int) -> List[str]:
+        """일괄 가져오기용 ID 블록을 예약합니다.
+        
+        예약한 ID는 add_milestone(milestone_id=...)이나 add_node의 노드
+        데이터 "id"로 넘겨 사용합니다.
+        
+        Args:
+            count (int): 예약할 ID 개수
+        
+        Returns:
+            List[str]: 다른 ID와 겹치지 않는 오름차순 ID 리스트
+        """
+        return self._id_allocator.reserve(count)
     
     def get_keywords(self) -> List[str]:
         """모든 키워드 목록을 반환합니다.
@@ -177,10 +1095,9 @@ class DataManager:
         Args:
             keyword (str): 추가할 키워드
         """
-        if "keywords" not in self.data:
-            self.data["keywords"] = []
-        if keyword and keyword not in self.data["keywords"]:
-            self.data["keywords"].append(keyword)
+        keywords = self.data.get("keywords", [])
+        if keyword and keyword not in keywords:
+            self._commit({"op": "set_keywords", "keywords": keywords + [keyword]})
     
     def delete_keywords(self, keywords: List[str]) -> None:
         """선택된 키워드들을 삭제합니다.
@@ -188,8 +1105,14 @@ class DataManager:
         Args:
             keywords (List[str]): 삭제할 키워드 리스트
         """
-        if "keywords" not in self.data:
-            self.data["keywords"] = []
-        self.data["keywords"] = [
-            k for k in self.data["keywords"] if k not in keywords
-        ]
+        current = self.data.get("keywords", [])
+        remaining = [k for k in current if k not in keywords]
+        if len(remaining) != len(current):
+            self._commit({"op": "set_keywords", "keywords": remaining})
+
+
+def snapshot_milestone(milestone: Dict) -> Dict:
+    """마일스톤을 노드 리스트까지 얕게 복사합니다 (지연 로드 상태는 유지)."""
+    if isinstance(milestone, LazyMilestone):
+        return milestone.snapshot()
+    return {**milestone, "nodes": list(milestone.get("nodes", []))}
@@ -0,0 +1,166 @@
+"""날짜 색인 모듈 - 월/분기/기간으로 노드와 마일스톤을 찾는 색인
+
+노드 날짜(YY.MM, YY.Qn)를 월 서수 구간으로 바꿔 두 가지 형태로 유지합니다.
+
+- 월 버킷: 월 서수 → 그 달을 포함하는 노드 ID 집합과 마일스톤별 노드 수.
+  분기 노드는 세 달 모두에 들어갑니다. "이번달"이나 "24.Q3"은 버킷 한두 개만
+  읽으므로 일치하는 노드 수에 비례한 시간에 찾습니다.
+- 정렬된 시작 월 배열: (시작 월 서수, 노드 ID)를 정렬해 두고 bisect로 임의의
+  기간과 겹치는 노드를 찾습니다. 노드 기간은 최대 3개월이므로 시작 월이
+  [기간 시작 - 2, 기간 끝]인 노드만 확인하면 됩니다.
+
+DataManager가 트랜잭션마다 바뀐 마일스톤만 다시 색인합니다. 노드 날짜를
+모두 읽어야 하므로 처음 조회할 때 만듭니다.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from dates import ParsedDate
+from models import node_date
+
+# 노드 하나가 차지하는 최대 개월 수 (분기)
+_MAX_SPAN = 3
+
+
+class DateIndex:
+    """월 버킷 + 정렬된 시작 월 배열로 된 노드 날짜 색인"""
+
+    def __init__(self):
+        self._spans: Dict[str, Tuple[ParsedDate, str]] = {}  # 노드 ID → (날짜, 마일스톤 ID)
+        self._by_milestone: Dict[str, List[str]] = {}
+        self._month_nodes: Dict[int, Set[str]] = {}
+        self._month_milestones: Dict[int, Counter] = {}
+        self._starts: List[Tuple[int, str]] = []
+        self._milestones: Callable[[], Iterable[Dict]] = lambda: ()
+        self._built = False
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    def reset(self, milestones: Callable[[], Iterable[Dict]]) -> None:
+        """색인을 비우고 다음 조회 때 전체 데이터로 다시 만들도록 합니다.
+
+        Args:
+            milestones (Callable): 현재 마일스톤 목록을 반환하는 함수
+        """
+        self.__init__()
+        self._milestones = milestones
+
+    def update(self, milestone_ids: Iterable[str],
+               get_milestone: Callable[[str], Optional[Dict]]) -> None:
+        """바뀐 마일스톤의 노드만 다시 색인합니다 (색인을 만들기 전이면 무시).
+
+        Args:
+            milestone_ids (Iterable[str]): 바뀐 마일스톤 ID
+            get_milestone (Callable): ID로 현재 마일스톤을 찾는 함수
+        """
+        if not self._built:
+            return
+        # 노드가 다른 마일스톤으로 옮겨졌을 수 있으므로 모두 제거한 뒤 다시 추가
+        milestone_ids = list(milestone_ids)
+        for milestone_id in milestone_ids:
+            self._remove_milestone(milestone_id)
+        for milestone_id in milestone_ids:
+            milestone = get_milestone(milestone_id)
+            if milestone is not None:
+                self._add_milestone(milestone)
+
+    def node_ids_in_month(self, ordinal: int) -> Set[str]:
+        """그 달을 포함하는 날짜의 노드 ID 집합 (분기 노드 포함)"""
+        self._ensure_built()
+        return set(self._month_nodes.get(ordinal, ()))
+
+    def milestone_ids_in_month(self, ordinal: int) -> Set[str]:
+        """그 달을 포함하는 날짜의 노드를 가진 마일스톤 ID 집합"""
+        self._ensure_built()
+        return set(self._month_milestones.get(ordinal, ()))
+
+    def node_ids_in_range(self, first: int, last: int) -> Set[str]:
+        """월 범위 [first, last]와 겹치는 날짜의 노드 ID 집합
+
+        Args:
+            first (int): 시작 월 서수
+            last (int): 끝 월 서수
+
+        Returns:
+            Set[str]: 노드 ID 집합
+        """
+        self._ensure_built()
+        if last - first < _MAX_SPAN:
+            # 짧은 기간(이번달, 분기)은 월 버킷의 합집합
+            result: Set[str] = set()
+            for ordinal in range(first, last + 1):
+                result.update(self._month_nodes.get(ordinal, ()))
+            return result
+        starts = self._starts
+        low = bisect_left(starts, (first - _MAX_SPAN + 1,))
+        high = bisect_right(starts, (last, "\U0010ffff"))
+        spans = self._spans
+        return {node_id for start, node_id in starts[low:high]
+                if start >= first or spans[node_id][0].last >= first}
+
+    def milestone_ids_in_range(self, first: int, last: int) -> Set[str]:
+        """월 범위 [first, last]와 겹치는 날짜의 노드를 가진 마일스톤 ID 집합"""
+        self._ensure_built()
+        if last - first < _MAX_SPAN:
+            result: Set[str] = set()
+            for ordinal in range(first, last + 1):
+                result.update(self._month_milestones.get(ordinal, ()))
+            return result
+        spans = self._spans
+        return {spans[node_id][1] for node_id in self.node_ids_in_range(first, last)}
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        for milestone in self._milestones():
+            self._add_milestone(milestone, sort=False)
+        self._starts.sort()
+        self._built = True
+
+    def _add_milestone(self, milestone: Dict, sort: bool = True) -> None:
+        milestone_id = milestone["id"]
+        node_ids = []
+        for node in milestone.get("nodes", []):
+            parsed = node_date(node)
+            if parsed is None:
+                continue
+            node_id = node["id"]
+            self._spans[node_id] = (parsed, milestone_id)
+            for ordinal in _months(parsed):
+                self._month_nodes.setdefault(ordinal, set()).add(node_id)
+                self._month_milestones.setdefault(ordinal, Counter())[milestone_id] += 1
+            if sort:
+                insort(self._starts, (parsed.ordinal, node_id))
+            else:
+                self._starts.append((parsed.ordinal, node_id))
+            node_ids.append(node_id)
+        if node_ids:
+            self._by_milestone[milestone_id] = node_ids
+
+    def _remove_milestone(self, milestone_id: str) -> None:
+        for node_id in self._by_milestone.pop(milestone_id, ()):
+            parsed, _ = self._spans.pop(node_id)
+            for ordinal in _months(parsed):
+                nodes = self._month_nodes[ordinal]
+                nodes.discard(node_id)
+                if not nodes:
+                    del self._month_nodes[ordinal]
+                counts = self._month_milestones[ordinal]
+                counts[milestone_id] -= 1
+                if counts[milestone_id] <= 0:
+                    del counts[milestone_id]
+                    if not counts:
+                        del self._month_milestones[ordinal]
+            key = (parsed.ordinal, node_id)
+            position = bisect_left(self._starts, key)
+            if position < len(self._starts) and self._starts[position] == key:
+                del self._starts[position]
+
+
+def _months(parsed: ParsedDate) -> range:
+    """날짜가 차지하는 월 서수들"""
+    return range(parsed.ordinal, parsed.last + 1)
@@ -0,0 +1,147 @@
+"""날짜 모듈 - YY.MM / YY.Qn 노드 날짜의 파싱, 검증, 비교
+
+노드 날짜는 불러오거나 수정할 때 한 번만 ParsedDate(월 서수 + 단위)로
+해석하고, 필터/타임라인 배치/위젯은 해석된 값을 비교만 합니다.
+월 서수는 연도(두 자리)*12 + 월-1 입니다. 같은 문자열은 캐시를 통해
+같은 ParsedDate 객체를 공유합니다.
+"""
+
+import re
+from datetime import datetime
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+# 날짜 단위
+MONTH = 0
+QUARTER = 1
+
+# 입력 검증용 형식 (예: 24.10, 24.1, 24.Q1)
+_VALID_DATE = re.compile(r'^\d{2}\.(?:Q[1-4]|0[1-9]|1[0-2]|[1-9])$')
+
+# 캐시 최대 항목 수 (날짜 문자열의 종류는 많지 않음)
+_CACHE_LIMIT = 65536
+
+
+class ParsedDate(NamedTuple):
+    """해석된 노드 날짜"""
+
+    ordinal: int  # 시작 월 서수
+    granularity: int  # MONTH 또는 QUARTER
+
+    @property
+    def last(self) -> int:
+        """마지막 월 서수 (분기는 세 번째 달)"""
+        return self.ordinal + 2 if self.granularity == QUARTER else self.ordinal
+
+    @property
+    def year(self) -> int:
+        """두 자리 연도"""
+        return self.ordinal // 12
+
+    @property
+    def month(self) -> int:
+        """시작 월 (1~12)"""
+        return self.ordinal % 12 + 1
+
+    @property
+    def quarter(self) -> int:
+        """분기 (1~4)"""
+        return (self.ordinal % 12) // 3 + 1
+
+    @property
+    def timeline_month(self) -> int:
+        """타임라인에 배치할 월 (분기는 마지막 달: Q1=3월, Q2=6월 ...)"""
+        return self.last % 12 + 1
+
+    def contains(self, ordinal: int) -> bool:
+        """월 서수가 이 날짜의 기간 안에 있는지 확인합니다."""
+        return self.ordinal <= ordinal <= self.last
+
+    def overlaps(self, first: int, last: int) -> bool:
+        """월 범위 [first, last]와 겹치는지 확인합니다."""
+        return self.ordinal <= last and self.last >= first
+
+
+_CACHE: Dict[str, Optional[ParsedDate]] = {}
+
+
+def parse_date(date_str: str) -> Optional[ParsedDate]:
+    """노드 날짜 문자열을 해석합니다 (결과는 캐시됨).
+
+    저장된 데이터와의 호환을 위해 공백, 소문자 q, 점이 없는 분기(24Q1)도
+    허용합니다. 새로 입력하는 날짜는 is_valid_date()로 검증합니다.
+
+    Args:
+        date_str (str): YY.MM 또는 YY.Qn 형식의 날짜
+
+    Returns:
+        Optional[ParsedDate]: 해석된 날짜, 해석할 수 없으면 None
+    """
+    try:
+        return _CACHE[date_str]
+    except KeyError:
+        pass
+    parsed = _parse(date_str)
+    if len(_CACHE) < _CACHE_LIMIT:
+        _CACHE[date_str] = parsed
+    return parsed
+
+
+def _parse(date_str: str) -> Optional[ParsedDate]:
+    date_str = date_str.strip().upper()
+    try:
+        if "Q" in date_str:
+            parts = date_str.split("Q")
+            if len(parts) != 2:
+                return None
+            year = int(parts[0].replace(".", "").strip())
+            quarter = int(parts[1].strip())
+            if not 1 <= quarter <= 4:
+                return None
+            return ParsedDate(year * 12 + (quarter - 1) * 3, QUARTER)
+        parts = date_str.split(".")
+        if len(parts) != 2:
+            return None
+        year = int(parts[0].strip())
+        month = int(parts[1].strip())
+        if not 1 <= month <= 12:
+            return None
+        return ParsedDate(month_ordinal(year, month), MONTH)
+    except ValueError:
+        return None
+
+
+def is_valid_date(date_str: str) -> bool:
+    """입력된 날짜가 YY.MM 또는 YY.Qn 형식인지 검증합니다.
+
+    Args:
+        date_str (str): 검증할 날짜 문자열
+
+    Returns:
+        bool: 형식이 올바르면 True
+    """
+    return _VALID_DATE.match(date_str.strip().upper()) is not None
+
+
+def month_span(date_str: str) -> Optional[Tuple[int, int]]:
+    """노드 날짜가 차지하는 월 범위를 반환합니다.
+
+    Args:
+        date_str (str): YY.MM 또는 YY.Qn 형식의 날짜
+
+    Returns:
+        Optional[Tuple[int, int]]: (시작 월 서수, 끝 월 서수), 해석할 수 없으면 None
+    """
+    parsed = parse_date(date_str)
+    return (parsed.ordinal, parsed.last) if parsed is not None else None
+
+
+def month_ordinal(year: int, month: int) -> int:
+    """두 자리 연도와 월(1~12)을 월 서수로 변환합니다."""
+    return year * 12 + month - 1
+
+
+def current_month_ordinal() -> int:
+    """이번 달의 월 서수를 반환합니다."""
+    today = datetime.now()
+    return month_ordinal(today.year % 100, today.month)
@@ -0,0 +1,198 @@
+"""데이터 비교 모듈 - 두 데이터의 차이를 변경 레코드로 계산
+
+마일스톤과 노드를 ID로 색인(해시 조인)해 비교하고, 현재 데이터를 목표
+데이터로 바꾸는 변경 레코드(journal.py 형식) 리스트를 만듭니다. 레코드를
+순서대로 적용하면 마일스톤과 노드의 순서까지 목표와 같아집니다.
+순서가 바뀐 경우에는 상대 순서를 유지하는 가장 긴 마일스톤 열(LIS)은 그대로
+두고, 나머지 마일스톤만 move_milestone 레코드로 옮깁니다.
+파싱하지 않은 마일스톤은 노드 배열의 원본 바이트가 같으면 노드를
+비교하지 않습니다.
+"""
+
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from json_stream import LazyMilestone
+
+
+MILESTONE_FIELDS = ("title", "subtitle", "category")
+
+
+def diff_data(current: Dict, target: Dict) -> List[Dict]:
+    """현재 데이터를 목표 데이터로 바꾸는 변경 레코드를 계산합니다.
+
+    Args:
+        current (Dict): 현재(메모리) 데이터
+        target (Dict): 목표(디스크 등) 데이터
+
+    Returns:
+        List[Dict]: 순서대로 적용할 변경 레코드 (같으면 빈 리스트)
+    """
+    records: List[Dict] = []
+    # 노드 삭제는 맨 앞에 모음 - 다른 마일스톤으로 옮겨진 노드가 추가될 때 ID가 겹치지 않도록
+    node_deletes: List[Dict] = []
+    current_milestones = current.get("milestones", [])
+    target_milestones = target.get("milestones", [])
+    current_index = {m["id"]: m for m in current_milestones}
+    target_ids = {m["id"] for m in target_milestones}
+
+    for milestone in current_milestones:
+        if milestone["id"] not in target_ids:
+            records.append({"op": "delete_milestone", "id": milestone["id"]})
+
+    # 삭제 후 남은 마일스톤 순서 - 추가/이동 위치를 계산하기 위해 레코드 적용을 따라감
+    order = [m["id"] for m in current_milestones if m["id"] in target_ids]
+    positions = {milestone_id: i for i, milestone_id in enumerate(order)}
+    stay = _longest_ordered(positions[m["id"]] for m in target_milestones if m["id"] in positions)
+    stay_ids = {order[i] for i in stay}
+    previous_id = None
+    for index, milestone in enumerate(target_milestones):
+        milestone_id = milestone["id"]
+        old = current_index.get(milestone_id)
+        if old is None or milestone_id not in stay_ids:
+            # 새 마일스톤과 순서가 바뀐 마일스톤은 목표 순서의 바로 앞 마일스톤 뒤에 둠
+            if old is not None:
+                order.remove(milestone_id)
+            position = _position_after(order, previous_id, index)
+            order.insert(position, milestone_id)
+            if old is None:
+                records.append({"op": "add_milestone", "milestone": milestone, "position": position})
+            else:
+                records.append({"op": "move_milestone", "id": milestone_id, "position": position})
+        if old is not None:
+            for record in diff_milestone(old, milestone):
+                (node_deletes if record["op"] == "delete_node" else records).append(record)
+        previous_id = milestone_id
+
+    if list(current.get("keywords", [])) != list(target.get("keywords", [])):
+        records.append({"op": "set_keywords", "keywords": list(target.get("keywords", []))})
+    return node_deletes + records
+
+
+def _longest_ordered(values: Iterable[int]) -> Set[int]:
+    """값들 중 순서대로 증가하는 가장 긴 부분열(LIS)의 값 집합 (O(n log n))"""
+    values = list(values)
+    tails: List[int] = []  # 길이별 부분열의 마지막 값 위치
+    tail_values: List[int] = []
+    previous: List[int] = [-1] * len(values)
+    for i, value in enumerate(values):
+        length = bisect_left(tail_values, value)
+        if length > 0:
+            previous[i] = tails[length - 1]
+        if length == len(tails):
+            tails.append(i)
+            tail_values.append(value)
+        else:
+            tails[length] = i
+            tail_values[length] = value
+    result = set()
+    i = tails[-1] if tails else -1
+    while i >= 0:
+        result.add(values[i])
+        i = previous[i]
+    return result
+
+
+def _position_after(order: Sequence[str], previous_id: Optional[str], index: int) -> int:
+    """order에서 previous_id 바로 뒤 위치 (없으면 맨 앞)"""
+    if previous_id is None:
+        return 0
+    if 0 < index <= len(order) and order[index - 1] == previous_id:
+        return index  # 앞부분이 목표와 같으면 목표 위치 그대로
+    return order.index(previous_id) + 1
+
+
+def diff_milestone(current: Dict, target: Dict) -> List[Dict]:
+    """같은 ID의 마일스톤 두 개를 비교합니다.
+
+    Args:
+        current (Dict): 현재 마일스톤
+        target (Dict): 목표 마일스톤
+
+    Returns:
+        List[Dict]: 변경 레코드 (헤더 필드 차이 + 노드 단위 차이)
+    """
+    milestone_id = current["id"]
+    if _extra_header(current) != _extra_header(target):
+        # 알 수 없는 헤더 필드가 바뀌면 마일스톤 전체를 교체
+        return [{"op": "add_milestone", "milestone": target}]
+
+    records: List[Dict] = []
+    fields = {field: target.get(field, "") for field in MILESTONE_FIELDS
+              if current.get(field, "") != target.get(field, "")}
+    if fields:
+        records.append({"op": "update_milestone", "id": milestone_id, **fields})
+
+    if _same_raw_nodes(current, target):
+        return records
+    node_records = diff_nodes(milestone_id, current.get("nodes", []), target.get("nodes", []))
+    if node_records is None:
+        # 노드 순서가 바뀌었으면 마일스톤 전체를 교체
+        return [{"op": "add_milestone", "milestone": target}]
+    records.extend(node_records)
+    return records
+
+
+def diff_nodes(milestone_id: str, current: List[Mapping], target: List[Mapping]) -> Optional[List[Dict]]:
+    """같은 마일스톤의 노드 리스트를 ID로 비교합니다.
+
+    Args:
+        milestone_id (str): 마일스톤 ID
+        current (List[Mapping]): 현재 노드 리스트
+        target (List[Mapping]): 목표 노드 리스트
+
+    Returns:
+        Optional[List[Dict]]: 노드 변경 레코드 (공통 노드의 순서가 다르면 None)
+    """
+    current_index = {node["id"]: node for node in current}
+    target_ids = {node["id"] for node in target}
+    if ([nid for nid in current_index if nid in target_ids]
+            != [node["id"] for node in target if node["id"] in current_index]):
+        return None
+
+    records: List[Dict] = []
+    for node in current:
+        if node["id"] not in target_ids:
+            records.append({"op": "delete_node", "milestone_id": milestone_id, "node_id": node["id"]})
+    for position, node in enumerate(target):
+        old = current_index.get(node["id"])
+        if old is None:
+            records.append({"op": "add_node", "milestone_id": milestone_id,
+                            "node": node, "position": position})
+        elif not _same_node(old, node):
+            records.append({"op": "update_node", "milestone_id": milestone_id, "node": node})
+    return records
+
+
+def changed_milestone_ids(records: Iterable[Dict]) -> set:
+    """변경 레코드가 건드리는 마일스톤 ID 집합을 반환합니다."""
+    ids = set()
+    for record in records:
+        op = record.get("op")
+        if op == "add_milestone":
+            ids.add(record["milestone"]["id"])
+        elif op in ("update_milestone", "delete_milestone", "move_milestone"):
+            ids.add(record["id"])
+        elif "milestone_id" in record:
+            ids.add(record["milestone_id"])
+    return ids
+
+
+def _extra_header(milestone: Dict) -> Dict:
+    """제목/부제목/카테고리/노드를 제외한 헤더 필드 (노드는 불러오지 않음)"""
+    return {k: v for k, v in dict.items(milestone)
+            if k not in MILESTONE_FIELDS and k not in ("id", "nodes")}
+
+
+def _same_raw_nodes(current: Dict, target: Dict) -> bool:
+    """두 마일스톤 모두 노드를 파싱하지 않았고 원본 바이트가 같은지 확인합니다."""
+    if not (isinstance(current, LazyMilestone) and isinstance(target, LazyMilestone)):
+        return False
+    raw = current.raw_nodes()
+    return raw is not None and raw == target.raw_nodes()
+
+
+def _same_node(a: Mapping, b: Mapping) -> bool:
+    """두 노드의 필드가 모두 같은지 확인합니다 (Node와 dict 비교 가능)."""
+    return len(a) == len(b) and all(key in b and b[key] == value for key, value in a.items())
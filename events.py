@@ -0,0 +1,28 @@
+"""변경 이벤트 모듈 - DataManager가 리스너에게 알리는 변경 종류
+
+트랜잭션이 끝나면 DataManager는 반영된 변경마다 ChangeEvent 하나를 만들어
+리스너에게 리스트로 전달합니다. 위젯은 이벤트의 ID로 바뀐 항목만 다시 그립니다.
+"""
+
+from typing import NamedTuple
+
+
+# 이벤트 종류
+MILESTONE_ADDED = "milestone_added"
+MILESTONE_UPDATED = "milestone_updated"
+MILESTONE_REMOVED = "milestone_removed"
+NODE_ADDED = "node_added"
+NODE_UPDATED = "node_updated"
+NODE_REMOVED = "node_removed"
+KEYWORDS_CHANGED = "keywords_changed"
+
+MILESTONE_EVENTS = frozenset((MILESTONE_ADDED, MILESTONE_UPDATED, MILESTONE_REMOVED))
+NODE_EVENTS = frozenset((NODE_ADDED, NODE_UPDATED, NODE_REMOVED))
+
+
+class ChangeEvent(NamedTuple):
+    """반영된 변경 하나"""
+
+    kind: str  # 이벤트 종류 (위 상수 중 하나)
+    milestone_id: str = ""  # 마일스톤/노드 이벤트의 마일스톤 ID
+    node_id: str = ""  # 노드 이벤트의 노드 ID
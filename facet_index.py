@@ -0,0 +1,226 @@
+"""패싯 색인 모듈 - 모양/색상/연도/분기/카테고리/키워드별 마일스톤 비트셋
+
+마일스톤마다 비트 위치(슬롯)를 하나씩 주고, 패싯 값마다 그 값을 가진
+마일스톤의 비트를 정수 하나(비트셋)에 모아 둡니다. 여러 필터를 함께 걸면
+비트셋의 AND 한 번으로 결합되고, 결과를 마일스톤 ID로 바꾸는 것은 마지막에
+한 번만 합니다.
+
+- 노드 패싯: 모양(shape), 색상(color), 연도(year), 분기(quarter). 노드 하나라도
+  그 값을 가지면 마일스톤 비트가 켜지며, 값별 노드 수도 함께 셉니다
+  ("■ 124개 노드 - 25.Q2"처럼 다이얼로그에 표시).
+- 마일스톤 패싯: 카테고리(category).
+- 키워드: 제목/부제목에 키워드가 포함된 마일스톤. 조회한 키워드만 비트셋을
+  만들어 두고(최근 것 KEYWORD_CACHE_LIMIT개) 이후 바뀐 마일스톤만 다시 확인합니다.
+
+DataManager가 트랜잭션마다 바뀐 마일스톤만 다시 색인합니다. 노드를 모두
+읽어야 하므로 처음 조회할 때 만듭니다.
+"""
+
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from models import node_date
+from text_index import normalize
+
+# 패싯 이름
+SHAPE = "shape"
+COLOR = "color"
+YEAR = "year"
+QUARTER = "quarter"
+CATEGORY = "category"
+
+# 비트셋을 유지할 키워드 수
+KEYWORD_CACHE_LIMIT = 64
+
+FacetKey = Tuple[str, Hashable]
+
+
+def node_facets(node: Dict) -> List[FacetKey]:
+    """노드가 속한 패싯 키 리스트 (분기 값은 (연도, 분기))"""
+    facets = [(SHAPE, node.get("shape", "")), (COLOR, node.get("color", ""))]
+    parsed = node_date(node)
+    if parsed is not None:
+        facets.append((YEAR, parsed.year))
+        facets.append((QUARTER, (parsed.year, parsed.quarter)))
+    return facets
+
+
+class FacetIndex:
+    """마일스톤 슬롯 비트셋으로 된 패싯 색인"""
+
+    def __init__(self):
+        self._slots: Dict[str, int] = {}  # 마일스톤 ID → 비트 위치
+        self._slot_ids: List[Optional[str]] = []
+        self._free_slots: List[int] = []
+        self._bits: Dict[FacetKey, int] = {}
+        self._node_counts: Counter = Counter()
+        self._facets: Dict[str, Counter] = {}  # 마일스톤 ID → 패싯 키별 노드 수
+        self._headings: Dict[str, str] = {}  # 마일스톤 ID → 정규화된 제목/부제목
+        self._keywords: "OrderedDict[str, int]" = OrderedDict()
+        self._milestones: Callable[[], Iterable[Dict]] = lambda: ()
+        self._built = False
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    def reset(self, milestones: Callable[[], Iterable[Dict]]) -> None:
+        """색인을 비우고 다음 조회 때 전체 데이터로 다시 만들도록 합니다.
+
+        Args:
+            milestones (Callable): 현재 마일스톤 목록을 반환하는 함수
+        """
+        self.__init__()
+        self._milestones = milestones
+
+    def update(self, milestone_ids: Iterable[str],
+               get_milestone: Callable[[str], Optional[Dict]]) -> None:
+        """바뀐 마일스톤만 다시 색인합니다 (색인을 만들기 전이면 무시).
+
+        Args:
+            milestone_ids (Iterable[str]): 바뀐 마일스톤 ID
+            get_milestone (Callable): ID로 현재 마일스톤을 찾는 함수
+        """
+        if not self._built:
+            return
+        for milestone_id in milestone_ids:
+            self._remove_milestone(milestone_id)
+            milestone = get_milestone(milestone_id)
+            if milestone is None:
+                self._free_slot(milestone_id)
+            else:
+                self._add_milestone(milestone)
+
+    def bits(self, facet: str, value: Hashable) -> int:
+        """패싯 값을 가진 마일스톤의 비트셋"""
+        self._ensure_built()
+        return self._bits.get((facet, value), 0)
+
+    def keyword_bits(self, keyword: str) -> int:
+        """제목 또는 부제목에 키워드가 포함된 마일스톤의 비트셋"""
+        self._ensure_built()
+        keyword = normalize(keyword)
+        bits = self._keywords.get(keyword)
+        if bits is not None:
+            self._keywords.move_to_end(keyword)
+            return bits
+        bits = self.bits_of(milestone_id for milestone_id, heading in self._headings.items()
+                            if keyword in heading)
+        self._keywords[keyword] = bits
+        if len(self._keywords) > KEYWORD_CACHE_LIMIT:
+            self._keywords.popitem(last=False)
+        return bits
+
+    def value_bits(self, facet: str, matches: Callable[[Hashable], bool]) -> int:
+        """값이 matches를 만족하는 패싯 값들의 비트셋 합 (OR)"""
+        self._ensure_built()
+        bits = 0
+        for (name, value), value_bits in self._bits.items():
+            if name == facet and matches(value):
+                bits |= value_bits
+        return bits
+
+    def all_bits(self) -> int:
+        """모든 마일스톤의 비트셋"""
+        self._ensure_built()
+        return self.bits_of(self._slots)
+
+    def bits_of(self, milestone_ids: Iterable[str]) -> int:
+        """마일스톤 ID들의 비트셋 (색인에 없는 ID는 무시)"""
+        self._ensure_built()
+        flags = bytearray(len(self._slot_ids))
+        slots = self._slots
+        for milestone_id in milestone_ids:
+            slot = slots.get(milestone_id)
+            if slot is not None:
+                flags[slot] = 1
+        # 슬롯 i가 i번째 비트가 되도록 뒤집어 이진 문자열로 변환
+        return int(flags[::-1].translate(_BIT_CHARS) or b"0", 2)
+
+    def milestone_ids(self, bits: int) -> Set[str]:
+        """비트셋에 켜진 마일스톤 ID 집합"""
+        slot_ids = self._slot_ids
+        text = bin(bits)[:1:-1]  # 낮은 비트부터
+        result = set()
+        position = text.find("1")
+        while position >= 0:
+            result.add(slot_ids[position])
+            position = text.find("1", position + 1)
+        return result
+
+    def milestone_count(self, facet: str, value: Hashable) -> int:
+        """패싯 값을 가진 마일스톤 수"""
+        return self.bits(facet, value).bit_count()
+
+    def node_count(self, facet: str, value: Hashable) -> int:
+        """패싯 값을 가진 노드 수 (카테고리는 그 카테고리 마일스톤의 노드 수)"""
+        self._ensure_built()
+        return self._node_counts.get((facet, value), 0)
+
+    def values(self, facet: str) -> Dict[Hashable, int]:
+        """패싯의 값별 노드 수"""
+        self._ensure_built()
+        return {value: count for (name, value), count in self._node_counts.items()
+                if name == facet and count > 0}
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        self._built = True
+        for milestone in self._milestones():
+            self._add_milestone(milestone)
+
+    def _add_milestone(self, milestone: Dict) -> None:
+        milestone_id = milestone["id"]
+        slot = self._slots.get(milestone_id)
+        if slot is None:
+            slot = self._free_slots.pop() if self._free_slots else len(self._slot_ids)
+            if slot == len(self._slot_ids):
+                self._slot_ids.append(milestone_id)
+            else:
+                self._slot_ids[slot] = milestone_id
+            self._slots[milestone_id] = slot
+        nodes = milestone.get("nodes", [])
+        facets: Counter = Counter()
+        for node in nodes:
+            facets.update(node_facets(node))
+        # 노드가 없는 마일스톤도 카테고리 비트는 켜지도록 0개여도 기록
+        facets[(CATEGORY, milestone.get("category", ""))] += len(nodes)
+        self._facets[milestone_id] = facets
+        flag = 1 << slot
+        for key, count in facets.items():
+            self._bits[key] = self._bits.get(key, 0) | flag
+            self._node_counts[key] += count
+        heading = normalize(milestone.get("title", "") + "\x00" + milestone.get("subtitle", ""))
+        self._headings[milestone_id] = heading
+        for keyword in self._keywords:
+            if keyword in heading:
+                self._keywords[keyword] |= flag
+
+    def _remove_milestone(self, milestone_id: str) -> None:
+        facets = self._facets.pop(milestone_id, None)
+        if facets is None:
+            return
+        mask = ~(1 << self._slots[milestone_id])
+        for key, count in facets.items():
+            bits = self._bits[key] & mask
+            if bits:
+                self._bits[key] = bits
+            else:
+                del self._bits[key]
+            self._node_counts[key] -= count
+            if self._node_counts[key] <= 0:
+                del self._node_counts[key]
+        del self._headings[milestone_id]
+        for keyword in self._keywords:
+            self._keywords[keyword] &= mask
+
+    def _free_slot(self, milestone_id: str) -> None:
+        slot = self._slots.pop(milestone_id, None)
+        if slot is not None:
+            self._slot_ids[slot] = None
+            self._free_slots.append(slot)
+
+
+# bytearray 0/1 → b"0"/b"1" 변환표
+_BIT_CHARS = bytes.maketrans(b"\x00\x01", b"01")
@@ -0,0 +1,284 @@
+"""필터 계획 모듈 - filter_settings를 컴파일한 필터 단계 파이프라인
+
+filter_settings는 검색, 날짜, 이번달, 키워드, KPI 차트 필터가 채우는 dict입니다.
+마일스톤마다 이 dict를 다시 해석하지 않도록 한 번 컴파일해 단계 리스트로 만듭니다.
+
+- 비트셋 단계: 패싯 색인으로 조회하는 조건 (마일스톤 ID, 키워드/제목, 모양).
+  비트 AND로 결합하고, 결과를 마일스톤 ID로 바꾸는 것은 한 번만 합니다.
+- ID 단계: 다른 색인으로 조회하는 조건 (날짜(분기), 이번달, 내용, 검색 쿼리).
+  날짜 조건은 패싯 색인을 아직 만들지 않았으면 저장소(SQLite)에 맡깁니다. 비용이 낮은
+  단계부터 조회해 교집합합니다. 검색 쿼리는 query.py가 자체 실행 계획으로 처리합니다.
+
+모든 조건은 AND로 결합되며 결과가 비면 나머지 단계는 조회하지 않습니다.
+조회한 ID 집합은 데이터 버전(DataManager.version)이 바뀔 때까지 재사용합니다.
+단계마다 마일스톤 하나를 직접 확인하는 test도 있어, 트랜잭션 하나만큼 바뀐
+경우에는 update()로 바뀐 마일스톤만 다시 확인해 ID 집합을 갱신할 수 있습니다
+(저장된 보기, saved_views.py).
+
+FilterResultCache는 (데이터 버전, 정규화된 필터) → 필터 결과를 LRU로 보관해
+데이터가 그대로일 때 필터를 오가거나 화면을 다시 그리면 다시 계산하지 않습니다.
+"""
+
+from collections import OrderedDict
+from typing import (Callable, Dict, FrozenSet, Hashable, Iterable, List, NamedTuple,
+                    Optional, Set, Tuple)
+
+from dates import month_ordinal
+from facet_index import QUARTER, SHAPE
+from models import node_date
+from query import parse_query, query_test
+from text_index import normalize
+
+# 단계 비용 - 작을수록 먼저 실행 (조회 비용과 보통의 선택도 기준)
+COST_MILESTONE_ID = 0
+COST_FACET = 1
+COST_HEADING = 2
+COST_DATE = 3
+COST_CONTENT = 4
+COST_QUERY = 5
+
+# 보관할 필터 결과 수
+FILTER_CACHE_SIZE = 16
+
+
+class FilterStage(NamedTuple):
+    """필터 단계 하나 (bits 또는 lookup 중 하나를 가짐)"""
+
+    name: str
+    cost: int
+    value: Hashable  # 정규화된 조건 값 (필터 키)
+    bits: Optional[Callable[[], int]] = None  # 해당 마일스톤 비트셋 조회 (패싯 색인)
+    lookup: Optional[Callable[[], Set[str]]] = None  # 해당 마일스톤 ID 집합 조회
+    test: Optional[Callable[[Dict], bool]] = None  # 마일스톤 하나를 직접 확인 (증분 갱신용)
+
+
+def this_month_range(settings: Dict) -> Tuple[int, int]:
+    """이번달 필터의 (시작 월 서수, 끝 월 서수)"""
+    current = month_ordinal(settings.get("current_year", 0), settings.get("current_month", 0))
+    return (current, current)
+
+
+def this_quarter_range(settings: Dict) -> Tuple[int, int]:
+    """날짜(분기) 필터의 (시작 월 서수, 끝 월 서수)"""
+    first = month_ordinal(settings.get("filter_year", 0), (settings.get("filter_quarter", 0) - 1) * 3 + 1)
+    return (first, first + 2)
+
+
+class FilterPlan:
+    """컴파일된 필터 - 비용 순으로 정렬된 단계 리스트"""
+
+    def __init__(self, settings: Optional[Dict], stages: Iterable[FilterStage], facets=None,
+                 version: Callable[[], int] = lambda: 0):
+        self.settings = dict(settings) if settings else None  # 컴파일에 사용한 설정 사본
+        self.stages = sorted(stages, key=lambda stage: stage.cost)
+        # 정규화된 필터 - 표시용 값(제목 등)과 조건 순서, 중복 키워드는 무시
+        self.key: FrozenSet[Tuple[str, Hashable]] = frozenset(
+            (stage.name, stage.value) for stage in self.stages)
+        self._bit_lookups = [stage.bits for stage in self.stages if stage.bits is not None]
+        self._lookups = [stage.lookup for stage in self.stages if stage.lookup is not None]
+        self._tests = [stage.test for stage in self.stages if stage.test is not None]
+        self._facets = facets  # 비트셋을 마일스톤 ID로 바꿀 패싯 색인
+        self._version = version  # 현재 데이터 버전을 반환하는 함수
+        self._ids: Optional[Set[str]] = None
+        self._ids_version: Optional[int] = None  # ID 집합을 조회한 데이터 버전
+
+    @classmethod
+    def compile(cls, settings: Optional[Dict], data_manager) -> "FilterPlan":
+        """filter_settings를 필터 단계로 컴파일합니다.
+
+        Args:
+            settings (Optional[Dict]): 필터 설정 (None이면 모든 마일스톤 표시)
+            data_manager (DataManager): 색인 조회에 사용할 데이터 관리자
+
+        Returns:
+            FilterPlan: 컴파일된 필터
+        """
+        stages = []
+        if not settings:
+            return cls(settings, stages)
+        facets = data_manager.facet_index
+
+        # 마일스톤 ID 필터 (KPI Chart 클릭, 빠른 찾기)
+        milestone_id = settings.get("milestone_id", "")
+        if milestone_id:
+            stages.append(FilterStage(
+                "milestone_id", COST_MILESTONE_ID, milestone_id,
+                bits=lambda: facets.bits_of((milestone_id,)),
+                test=lambda milestone: milestone["id"] == milestone_id))
+
+        # 날짜 필터 (년도 + 분기) - 패싯 색인을 이미 만들었으면 분기 비트셋,
+        # 아니면 월 범위 조회 (SQLite는 노드를 파싱하지 않고 저장소에서 조회)
+        if settings.get("date_filter"):
+            quarter = (settings.get("filter_year", 0), settings.get("filter_quarter", 0))
+            quarter_range = this_quarter_range(settings)
+            stages.append(FilterStage(
+                "date", COST_FACET, quarter,
+                lookup=lambda: (facets.milestone_ids(facets.bits(QUARTER, quarter)) if facets.is_built
+                                else data_manager.milestone_ids_in_month_range(*quarter_range)),
+                test=lambda milestone: any(
+                    (parsed := node_date(node)) is not None
+                    and (parsed.year, parsed.quarter) == quarter
+                    for node in milestone.get("nodes", []))))
+
+        # 모양 필터 - 모양 패싯
+        shape = settings.get("shape")
+        if shape:
+            stages.append(FilterStage(
+                "shape", COST_FACET, shape, bits=lambda: facets.bits(SHAPE, shape),
+                test=lambda milestone: any(node.get("shape", "") == shape
+                                           for node in milestone.get("nodes", []))))
+
+        # 이번달 일정 필터 - 날짜 색인 조회
+        if settings.get("this_month"):
+            current_range = this_month_range(settings)
+            stages.append(FilterStage(
+                "this_month", COST_DATE, current_range,
+                lookup=lambda: data_manager.milestone_ids_in_month_range(*current_range),
+                test=lambda milestone: any(
+                    (parsed := node_date(node)) is not None and parsed.overlaps(*current_range)
+                    for node in milestone.get("nodes", []))))
+
+        # 키워드 필터(모든 키워드가 포함, AND)와 제목/부제목 검색 - 키워드 비트셋
+        headings = list(settings.get("keywords", []))
+        if settings.get("keyword"):
+            headings.append(settings["keyword"])
+        for text in {normalize(text) for text in headings}:
+            stages.append(FilterStage(
+                "heading", COST_HEADING, text, bits=lambda text=text: facets.keyword_bits(text),
+                test=lambda milestone, text=text: text in normalize(
+                    milestone.get("title", "") + "\x00" + milestone.get("subtitle", ""))))
+
+        # 내용 검색
+        content_keyword = settings.get("content_keyword", "")
+        if content_keyword:
+            content = normalize(content_keyword)
+            stages.append(FilterStage(
+                "content", COST_CONTENT, content,
+                lookup=lambda: data_manager.milestone_ids_with_content(content_keyword),
+                test=lambda milestone: any(content in normalize(node.get("content", ""))
+                                           for node in milestone.get("nodes", []))))
+
+        # 검색 쿼리 (예: shape:★ date:24.Q3..25.Q1 -category:R&D)
+        query = settings.get("query", "")
+        if query:
+            stages.append(FilterStage(
+                "query", COST_QUERY, " ".join(query.split()),
+                lookup=lambda: data_manager.query_ids(query),
+                test=_lazy_test(lambda: query_test(parse_query(query), data_manager))))
+        return cls(settings, stages, facets, lambda: data_manager.version)
+
+    def compiled_from(self, settings: Optional[Dict]) -> bool:
+        """이 설정으로 컴파일한 필터인지 확인합니다 (설정이 바뀌면 다시 컴파일)."""
+        return self.settings == (dict(settings) if settings else None)
+
+    @property
+    def is_empty(self) -> bool:
+        """조건이 없는 필터인지 여부"""
+        return not self.stages
+
+    def milestone_ids(self) -> Optional[Set[str]]:
+        """모든 단계를 통과하는 마일스톤 ID 집합 (조건이 없으면 None)"""
+        version = self._version()
+        if self._ids_version != version:
+            self._ids = self._lookup_ids()
+            self._ids_version = version
+        return self._ids
+
+    def matches(self, milestone: Dict) -> bool:
+        """마일스톤이 모든 조건을 만족하는지 확인합니다."""
+        ids = self.milestone_ids()
+        return ids is None or milestone.get("id") in ids
+
+    def apply(self, milestones: Iterable[Dict]) -> List[Dict]:
+        """조건을 만족하는 마일스톤만 순서대로 반환합니다."""
+        if self.is_empty:
+            return list(milestones)
+        return [milestone for milestone in milestones if self.matches(milestone)]
+
+    def evaluate(self, milestone: Dict) -> bool:
+        """색인을 조회하지 않고 마일스톤이 모든 조건을 만족하는지 직접 확인합니다."""
+        return all(test(milestone) for test in self._tests)
+
+    def update(self, milestone_ids: Iterable[str],
+               get_milestone: Callable[[str], Optional[Dict]]) -> None:
+        """바뀐 마일스톤만 다시 확인해 조회한 ID 집합을 현재 버전으로 갱신합니다.
+
+        ID 집합이 바로 이전 버전의 것일 때만 갱신하고, 그보다 오래되었으면
+        다음 milestone_ids() 호출 때 다시 조회합니다.
+
+        Args:
+            milestone_ids (Iterable[str]): 이번 버전에서 바뀐 마일스톤 ID
+            get_milestone (Callable): ID로 현재 마일스톤을 찾는 함수
+        """
+        version = self._version()
+        if self._ids is None or self._ids_version != version - 1:
+            return
+        for milestone_id in milestone_ids:
+            milestone = get_milestone(milestone_id)
+            if milestone is not None and self.evaluate(milestone):
+                self._ids.add(milestone_id)
+            else:
+                self._ids.discard(milestone_id)
+        self._ids_version = version
+
+    def _lookup_ids(self) -> Optional[Set[str]]:
+        result = None
+        if self._bit_lookups:
+            bits = -1  # 모든 비트
+            for lookup in self._bit_lookups:
+                bits &= lookup()
+                if not bits:
+                    return set()
+            result = self._facets.milestone_ids(bits)
+        for lookup in self._lookups:
+            ids = lookup()
+            result = set(ids) if result is None else result & ids
+            if not result:
+                break
+        return result
+
+
+def _lazy_test(factory: Callable[[], Callable[[Dict], bool]]) -> Callable[[Dict], bool]:
+    """처음 확인할 때 만드는 확인 함수 (만드는 비용이 큰 검색 쿼리용)"""
+    tests: List[Callable[[Dict], bool]] = []
+
+    def test(milestone: Dict) -> bool:
+        if not tests:
+            tests.append(factory())
+        return tests[0](milestone)
+    return test
+
+
+class FilterResultCache:
+    """(데이터 버전, 정규화된 필터) → 필터된 마일스톤 목록 LRU 캐시"""
+
+    def __init__(self, capacity: int = FILTER_CACHE_SIZE):
+        self.capacity = capacity
+        self._version: Optional[int] = None
+        self._results: "OrderedDict[FrozenSet, List[Dict]]" = OrderedDict()
+
+    def filter(self, plan: FilterPlan, version: int,
+               milestones: Callable[[], Iterable[Dict]]) -> List[Dict]:
+        """필터 결과를 캐시에서 찾고, 없으면 계산해 보관합니다.
+
+        Args:
+            plan (FilterPlan): 컴파일된 필터
+            version (int): 현재 데이터 버전
+            milestones (Callable): 현재 마일스톤 목록을 반환하는 함수
+
+        Returns:
+            List[Dict]: 필터된 마일스톤 목록 (호출자가 바꿔도 되는 사본)
+        """
+        if version != self._version:
+            # 버전은 늘기만 하므로 이전 버전의 결과는 다시 쓰이지 않음
+            self._results.clear()
+            self._version = version
+        result = self._results.get(plan.key)
+        if result is None:
+            result = plan.apply(milestones())
+            self._results[plan.key] = result
+            if len(self._results) > self.capacity:
+                self._results.popitem(last=False)
+        else:
+            self._results.move_to_end(plan.key)
+        return list(result)
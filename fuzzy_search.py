@@ -0,0 +1,329 @@
+"""퍼지 검색 모듈 - 초성 검색과 자모 단위 오타 허용 검색
+
+"노광기"를 ㄴㄱㄱ(초성)으로 찾거나 "노광귀"처럼 오타가 있어도 찾을 수 있도록
+마일스톤 제목/부제목과 노드 내용을 두 가지 형태로 색인합니다.
+
+- 자모 문자열: 음절을 초성/중성/종성 호환 자모로 풀어 쓴 문자열
+  ("노광기" → "ㄴㅗㄱㅘㅇㄱㅣ")의 3-gram 포스팅. 음절 하나가 틀려도 자모
+  대부분이 같으므로 공유하는 3-gram 비율로 순위를 매깁니다.
+- 초성 문자열: 음절마다 초성만 모은 문자열("노광기" → "ㄴㄱㄱ")의 2-gram
+  포스팅. 검색어가 자음으로만 이루어져 있으면 초성 부분 문자열로 찾습니다.
+
+공백은 비교에서 제외합니다. DataManager가 트랜잭션마다 바뀐 마일스톤만 다시
+색인하며, 노드 내용은 노드를 모두 파싱해야 하므로 처음 검색할 때 색인합니다.
+"""
+
+import heapq
+import math
+import unicodedata
+from collections import Counter
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+# 한글 음절 (가~힣) 분해용 상수
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_COUNT = 11172
+_MEDIAL_COUNT = 21
+_FINAL_COUNT = 28
+
+# 호환 자모 (ㄱ, ㅏ 등 키보드로 입력되는 자모)
+INITIALS = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+MEDIALS = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+FINALS = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+          "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+_CONSONANTS = frozenset("ㄱㄲㄳㄴㄵㄶㄷㄸㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅃㅄㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ")
+
+# 검색 결과로 인정할 최소 3-gram 공유 비율
+MIN_SIMILARITY = 0.5
+# 제목/부제목 결과의 가산점 (같은 점수면 노드 내용보다 위)
+HEADING_BONUS = 0.1
+# 짧은 텍스트의 가산점 상한 (텍스트가 짧을수록 이 값에 가까움)
+LENGTH_BONUS = 0.1
+# 문서 가산점은 이 값보다 항상 작음
+MAX_BONUS = HEADING_BONUS + LENGTH_BONUS
+
+
+def decompose(text: str) -> str:
+    """한글 음절을 호환 자모로 풀어 쓴 소문자 문자열 (공백 제외)"""
+    result = []
+    for char in unicodedata.normalize("NFC", text).lower():
+        code = ord(char) - _SYLLABLE_BASE
+        if 0 <= code < _SYLLABLE_COUNT:
+            result.append(INITIALS[code // (_MEDIAL_COUNT * _FINAL_COUNT)])
+            result.append(MEDIALS[code // _FINAL_COUNT % _MEDIAL_COUNT])
+            result.append(FINALS[code % _FINAL_COUNT])
+        elif not char.isspace():
+            result.append(char)
+    return "".join(result)
+
+
+def initials(text: str) -> str:
+    """음절마다 초성만 모은 소문자 문자열 (한글이 아닌 문자는 그대로, 공백 제외)"""
+    result = []
+    for char in unicodedata.normalize("NFC", text).lower():
+        code = ord(char) - _SYLLABLE_BASE
+        if 0 <= code < _SYLLABLE_COUNT:
+            result.append(INITIALS[code // (_MEDIAL_COUNT * _FINAL_COUNT)])
+        elif not char.isspace():
+            result.append(char)
+    return "".join(result)
+
+
+def is_initials_query(query: str) -> bool:
+    """검색어가 자음(초성)으로만 이루어졌는지 확인합니다 (공백 무시)."""
+    chars = [char for char in query if not char.isspace()]
+    return bool(chars) and all(char in _CONSONANTS for char in chars)
+
+
+def _grams(text: str, size: int) -> Set[str]:
+    if len(text) < size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+# (문서 ID, 점수)의 점수
+_score = itemgetter(1)
+
+
+class SearchHit(NamedTuple):
+    """순위가 매겨진 검색 결과 하나"""
+
+    score: float
+    milestone_id: str
+    node_id: str  # 제목/부제목 결과면 ""
+    text: str  # 일치한 원본 텍스트 (제목 결과는 "제목 - 부제목")
+
+
+class _Document(NamedTuple):
+    milestone_id: str
+    node_id: str
+    text: str
+
+
+class FuzzyIndex:
+    """초성/자모 3-gram 퍼지 검색 색인"""
+
+    def __init__(self):
+        self._documents: Dict[int, _Document] = {}
+        # 검색 중 문서마다 읽는 값은 딕셔너리로 따로 보관 (속성 접근 비용 절약)
+        self._jamo: Dict[int, str] = {}
+        self._initials: Dict[int, str] = {}
+        self._bonus: Dict[int, float] = {}
+        self._jamo_postings: Dict[str, Set[int]] = {}
+        self._jamo_heads: Dict[str, Set[int]] = {}  # 자모 문자열의 첫 3-gram → 문서
+        self._initial_postings: Dict[str, Set[int]] = {}
+        self._by_milestone: Dict[str, List[int]] = {}
+        self._next_doc = 0
+        self._milestones: Callable[[], Iterable[Dict]] = lambda: ()
+        self._built = False
+
+    def reset(self, milestones: Callable[[], Iterable[Dict]]) -> None:
+        """색인을 비우고 다음 검색 때 전체 데이터로 다시 만들도록 합니다.
+
+        Args:
+            milestones (Callable): 현재 마일스톤 목록을 반환하는 함수
+        """
+        self.__init__()
+        self._milestones = milestones
+
+    def update(self, milestone_ids: Iterable[str],
+               get_milestone: Callable[[str], Optional[Dict]]) -> None:
+        """바뀐 마일스톤만 다시 색인합니다 (색인을 만들기 전이면 무시).
+
+        Args:
+            milestone_ids (Iterable[str]): 바뀐 마일스톤 ID
+            get_milestone (Callable): ID로 현재 마일스톤을 찾는 함수
+        """
+        if not self._built:
+            return
+        for milestone_id in milestone_ids:
+            self._remove_milestone(milestone_id)
+            milestone = get_milestone(milestone_id)
+            if milestone is not None:
+                self._add_milestone(milestone)
+
+    def search(self, query: str, limit: int = 50) -> List[SearchHit]:
+        """검색어와 비슷한 제목/부제목과 노드 내용을 점수 순으로 찾습니다.
+
+        자음으로만 된 검색어는 초성 검색, 그 밖에는 자모 3-gram 퍼지 검색입니다.
+
+        Args:
+            query (str): 검색어
+            limit (int): 최대 결과 수
+
+        Returns:
+            List[SearchHit]: 점수가 높은 순서의 결과
+        """
+        if not self._built:
+            for milestone in self._milestones():
+                self._add_milestone(milestone)
+            self._built = True
+        if is_initials_query(query):
+            scored = self._search_initials(initials(query))
+        else:
+            scored = self._search_jamo(decompose(query), limit)
+        documents = self._documents
+        hits = []
+        for doc_id, score in heapq.nlargest(limit, scored, key=_score):
+            document = documents[doc_id]
+            hits.append(SearchHit(score, document.milestone_id, document.node_id, document.text))
+        return hits
+
+    def _search_initials(self, query: str) -> List[Tuple[int, float]]:
+        """초성 부분 문자열 검색 - 앞에서 일치하면 더 높은 점수"""
+        if len(query) < 2:
+            candidates = _containing(self._initial_postings, query)
+        else:
+            postings = []
+            for gram in _grams(query, 2):
+                posting = self._initial_postings.get(gram)
+                if not posting:
+                    return []
+                postings.append(posting)
+            postings.sort(key=len)
+            candidates = postings[0].intersection(*postings[1:])
+        texts = self._initials
+        bonus = self._bonus
+        scored = []
+        for doc_id in candidates:
+            position = texts[doc_id].find(query)
+            if position >= 0:
+                scored.append((doc_id, (1.5 if position == 0 else 1.0) + bonus[doc_id]))
+        return scored
+
+    def _search_jamo(self, query: str, limit: int) -> List[Tuple[int, float]]:
+        """자모 3-gram 퍼지 검색 - 검색어 3-gram 중 텍스트에 있는 비율로 점수
+
+        후보는 포스팅이 짧은(드문) 3-gram부터 만듭니다. 3-gram을 모두 공유하는
+        문서는 포스팅의 교집합으로 찾고, 그 점수만으로 상위 limit개가 정해지면
+        일부만 공유하는 문서는 세지 않습니다. 일부만 공유하는 문서는 드문
+        3-gram 몇 개 중 하나는 반드시 가지므로 그 문서만 후보로 세고, 공유
+        개수가 같은 문서끼리는 가산점이 큰 limit개만 점수를 계산합니다.
+        """
+        if not query:
+            return []
+        if len(query) < 3:
+            # 짧은 검색어는 오타를 허용하지 않고 부분 문자열로만 찾음
+            texts = self._jamo
+            bonus = self._bonus
+            return [(doc_id, (2.0 if texts[doc_id].startswith(query) else 1.5) + bonus[doc_id])
+                    for doc_id in _containing(self._jamo_postings, query)]
+        grams = _grams(query, 3)
+        total = len(grams)
+        needed = max(1, math.ceil(total * MIN_SIMILARITY))
+        postings = sorted(filter(None, map(self._jamo_postings.get, grams)), key=len)
+        if len(postings) < needed:
+            return []
+
+        scored: List[Tuple[int, float]] = []
+        if len(postings) == total:
+            scored = self._rank_full_matches(query, postings, limit)
+        if needed == total or (len(scored) >= limit
+                               and (total - 1) / total + MAX_BONUS <= scored[-1][1]):
+            return scored  # 일부만 공유하는 문서는 가산점을 더해도 상위 limit개에 들지 못함
+
+        # 문서 하나가 빠뜨릴 수 있는 3-gram은 (포스팅 수 - needed)개까지이므로
+        # 드문 3-gram (포스팅 수 - needed + 1)개 중 하나는 반드시 가짐. 나머지
+        # 포스팅이 훨씬 길면 그 문서만 셈 (다른 문서는 세더라도 needed에 못 미침)
+        rare = len(postings) - needed + 1
+        counts: Counter = Counter()
+        for posting in postings[:rare]:
+            counts.update(posting)
+        for posting in postings[rare:]:
+            counts.update(counts.keys() & posting if len(posting) > 2 * len(counts) else posting)
+        levels: Dict[int, List[int]] = {}
+        for doc_id, shared in counts.items():
+            if needed <= shared < total:  # 모두 공유하는 문서는 이미 점수를 매김
+                levels.setdefault(shared, []).append(doc_id)
+        bonus = self._bonus
+        for shared in sorted(levels, reverse=True):
+            if len(scored) >= limit and shared / total + MAX_BONUS <= scored[-1][1]:
+                break
+            for doc_id in heapq.nlargest(limit, levels[shared], key=bonus.__getitem__):
+                scored.append((doc_id, shared / total + bonus[doc_id]))
+            scored = heapq.nlargest(limit, scored, key=_score)
+        return scored
+
+    def _rank_full_matches(self, query: str, postings: List[Set[int]],
+                           limit: int) -> List[Tuple[int, float]]:
+        """3-gram을 모두 공유하는 문서 중 상위 limit개 (점수 순)
+
+        점수는 1.0 + 일치 가산점(앞에서 일치 1.0, 중간에서 일치 0.5, 그 밖 0) +
+        문서 가산점(MAX_BONUS 미만)이므로 일치 가산점이 큰 문서가 항상 위입니다.
+        앞에서 일치할 수 있는 문서는 첫 3-gram으로 시작하는 문서에서만 찾고,
+        어느 단계든 문서 가산점 순으로 보다가 상위 limit개가 채워지면 멈춥니다.
+        """
+        texts = self._jamo
+        bonus = self._bonus
+        heads = self._jamo_heads.get(query[:3], set()).intersection(*postings)
+        scored = []
+        for doc_id in sorted(heads, key=bonus.__getitem__, reverse=True):
+            if texts[doc_id].startswith(query):
+                scored.append((doc_id, 2.0 + bonus[doc_id]))
+                if len(scored) >= limit:
+                    return scored
+        starts = {doc_id for doc_id, _ in scored}
+        scattered = []  # 3-gram은 모두 있지만 이어져 있지 않은 문서
+        rest = postings[0].intersection(*postings[1:])
+        rest -= starts
+        for doc_id in sorted(rest, key=bonus.__getitem__, reverse=True):
+            if texts[doc_id].find(query) >= 0:
+                scored.append((doc_id, 1.5 + bonus[doc_id]))
+                if len(scored) >= limit:
+                    return scored
+            else:
+                scattered.append((doc_id, 1.0 + bonus[doc_id]))
+        return scored + scattered[:limit - len(scored)]
+
+    def _add_milestone(self, milestone: Dict) -> None:
+        milestone_id = milestone["id"]
+        title = milestone.get("title", "")
+        subtitle = milestone.get("subtitle", "")
+        doc_ids = [self._add_document(milestone_id, "",
+                                      f"{title} - {subtitle}" if subtitle else title,
+                                      title + " " + subtitle)]
+        for node in milestone.get("nodes", []):
+            content = node.get("content", "")
+            if content:
+                doc_ids.append(self._add_document(milestone_id, node["id"], content, content))
+        self._by_milestone[milestone_id] = doc_ids
+
+    def _add_document(self, milestone_id: str, node_id: str, text: str, indexed: str) -> int:
+        doc_id = self._next_doc
+        self._next_doc += 1
+        jamo = decompose(indexed)
+        initial_text = initials(indexed)
+        self._documents[doc_id] = _Document(milestone_id, node_id, text)
+        self._jamo[doc_id] = jamo
+        self._initials[doc_id] = initial_text
+        # 문서 가산점 - 제목/부제목이 노드 내용보다, 짧은 텍스트가 긴 텍스트보다 위
+        self._bonus[doc_id] = (0.0 if node_id else HEADING_BONUS) + LENGTH_BONUS * 20 / (20 + len(jamo))
+        for gram in _grams(jamo, 3):
+            self._jamo_postings.setdefault(gram, set()).add(doc_id)
+        self._jamo_heads.setdefault(jamo[:3], set()).add(doc_id)
+        for gram in _grams(initial_text, 2):
+            self._initial_postings.setdefault(gram, set()).add(doc_id)
+        return doc_id
+
+    def _remove_milestone(self, milestone_id: str) -> None:
+        for doc_id in self._by_milestone.pop(milestone_id, ()):
+            del self._documents[doc_id]
+            del self._bonus[doc_id]
+            jamo = self._jamo.pop(doc_id)
+            _discard(self._jamo_postings, _grams(jamo, 3), doc_id)
+            _discard(self._jamo_heads, (jamo[:3],), doc_id)
+            _discard(self._initial_postings, _grams(self._initials.pop(doc_id), 2), doc_id)
+
+
+def _containing(postings: Dict[str, Set[int]], query: str) -> Set[int]:
+    """n-gram보다 짧은 검색어를 포함하는 n-gram의 포스팅을 모두 합칩니다."""
+    return set().union(*(posting for gram, posting in postings.items() if query in gram))
+
+
+def _discard(postings: Dict[str, Set[int]], grams: Iterable[str], doc_id: int) -> None:
+    for gram in grams:
+        posting = postings.get(gram)
+        if posting is not None:
+            posting.discard(doc_id)
+            if not posting:
+                del postings[gram]
@@ -0,0 +1,62 @@
+"""ID 할당 모듈 - 충돌 없는 단조 증가 ID
+
+기존 데이터와 같은 형식(마이크로초 타임스탬프 숫자 문자열)을 유지하면서,
+직전에 발급한 값보다 항상 큰 값을 발급합니다. 같은 마이크로초 안에서
+여러 개를 만들거나 시스템 시계가 뒤로 가더라도 ID가 겹치지 않습니다.
+"""
+
+import threading
+import time
+from typing import List
+
+
+class IdAllocator:
+    """타임스탬프 기반 단조 증가 ID 발급기
+
+    발급 값은 max(현재 마이크로초, 직전 값 + 1)입니다. 불러온 데이터의
+    ID를 observe()로 알려 주면 그보다 큰 값부터 발급합니다.
+    """
+
+    def __init__(self):
+        self._last = 0
+        self._lock = threading.Lock()
+
+    def observe(self, existing_id: str) -> None:
+        """기존 ID를 알려 이후 발급 값이 그보다 크도록 합니다.
+
+        Args:
+            existing_id (str): 데이터에 이미 있는 ID (숫자가 아니면 무시)
+        """
+        try:
+            value = int(existing_id)
+        except (TypeError, ValueError):
+            return
+        if value > self._last:
+            with self._lock:
+                if value > self._last:
+                    self._last = value
+
+    def next_id(self) -> str:
+        """새 ID 하나를 발급합니다.
+
+        Returns:
+            str: 숫자 문자열 ID
+        """
+        return self.reserve(1)[0]
+
+    def reserve(self, count: int) -> List[str]:
+        """연속된 ID 블록을 한 번에 예약합니다 (일괄 가져오기용).
+
+        Args:
+            count (int): 예약할 ID 개수
+
+        Returns:
+            List[str]: 오름차순 ID 리스트
+        """
+        if count <= 0:
+            return []
+        now = time.time_ns() // 1000
+        with self._lock:
+            first = max(now, self._last + 1)
+            self._last = first + count - 1
+        return [str(value) for value in range(first, first + count)]
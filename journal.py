@@ -0,0 +1,189 @@
+"""변경 저널 모듈 - raw.json.journal 추가 전용(append-only) 기록 관리"""
+
+import json
+import os
+from typing import Dict, Iterable, List, Optional
+
+from models import to_json
+
+
+class ChangeJournal:
+    """데이터 변경 기록을 한 줄에 하나씩(JSON Lines) 추가 기록하는 클래스
+
+    저장 시 전체 데이터를 다시 쓰는 대신 변경 레코드만 파일 끝에 덧붙입니다.
+    스냅샷(raw.json)에 반영(compaction)된 뒤에는 clear()로 비웁니다.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Args:
+            filename (str): 저널 파일 경로 (예: raw.json.journal)
+        """
+        self.filename = filename
+        self.record_count = 0
+
+    def size(self) -> int:
+        """저널 파일 크기(바이트)를 반환합니다.
+
+        Returns:
+            int: 파일 크기 (파일이 없으면 0)
+        """
+        try:
+            return os.path.getsize(self.filename)
+        except OSError:
+            return 0
+
+    def append(self, records: List[Dict]) -> None:
+        """레코드들을 저널 끝에 추가하고 디스크에 동기화합니다.
+
+        파일이 줄바꿈으로 끝나지 않으면(잘린 마지막 줄) 줄을 바꾼 뒤 기록해
+        새 레코드가 잘린 줄에 이어 붙지 않도록 합니다.
+
+        Args:
+            records (List[Dict]): 추가할 변경 레코드 리스트
+        """
+        if not records:
+            return
+        lines = "".join(
+            json.dumps(r, ensure_ascii=False, separators=(",", ":"), default=to_json) + "\n"
+            for r in records
+        ).encode('utf-8')
+        with open(self.filename, 'ab+') as f:
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    lines = b"\n" + lines
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self.record_count += len(records)
+
+    def read(self, repair: bool = True) -> List[Dict]:
+        """저널의 모든 레코드를 읽어옵니다.
+
+        - 해석할 수 없는 줄은 그 줄만 건너뜁니다.
+        - 쓰기 도중 중단되어 잘린 마지막 줄(줄바꿈 없음)은 파일에서 잘라내
+          다음 append()가 온전한 줄 뒤에 기록되도록 합니다.
+
+        Args:
+            repair (bool): 잘린 마지막 줄을 파일에서 고칠지 여부 (다른 프로그램이
+                쓰는 중일 수 있는 외부 변경 확인에서는 False로 읽기만 함)
+
+        Returns:
+            List[Dict]: 기록된 순서대로의 변경 레코드 리스트
+        """
+        records = []
+        if not os.path.exists(self.filename):
+            self.record_count = 0
+            return records
+        with open(self.filename, 'rb') as f:
+            content = f.read()
+        end = content.rfind(b"\n") + 1  # 마지막 온전한 줄의 끝
+        for line in content[:end].splitlines():
+            record = _parse_line(line)
+            if record is not None:
+                records.append(record)
+        tail = content[end:]
+        if tail.strip():
+            record = _parse_line(tail)
+            if record is not None:
+                # 레코드는 다 썼지만 줄바꿈 전에 중단된 경우 - 줄바꿈만 보충
+                records.append(record)
+                if repair:
+                    with open(self.filename, 'ab') as f:
+                        f.write(b"\n")
+            elif repair:
+                self._truncate(end)
+        elif tail and repair:
+            self._truncate(end)
+        self.record_count = len(records)
+        return records
+
+    def _truncate(self, size: int) -> None:
+        """잘린 마지막 줄을 지우고 디스크에 동기화합니다."""
+        with open(self.filename, 'r+b') as f:
+            f.truncate(size)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self) -> None:
+        """저널 파일을 삭제합니다 (스냅샷 반영 후 호출)."""
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+        self.record_count = 0
+
+
+def replay(data: Dict, records: Iterable[Dict]) -> Dict:
+    """변경 레코드를 일반 딕셔너리 데이터에 순서대로 반영합니다.
+
+    DataManager 없이 저장소의 스냅샷과 저널로 디스크의 현재 상태를 구할 때
+    사용합니다 (색인을 만들지 않으므로 위치가 필요한 레코드는 O(마일스톤 수)).
+
+    Args:
+        data (Dict): 스냅샷 데이터 (그대로 고침)
+        records (Iterable[Dict]): 변경 레코드
+
+    Returns:
+        Dict: 레코드를 반영한 data
+    """
+    milestones = data.setdefault("milestones", [])
+    index = {milestone["id"]: milestone for milestone in milestones}
+
+    def position_of(milestone_id: str) -> int:
+        return next(i for i, m in enumerate(milestones) if m["id"] == milestone_id)
+
+    for record in records:
+        op = record.get("op")
+        if op == "add_milestone":
+            milestone = dict(record["milestone"])
+            if milestone["id"] in index:
+                milestones[position_of(milestone["id"])] = milestone
+            elif "position" in record:
+                milestones.insert(min(record["position"], len(milestones)), milestone)
+            else:
+                milestones.append(milestone)
+            index[milestone["id"]] = milestone
+        elif op in ("update_milestone", "move_milestone", "delete_milestone"):
+            milestone = index.get(record["id"])
+            if milestone is None:
+                continue
+            if op == "update_milestone":
+                for field in ("title", "subtitle", "category"):
+                    if field in record:
+                        milestone[field] = record[field]
+            else:
+                del milestones[position_of(record["id"])]
+                if op == "move_milestone":
+                    milestones.insert(min(record["position"], len(milestones)), milestone)
+                else:
+                    del index[record["id"]]
+        elif op in ("add_node", "update_node", "delete_node"):
+            milestone = index.get(record["milestone_id"])
+            if milestone is None:
+                continue
+            nodes = list(milestone.get("nodes", []))
+            node_id = record["node_id"] if op == "delete_node" else record["node"]["id"]
+            position = next((i for i, node in enumerate(nodes) if node["id"] == node_id), None)
+            if op == "delete_node":
+                if position is not None:
+                    del nodes[position]
+            elif position is not None:
+                nodes[position] = record["node"]
+            elif op == "add_node":
+                nodes.insert(record.get("position", len(nodes)), record["node"])
+            milestone["nodes"] = nodes
+        elif op == "set_keywords":
+            data["keywords"] = list(record.get("keywords", []))
+    return data
+
+
+def _parse_line(line: bytes) -> Optional[Dict]:
+    """저널 한 줄을 레코드로 해석합니다 (빈 줄이나 손상된 줄이면 None)."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        record = json.loads(line.decode('utf-8'))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    return record if isinstance(record, dict) else None
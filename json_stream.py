@@ -0,0 +1,440 @@
+"""스트리밍 JSON 로더 모듈 - 대용량 raw.json을 마일스톤 단위로 점진적으로 파싱
+
+json.load처럼 파일 전체를 한 번에 객체로 만들지 않고, 마일스톤 헤더
+(id/title/subtitle/category)만 즉시 파싱합니다. 노드 배열은 원본 바이트만
+마일스톤마다 따로 복사해 두었다가 처음 접근할 때 파싱합니다.
+
+파일은 READ_CHUNK_SIZE 단위로 읽으며, 다 읽은 마일스톤 앞부분은 다음 조각을
+읽을 때 버립니다. 따라서 파일 전체를 담은 버퍼를 만들지 않고, 파싱하지 않은
+노드 바이트도 파일 전체가 아니라 자기 구간만 붙잡습니다.
+"""
+
+import json
+import re
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# 문자열 리터럴 (이스케이프 포함)
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.DOTALL)
+# 공백
+_WHITESPACE = re.compile(rb'[ \t\r\n]*')
+# 괄호가 아닌 구간(문자열 포함)을 한 번에 건너뜀 - 괄호 앞에서 멈춤
+_NON_BRACKET_RUN = re.compile(rb'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+# 숫자, true/false/null 등 스칼라 값
+_SCALAR = re.compile(rb'[^,\]}\s]+')
+
+_OPEN_BRACKETS = (ord("["), ord("{"))
+_QUOTE = ord('"')
+
+_DECODER = json.JSONDecoder()
+
+# 파일을 읽는 단위 (바이트) - 값 하나가 더 크면 읽는 크기를 늘림
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class LazyMilestone(dict):
+    """노드 목록을 처음 접근할 때 파싱하는 마일스톤 딕셔너리
+
+    일반 dict와 동일하게 동작하며, "nodes" 키에 접근하거나 전체 항목을
+    순회하는 순간 노드 배열을 파싱해 채워 넣습니다.
+    """
+
+    __slots__ = ("_loader", "_on_load")
+
+    def __init__(self, header: Dict, loader: Optional[Callable[[], List[Dict]]] = None,
+                 on_load: Optional[Callable[["LazyMilestone"], None]] = None):
+        """
+        Args:
+            header (Dict): 노드를 제외한 마일스톤 필드
+            loader (Optional[Callable]): 노드 리스트를 반환하는 지연 로더
+            on_load (Optional[Callable]): 노드 로드 직후 호출될 콜백
+        """
+        super().__init__(header)
+        self._loader = loader
+        self._on_load = on_load
+
+    @property
+    def is_loaded(self) -> bool:
+        """노드 배열이 이미 파싱되었는지 여부"""
+        return self._loader is None
+
+    def set_on_load(self, callback: Optional[Callable[["LazyMilestone"], None]]) -> None:
+        """노드 로드 콜백을 지정합니다."""
+        self._on_load = callback
+
+    def snapshot(self) -> Dict:
+        """이후 편집과 독립적인 사본을 반환합니다.
+
+        노드 리스트까지만 얕게 복사합니다(노드 딕셔너리는 교체만 되고
+        수정되지 않음). 아직 로드되지 않았으면 로더를 공유하는 지연
+        사본을 만들어, 파싱을 사본을 사용하는 쪽(저장 스레드 등)으로 미룹니다.
+
+        Returns:
+            Dict: 마일스톤 사본
+        """
+        header = dict(dict.items(self))
+        if self._loader is not None:
+            return LazyMilestone(header, self._loader)
+        header["nodes"] = list(header.get("nodes", []))
+        return header
+
+    def raw_nodes(self) -> Optional[bytes]:
+        """아직 파싱하지 않은 노드 배열의 원본 JSON 바이트를 반환합니다.
+
+        노드를 파싱하지 않고 두 마일스톤의 노드가 같은지 비교할 때 사용합니다.
+
+        Returns:
+            Optional[bytes]: 원본 바이트 (이미 로드되었거나 알 수 없으면 None)
+        """
+        raw = getattr(self._loader, "raw", None)
+        return raw() if raw is not None else None
+
+    def _materialize(self) -> None:
+        """노드 배열을 파싱해 딕셔너리에 채워 넣습니다."""
+        if self._loader is None:
+            return
+        loader, self._loader = self._loader, None
+        dict.__setitem__(self, "nodes", loader())
+        if self._on_load is not None:
+            self._on_load(self)
+
+    def __getitem__(self, key):
+        if key == "nodes":
+            self._materialize()
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        if key == "nodes":
+            self._materialize()
+        return dict.get(self, key, default)
+
+    def __contains__(self, key):
+        if key == "nodes" and self._loader is not None:
+            return True
+        return dict.__contains__(self, key)
+
+    def __setitem__(self, key, value):
+        if key == "nodes":
+            self._loader = None
+        dict.__setitem__(self, key, value)
+
+    def __iter__(self):
+        self._materialize()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._materialize()
+        return dict.__len__(self)
+
+    def __eq__(self, other):
+        self._materialize()
+        if isinstance(other, LazyMilestone):
+            other._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def keys(self):
+        self._materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def items(self):
+        self._materialize()
+        return dict.items(self)
+
+    def copy(self) -> Dict:
+        self._materialize()
+        return dict(dict.items(self))
+
+    def pop(self, key, *args):
+        if key == "nodes":
+            self._materialize()
+        return dict.pop(self, key, *args)
+
+    def setdefault(self, key, default=None):
+        if key == "nodes":
+            self._materialize()
+        return dict.setdefault(self, key, default)
+
+    def __reduce__(self):
+        return (dict, (self.copy(),))
+
+    def __repr__(self):
+        if self._loader is not None:
+            return f"LazyMilestone({dict.__repr__(self)}, nodes=<not loaded>)"
+        return dict.__repr__(self)
+
+
+class _Scanner:
+    """바이트 버퍼 위를 이동하며 JSON 토큰을 읽는 최소한의 스캐너
+
+    stream을 주면 버퍼는 파일의 일부(창)만 담습니다. 창 끝에서 값이 끊기면
+    ValueError가 나고, attempt()가 다음 조각을 읽어 그 값을 처음부터 다시 읽습니다.
+    """
+
+    def __init__(self, buffer: bytes, stream: Optional[BinaryIO] = None):
+        self.buffer = buffer
+        self.pos = 0
+        self._stream = stream
+
+    def attempt(self, read: Callable[[], Any]) -> Any:
+        """read()를 실행하고, 창 끝에서 끊겼으면 더 읽은 뒤 같은 위치에서 다시 실행합니다."""
+        start = self.pos
+        while True:
+            try:
+                return read()
+            except ValueError:
+                self.pos = start
+                if not self._fill(start):
+                    raise
+                start = self.pos
+
+    def _fill(self, keep_from: int) -> bool:
+        """keep_from 앞의 다 읽은 부분을 버리고 다음 조각을 이어 붙입니다.
+
+        Returns:
+            bool: 더 읽은 내용이 있는지 여부 (파일 끝이면 False)
+        """
+        if self._stream is None:
+            return False
+        # 값 하나가 창보다 크면 읽는 크기를 두 배씩 늘려 다시 읽는 횟수를 줄임
+        chunk = self._stream.read(max(READ_CHUNK_SIZE, len(self.buffer) - keep_from))
+        if not chunk:
+            self._stream = None
+            return False
+        self.buffer = self.buffer[keep_from:] + chunk
+        self.pos -= keep_from
+        return True
+
+    def skip_whitespace(self) -> None:
+        self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+
+    def peek(self) -> int:
+        self.skip_whitespace()
+        if self.pos >= len(self.buffer):
+            raise ValueError("JSON이 예상보다 일찍 끝났습니다")
+        return self.buffer[self.pos]
+
+    def expect(self, char: str) -> None:
+        if self.peek() != ord(char):
+            raise ValueError(f"위치 {self.pos}에서 '{char}'가 필요합니다")
+        self.pos += 1
+
+    def consume_separator(self, closing: str) -> bool:
+        """쉼표면 건너뛰고 False, 닫는 괄호면 소비 후 True를 반환합니다."""
+        char = self.peek()
+        if char == ord(","):
+            self.pos += 1
+            return False
+        if char == ord(closing):
+            self.pos += 1
+            return True
+        raise ValueError(f"위치 {self.pos}에서 ',' 또는 '{closing}'가 필요합니다")
+
+    def read_string(self) -> str:
+        self.skip_whitespace()
+        match = _STRING.match(self.buffer, self.pos)
+        if match is None:
+            raise ValueError(f"위치 {self.pos}에서 문자열이 필요합니다")
+        self.pos = match.end()
+        return _decode_string(match.group())
+
+    def skip_value(self) -> Tuple[int, int]:
+        """값 하나를 파싱하지 않고 건너뛰며 (시작, 끝) 바이트 구간을 반환합니다."""
+        char = self.peek()
+        start = self.pos
+        if char == ord("["):
+            end = _find_flat_array_end(self.buffer, start)
+            if end is not None:
+                self.pos = end
+                return start, end
+        if char in _OPEN_BRACKETS:
+            buffer = self.buffer
+            length = len(buffer)
+            depth = 1
+            pos = start + 1
+            while True:
+                # 문자열과 일반 문자는 정규식이 C 레벨에서 한 번에 건너뜀
+                pos = _NON_BRACKET_RUN.match(buffer, pos).end()
+                if pos >= length or buffer[pos] == _QUOTE:
+                    # 버퍼 끝 (창 끝에서 끊긴 문자열 포함)
+                    raise ValueError("닫히지 않은 배열/객체가 있습니다")
+                if buffer[pos] in _OPEN_BRACKETS:
+                    depth += 1
+                else:
+                    depth -= 1
+                pos += 1
+                if depth == 0:
+                    self.pos = pos
+                    return start, pos
+        pattern = _STRING if char == _QUOTE else _SCALAR
+        match = pattern.match(self.buffer, start)
+        if match is None or (self._stream is not None and match.end() >= len(self.buffer)):
+            # 창 끝에 닿은 스칼라는 뒤가 더 있을 수 있음 (예: 12|34)
+            raise ValueError(f"위치 {start}에서 값을 읽을 수 없습니다")
+        self.pos = match.end()
+        return start, self.pos
+
+    def read_value(self) -> Any:
+        start, end = self.skip_value()
+        raw = self.buffer[start:end]
+        if raw[0] == _QUOTE:
+            return _decode_string(raw)
+        return _DECODER.decode(raw.decode("utf-8"))
+
+
+def _decode_string(raw: bytes) -> str:
+    """따옴표를 포함한 JSON 문자열 리터럴을 디코딩합니다."""
+    if b"\\" not in raw:
+        return raw[1:-1].decode("utf-8")
+    return _DECODER.decode(raw.decode("utf-8"))
+
+
+def _find_flat_array_end(buffer: bytes, start: int) -> Optional[int]:
+    """중첩 배열과 이스케이프가 없는 배열의 끝 위치를 빠르게 찾습니다.
+
+    노드 배열처럼 평평한 객체들의 배열은 문자열 밖의 첫 ']'가 배열의
+    끝입니다. 따옴표 개수의 홀짝으로 문자열 안/밖을 판단하며, 모든 검사를
+    bytes.find/count(C 구현)로 처리합니다. 판단할 수 없으면 None을 반환해
+    정밀 스캔으로 넘깁니다.
+    """
+    pos = start + 1
+    quotes = 0
+    while True:
+        end = buffer.find(b"]", pos)
+        if end == -1:
+            return None
+        if buffer.find(b"\\", pos, end) != -1 or buffer.find(b"[", pos, end) != -1:
+            return None
+        quotes += buffer.count(b'"', pos, end)
+        if quotes % 2 == 0:
+            return end + 1
+        pos = end + 1
+
+
+class _NodeSlice:
+    """노드 배열의 원본 바이트 - 호출하면 파싱한 노드 리스트를 반환하는 지연 로더"""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data  # 이 마일스톤의 노드 배열만 복사한 바이트
+
+    def __call__(self) -> List[Dict]:
+        return json.loads(self.data)
+
+    def raw(self) -> bytes:
+        """노드 배열의 원본 바이트"""
+        return self.data
+
+
+def _node_loader(buffer: bytes, start: int, end: int) -> Callable[[], List[Dict]]:
+    """버퍼의 노드 배열 구간을 복사해 파싱하는 지연 로더를 만듭니다."""
+    return _NodeSlice(bytes(buffer[start:end]))
+
+
+def iter_document(buffer: bytes, stream: Optional[BinaryIO] = None) -> Iterator[Tuple[str, Any]]:
+    """최상위 JSON 객체를 순서대로 읽으며 이벤트를 생성합니다.
+
+    Args:
+        buffer (bytes): raw.json 파일 내용 (stream을 주면 이미 읽은 앞부분, 보통 b"")
+        stream (Optional[BinaryIO]): 나머지 내용을 조각씩 읽을 파일
+
+    Yields:
+        Tuple[str, Any]: 마일스톤마다 ("milestone", LazyMilestone),
+            그 외 최상위 필드마다 (필드 이름, 값)
+    """
+    scanner = _Scanner(buffer, stream)
+    attempt = scanner.attempt
+    attempt(lambda: scanner.expect("{"))
+    if attempt(scanner.peek) == ord("}"):
+        return
+    while True:
+        key = attempt(lambda: _read_key(scanner))
+        if key == "milestones" and attempt(scanner.peek) == ord("["):
+            scanner.expect("[")
+            if attempt(scanner.peek) == ord("]"):
+                scanner.pos += 1
+            else:
+                while True:
+                    yield "milestone", attempt(lambda: _read_milestone(scanner))
+                    if attempt(lambda: scanner.consume_separator("]")):
+                        break
+        else:
+            yield key, attempt(scanner.read_value)
+        if attempt(lambda: scanner.consume_separator("}")):
+            return
+
+
+def _read_key(scanner: _Scanner) -> str:
+    """객체 키와 뒤의 ':'를 읽습니다."""
+    key = scanner.read_string()
+    scanner.expect(":")
+    return key
+
+
+def _read_milestone(scanner: _Scanner) -> LazyMilestone:
+    """마일스톤 객체 하나를 읽습니다 (노드 배열은 구간만 기록)."""
+    header = {}
+    loader = None
+    scanner.expect("{")
+    if scanner.peek() == ord("}"):
+        scanner.pos += 1
+        return LazyMilestone(header)
+    while True:
+        key = scanner.read_string()
+        scanner.expect(":")
+        if key == "nodes":
+            start, end = scanner.skip_value()
+            loader = _node_loader(scanner.buffer, start, end)
+        else:
+            header[key] = scanner.read_value()
+        if scanner.consume_separator("}"):
+            return LazyMilestone(header, loader)
+
+
+def iter_milestones(filename: str) -> Iterator[LazyMilestone]:
+    """파일의 마일스톤을 하나씩 생성합니다 (노드는 지연 로드).
+
+    Args:
+        filename (str): raw.json 파일 경로
+
+    Yields:
+        LazyMilestone: 헤더만 파싱된 마일스톤
+    """
+    with open(filename, 'rb') as f:
+        for kind, value in iter_document(b"", f):
+            if kind == "milestone":
+                yield value
+
+
+def load_lazily(filename: str,
+                on_milestone: Optional[Callable[[LazyMilestone], None]] = None) -> Dict:
+    """raw.json을 스트리밍 방식으로 불러옵니다.
+
+    Args:
+        filename (str): raw.json 파일 경로
+        on_milestone (Optional[Callable]): 마일스톤 헤더가 파싱될 때마다 호출
+
+    Returns:
+        Dict: {"milestones": [...], 그 외 최상위 필드} 형태의 데이터
+    """
+    data: Dict[str, Any] = {}
+    milestones: List[LazyMilestone] = []
+    with open(filename, 'rb') as f:
+        for kind, value in iter_document(b"", f):
+            if kind == "milestone":
+                milestones.append(value)
+                if on_milestone is not None:
+                    on_milestone(value)
+            else:
+                data[kind] = value
+    data["milestones"] = milestones
+    return data
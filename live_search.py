@@ -0,0 +1,145 @@
+"""빠른 검색 모듈 - 입력하는 동안 작업 스레드에서 제목/내용을 검색
+
+툴바의 빠른 검색 입력란에서 글자를 입력할 때마다 GUI 스레드를 막지 않도록
+QThreadPool 작업 스레드에서 검색합니다.
+
+- 작업 스레드는 바뀌지 않는 색인 스냅샷(search_snapshot.SearchSnapshot)만
+  읽습니다. 스냅샷을 만들거나 바뀐 마일스톤만 고치는 일도 작업 스레드에서
+  합니다. GUI 스레드는 데이터가 바뀔 때 바뀐 마일스톤의 얕은 사본만 모아 두고
+  (SnapshotTracker), 글자를 입력할 때는 그 빌드 객체를 작업에 넘기기만 합니다.
+- 새 글자가 입력되면 진행 중인 검색을 취소하고, 짧게 기다린 뒤(디바운스)
+  새 검색을 시작합니다. 취소된 검색의 결과는 세대 번호로 걸러냅니다.
+- 결과는 마일스톤 묶음(search_snapshot.CHUNK_SIZE개)을 검사할 때마다 partial_results로
+  나눠 보내므로 목록을 채우기 시작하는 데 전체 검색을 기다리지 않습니다.
+"""
+
+from typing import AbstractSet, List, Optional, Set
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from data_manager import DataManager
+from search_snapshot import SnapshotBuild, SnapshotTracker
+from text_index import normalize
+
+# 마지막 입력 후 검색을 시작하기까지 기다리는 시간 (ms)
+DEBOUNCE_MS = 80
+
+
+class _SearchSignals(QObject):
+    """작업 스레드에서 GUI 스레드로 결과를 보내는 시그널"""
+
+    partial = pyqtSignal(int, list)  # (세대, 마일스톤 ID 묶음)
+    finished = pyqtSignal(int, list)  # (세대, 전체 마일스톤 ID)
+    done = pyqtSignal(object)  # 끝난 _SearchTask (취소되었어도 보냄)
+
+
+class _SearchTask(QRunnable):
+    """스냅샷 하나를 검색하는 작업 - cancel() 후에는 다음 묶음에서 멈춤"""
+
+    def __init__(self, generation: int, build: SnapshotBuild, words: List[str],
+                 allowed: Optional[AbstractSet[str]], signals: _SearchSignals):
+        super().__init__()
+        self.generation = generation
+        self.build = build
+        self.words = words
+        self.allowed = allowed
+        self.signals = signals
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        try:
+            self._search()
+        finally:
+            self.signals.done.emit(self)
+
+    def _search(self):
+        snapshot = self.build.get()
+        matches: List[str] = []
+        for chunk in snapshot.matching_chunks(self.words, self.allowed):
+            if self.cancelled:
+                return
+            if chunk:
+                matches.extend(chunk)
+                self.signals.partial.emit(self.generation, chunk)
+        if not self.cancelled:
+            self.signals.finished.emit(self.generation, matches)
+
+
+class LiveSearch(QObject):
+    """빠른 검색 컨트롤러 - 디바운스, 취소, 스냅샷 관리"""
+
+    partial_results = pyqtSignal(list)  # 새로 찾은 마일스톤 ID (데이터 순서)
+    finished = pyqtSignal(list)  # 전체 결과 마일스톤 ID (데이터 순서)
+    started = pyqtSignal()  # 새 검색 시작 (이전 결과는 더 오지 않음)
+
+    def __init__(self, data_manager: DataManager, parent: Optional[QObject] = None):
+        """
+        Args:
+            data_manager (DataManager): 검색할 데이터 매니저
+            parent (Optional[QObject]): 부모 객체
+        """
+        super().__init__(parent)
+        self.data_manager = data_manager
+        # 현재 데이터 버전의 스냅샷 빌드 (데이터가 바뀔 때 GUI 스레드에서 교체)
+        self._snapshots = SnapshotTracker(data_manager)
+
+        self._generation = 0
+        self._tasks: Set[_SearchTask] = set()  # 시작했거나 대기 중인 작업 (끝날 때까지 참조 유지)
+        self._signals = _SearchSignals()
+        self._signals.partial.connect(self._on_partial)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.done.connect(self._tasks.discard)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._query = ""
+        self._allowed: Optional[AbstractSet[str]] = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(DEBOUNCE_MS)
+        self._timer.timeout.connect(self._start)
+
+    def search(self, query: str, allowed: Optional[AbstractSet[str]] = None) -> None:
+        """검색을 (다시) 예약합니다 - 진행 중인 검색은 바로 취소됩니다.
+
+        Args:
+            query (str): 검색어 (공백으로 나눈 단어가 모두 포함된 마일스톤을 찾음)
+            allowed (Optional[AbstractSet[str]]): 검색할 마일스톤 ID (None이면 전체,
+                작업 스레드가 읽으므로 넘긴 뒤에는 바꾸지 않는 집합)
+        """
+        self.cancel()
+        self._query = query
+        self._allowed = allowed
+        self._timer.start()
+
+    def cancel(self) -> None:
+        """예약되었거나 진행 중인 검색을 취소합니다."""
+        self._timer.stop()
+        self._generation += 1
+        for task in list(self._tasks):
+            task.cancel()
+            if self._pool.tryTake(task):  # 아직 시작하지 않은 작업은 바로 제거
+                self._tasks.discard(task)
+
+    def _start(self) -> None:
+        words = normalize(self._query).split()
+        if not words:
+            return
+        self._generation += 1
+        task = _SearchTask(self._generation, self._snapshots.current(), words,
+                           self._allowed, self._signals)
+        task.setAutoDelete(False)
+        self._tasks.add(task)
+        self.started.emit()
+        self._pool.start(task)
+
+    def _on_partial(self, generation: int, milestone_ids: list) -> None:
+        if generation == self._generation:
+            self.partial_results.emit(milestone_ids)
+
+    def _on_finished(self, generation: int, milestone_ids: list) -> None:
+        if generation == self._generation:
+            self.finished.emit(milestone_ids)
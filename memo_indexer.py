@@ -0,0 +1,90 @@
+"""메모 색인 모듈 - 데이터를 불러오면 작업 스레드에서 메모 검색 색인을 준비
+
+메모 BM25 색인(memo_search.MemoIndex)을 처음 검색할 때 만들면 노드가 많을 때
+GUI 스레드가 몇 초씩 멈춥니다. 데이터를 불러온 직후 QThreadPool 작업 스레드에서
+저장된 색인을 읽거나 새로 만들어(새로 만들었으면 파일에도 기록) 두고, 끝나면
+GUI 스레드에서 DataManager에 반영합니다. 그동안 바뀐 마일스톤은 반영할 때 다시
+색인하며, 반영하기 전에 검색하면 예전처럼 그 자리에서 만듭니다.
+"""
+
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from data_manager import DataManager
+from memo_search import MemoIndexBuild
+
+
+class _BuildSignals(QObject):
+    """작업 스레드에서 GUI 스레드로 완료를 알리는 시그널"""
+
+    done = pyqtSignal(object)  # 끝난 _BuildTask
+
+
+class _BuildTask(QRunnable):
+    """메모 색인 빌드 하나를 실행하는 작업"""
+
+    def __init__(self, build: MemoIndexBuild, signals: _BuildSignals):
+        super().__init__()
+        self.build = build
+        self.signals = signals
+
+    def run(self):
+        try:
+            self.build.run()
+        finally:
+            self.signals.done.emit(self)
+
+
+class MemoIndexer(QObject):
+    """메모 색인 백그라운드 빌드 컨트롤러"""
+
+    ready = pyqtSignal()  # 색인을 반영함
+
+    def __init__(self, data_manager: DataManager, parent: Optional[QObject] = None):
+        """
+        Args:
+            data_manager (DataManager): 색인할 데이터 매니저
+            parent (Optional[QObject]): 부모 객체
+        """
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self._task: Optional[_BuildTask] = None
+        self._signals = _BuildSignals()
+        self._signals.done.connect(self._complete)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+    @property
+    def is_building(self) -> bool:
+        """빌드가 진행 중인지 여부"""
+        return self._task is not None
+
+    def start(self) -> None:
+        """현재 데이터의 메모 색인 빌드를 시작합니다 (데이터를 불러온 뒤 호출)."""
+        if self._task is not None and self._pool.tryTake(self._task):
+            self._task = None  # 아직 시작하지 않은 이전 데이터의 빌드는 버림
+        build = self.data_manager.start_memo_index_build()
+        if build is None:
+            return
+        task = _BuildTask(build, self._signals)
+        task.setAutoDelete(False)
+        self._task = task
+        self._pool.start(task)
+
+    def wait(self) -> None:
+        """진행 중인 빌드가 끝날 때까지 기다린 뒤 반영합니다."""
+        task = self._task
+        if task is None:
+            return
+        self._pool.waitForDone()
+        # 큐에 쌓인 완료 시그널을 기다리지 않고 결과를 바로 반영
+        self._complete(task)
+
+    def _complete(self, task: _BuildTask) -> None:
+        """빌드 결과를 반영합니다 (작업마다 한 번만)."""
+        if task is not self._task:
+            return
+        self._task = None
+        if self.data_manager.install_memo_index(task.build):
+            self.ready.emit()
@@ -0,0 +1,322 @@
+"""메모 검색 모듈 - 노드 메모의 BM25 전문 검색 색인
+
+메모는 긴 회의록이 많아 부분 문자열 일치만으로는 순위를 매기기 어려우므로
+토큰 포스팅(용어 → 노드별 출현 횟수)을 만들고 BM25로 점수를 매깁니다.
+영문/숫자는 단어 단위, 한글은 조사가 붙어도 찾을 수 있도록 음절 2-gram
+단위로 토큰을 만듭니다.
+
+색인은 데이터 파일 옆(raw.json.memoindex)에 저장 파일 상태(크기, 수정 시각)와
+함께 기록해 두고, 다음 실행 때 저장 파일이 그대로면 다시 색인하지 않고
+불러옵니다. 불러온 뒤 바뀐 마일스톤은 DataManager가 트랜잭션마다 다시
+색인합니다.
+
+색인을 불러오거나 만드는 일은 MemoIndexBuild로 작업 스레드에서 할 수 있습니다
+(memo_indexer.py). 빌드가 끝나기 전에 검색하면 그 자리에서 만듭니다.
+"""
+
+import json
+import math
+import os
+import re
+import unicodedata
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from storage import write_json_atomic
+
+INDEX_VERSION = 1
+
+# BM25 매개변수
+K1 = 1.2
+B = 0.75
+
+# 스니펫 앞뒤 글자 수
+SNIPPET_RADIUS = 40
+
+_TOKEN = re.compile(r"[0-9a-z]+|[가-힣]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """메모를 검색 토큰 리스트로 나눕니다 (영문/숫자는 단어, 한글은 음절 2-gram)."""
+    tokens = []
+    for word in _TOKEN.findall(unicodedata.normalize("NFC", text).lower()):
+        if len(word) > 1 and "가" <= word[0] <= "힣":
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def make_snippet(text: str, query: str, radius: int = SNIPPET_RADIUS) -> str:
+    """검색어 토큰이 처음 나오는 부분을 중심으로 메모 일부를 한 줄로 잘라냅니다."""
+    lowered = unicodedata.normalize("NFC", text).lower()
+    positions = [lowered.find(token) for token in tokenize(query)]
+    positions = [position for position in positions if position >= 0]
+    center = min(positions) if positions else 0
+    start = max(0, center - radius)
+    end = min(len(text), center + radius)
+    snippet = " ".join(text[start:end].split())
+    return ("…" if start > 0 else "") + snippet + ("…" if end < len(text) else "")
+
+
+class MemoHit(NamedTuple):
+    """메모 검색 결과 하나"""
+
+    score: float
+    milestone_id: str
+    node_id: str
+    snippet: str
+
+
+class MemoIndex:
+    """노드 메모 BM25 색인 (노드 ID 단위 문서)"""
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._lengths: Dict[str, int] = {}  # 노드 ID → 토큰 수
+        self._owners: Dict[str, str] = {}  # 노드 ID → 마일스톤 ID
+        self._terms: Dict[str, Tuple[str, ...]] = {}  # 노드 ID → 용어 (제거용)
+        self._by_milestone: Dict[str, List[str]] = {}
+        self._total_length = 0
+        self._milestones: Callable[[], Iterable[Dict]] = lambda: ()
+        self._path = ""
+        self._signature = None
+        self._built = False
+        self._stale_ids: Set[str] = set()  # 색인을 만들기 전에 바뀐 마일스톤
+        self._generation = 0  # reset()마다 증가 - 이전 데이터로 만든 빌드 구별용
+
+    def reset(self, milestones: Callable[[], Iterable[Dict]], path: str = "",
+              signature: Optional[Tuple] = None) -> None:
+        """색인을 비우고 다음 검색 때 저장된 색인을 불러오거나 새로 만들도록 합니다.
+
+        Args:
+            milestones (Callable): 현재 마일스톤 목록을 반환하는 함수
+            path (str): 색인 파일 경로 (빈 문자열이면 저장하지 않음)
+            signature (Optional[Tuple]): 데이터를 불러온 시점의 저장 파일 상태
+                (None이면 저장된 색인을 사용하지 않음)
+        """
+        generation = self._generation + 1
+        self.__init__()
+        self._generation = generation
+        self._milestones = milestones
+        self._path = path
+        self._signature = _normalize_signature(signature)
+
+    def update(self, milestone_ids: Iterable[str],
+               get_milestone: Callable[[str], Optional[Dict]]) -> None:
+        """바뀐 마일스톤의 노드 메모만 다시 색인합니다.
+
+        Args:
+            milestone_ids (Iterable[str]): 바뀐 마일스톤 ID
+            get_milestone (Callable): ID로 현재 마일스톤을 찾는 함수
+        """
+        if not self._built:
+            self._stale_ids.update(milestone_ids)
+            return
+        # 노드가 다른 마일스톤으로 옮겨졌을 수 있으므로 모두 제거한 뒤 다시 추가
+        milestone_ids = list(milestone_ids)
+        for milestone_id in milestone_ids:
+            self._remove_milestone(milestone_id)
+        for milestone_id in milestone_ids:
+            milestone = get_milestone(milestone_id)
+            if milestone is not None:
+                self._add_milestone(milestone)
+
+    def start_build(self, milestones: Iterable[Dict],
+                    save_signature: Optional[Tuple] = None) -> Optional["MemoIndexBuild"]:
+        """색인을 불러오거나 만들 빌드를 반환합니다 (이미 만들었으면 None).
+
+        Args:
+            milestones (Iterable[Dict]): 색인할 마일스톤 (작업 스레드에서 실행하려면
+                이후 편집과 독립적인 사본)
+            save_signature (Optional[Tuple]): 마일스톤과 같은 내용인 저장 파일의
+                상태 (주면 새로 만든 색인을 이 상태로 파일에 기록, None이면 기록하지 않음)
+
+        Returns:
+            Optional[MemoIndexBuild]: 실행한 뒤 install()로 넘길 빌드
+        """
+        if self._built:
+            return None
+        return MemoIndexBuild(self._generation, list(milestones), self._path,
+                              self._signature, save_signature)
+
+    def install(self, build: "MemoIndexBuild",
+                get_milestone: Callable[[str], Optional[Dict]]) -> bool:
+        """실행을 마친 빌드를 색인으로 반영하고, 그사이 바뀐 마일스톤을 다시 색인합니다.
+
+        Args:
+            build (MemoIndexBuild): start_build()가 반환해 실행한 빌드
+            get_milestone (Callable): ID로 현재 마일스톤을 찾는 함수
+
+        Returns:
+            bool: 반영했는지 여부 (이미 만들었거나 그사이 reset()되었거나
+                빌드가 실패했으면 False)
+        """
+        if self._built or build.generation != self._generation or build.index is None:
+            return False
+        index = build.index
+        self._postings = index._postings
+        self._lengths = index._lengths
+        self._owners = index._owners
+        self._terms = index._terms
+        self._by_milestone = index._by_milestone
+        self._total_length = index._total_length
+        self._built = True
+        stale, self._stale_ids = self._stale_ids, set()
+        self.update(stale, get_milestone)
+        return True
+
+    def search(self, query: str, get_milestone: Callable[[str], Optional[Dict]],
+               limit: int = 50) -> List[Tuple[str, str, float]]:
+        """메모를 BM25 점수 순으로 검색합니다.
+
+        Args:
+            query (str): 검색어
+            get_milestone (Callable): ID로 현재 마일스톤을 찾는 함수
+                (저장된 색인을 불러온 뒤 바뀐 마일스톤 반영용)
+            limit (int): 최대 결과 수
+
+        Returns:
+            List[Tuple[str, str, float]]: (마일스톤 ID, 노드 ID, 점수) 리스트
+        """
+        self._ensure_built(get_milestone)
+        count = len(self._lengths)
+        if not count:
+            return []
+        average = self._total_length / count
+        lengths = self._lengths
+        scores: Counter = Counter()
+        for term, query_tf in Counter(tokenize(query)).items():
+            posting = self._postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(1 + (count - len(posting) + 0.5) / (len(posting) + 0.5))
+            for node_id, tf in posting.items():
+                norm = K1 * (1 - B + B * lengths[node_id] / average)
+                scores[node_id] += query_tf * idf * tf * (K1 + 1) / (tf + norm)
+        return [(self._owners[node_id], node_id, score)
+                for node_id, score in scores.most_common(limit)]
+
+    def save(self, signature: Tuple) -> None:
+        """색인을 파일에 기록합니다 (색인을 만든 적이 없으면 아무것도 하지 않음).
+
+        Args:
+            signature (Tuple): 현재 메모리 데이터와 같은 내용인 저장 파일의 상태
+        """
+        if not self._built or not self._path:
+            return
+        self._signature = _normalize_signature(signature)
+        write_json_atomic(self._path, {
+            "version": INDEX_VERSION,
+            "signature": self._signature,
+            "nodes": {node_id: [self._owners[node_id], length]
+                      for node_id, length in self._lengths.items()},
+            "postings": self._postings,
+        }, indent=None)
+
+    def _ensure_built(self, get_milestone: Callable[[str], Optional[Dict]]) -> None:
+        if self._built:
+            return
+        build = self.start_build(self._milestones())
+        build.run()
+        if not build.loaded:
+            # 현재 데이터로 만들었으므로 그전에 바뀐 마일스톤은 다시 색인하지 않음
+            self._stale_ids.clear()
+        self.install(build, get_milestone)
+
+    def _load(self) -> bool:
+        """저장 파일이 그대로일 때만 저장된 색인을 불러옵니다."""
+        if not self._path or not os.path.exists(self._path):
+            return False
+        try:
+            with open(self._path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if (self._signature is None or saved.get("version") != INDEX_VERSION
+                or saved.get("signature") != self._signature):
+            return False
+        self._postings = saved["postings"]
+        terms: Dict[str, List[str]] = {}
+        for term, posting in self._postings.items():
+            for node_id in posting:
+                terms.setdefault(node_id, []).append(term)
+        self._terms = {node_id: tuple(node_terms) for node_id, node_terms in terms.items()}
+        for node_id, (milestone_id, length) in saved["nodes"].items():
+            self._owners[node_id] = milestone_id
+            self._lengths[node_id] = length
+            self._by_milestone.setdefault(milestone_id, []).append(node_id)
+            self._total_length += length
+        return True
+
+    def _add_milestone(self, milestone: Dict) -> None:
+        milestone_id = milestone["id"]
+        node_ids = []
+        for node in milestone.get("nodes", []):
+            memo = node.get("memo", "")
+            if not memo:
+                continue
+            tokens = tokenize(memo)
+            if not tokens:
+                continue
+            node_id = node["id"]
+            counts = Counter(tokens)
+            for term, tf in counts.items():
+                self._postings.setdefault(term, {})[node_id] = tf
+            self._terms[node_id] = tuple(counts)
+            self._lengths[node_id] = len(tokens)
+            self._owners[node_id] = milestone_id
+            self._total_length += len(tokens)
+            node_ids.append(node_id)
+        if node_ids:
+            self._by_milestone[milestone_id] = node_ids
+
+    def _remove_milestone(self, milestone_id: str) -> None:
+        for node_id in self._by_milestone.pop(milestone_id, ()):
+            self._total_length -= self._lengths.pop(node_id)
+            del self._owners[node_id]
+            for term in self._terms.pop(node_id, ()):
+                posting = self._postings[term]
+                del posting[node_id]
+                if not posting:
+                    del self._postings[term]
+
+
+class MemoIndexBuild:
+    """색인을 불러오거나 새로 만드는 작업 하나 (MemoIndex.start_build → run → install)
+
+    받은 마일스톤 목록과 색인 파일만 읽으므로 작업 스레드에서 실행할 수 있습니다.
+    """
+
+    def __init__(self, generation: int, milestones: List[Dict], path: str,
+                 signature: Optional[list], save_signature: Optional[Tuple]):
+        self.generation = generation
+        self.milestones = milestones
+        self.path = path
+        self.signature = signature  # 저장된 색인을 불러올 조건 (MemoIndex.reset 참고)
+        self.save_signature = save_signature
+        # 실행 결과 (run() 종료 후 유효, 실패했으면 index는 None)
+        self.index: Optional[MemoIndex] = None
+        self.loaded = False  # 저장된 색인을 불러왔는지 여부
+
+    def run(self) -> None:
+        index = MemoIndex()
+        index._path = self.path
+        index._signature = self.signature
+        self.loaded = index._load()
+        if not self.loaded:
+            for milestone in self.milestones:
+                index._add_milestone(milestone)
+        index._built = True
+        self.milestones = None
+        if self.save_signature is not None and not self.loaded:
+            try:
+                index.save(self.save_signature)
+            except Exception:
+                pass  # 색인은 캐시이므로 기록하지 못해도 다음 실행 때 다시 만듦
+        self.index = index
+
+
+def _normalize_signature(signature) -> list:
+    """저장 파일 상태를 JSON으로 기록한 뒤와 같은 형태(리스트)로 맞춥니다."""
+    return json.loads(json.dumps(signature))
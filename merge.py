@@ -0,0 +1,320 @@
+"""병합 모듈 - 공통 조상을 기준으로 두 데이터를 3-way 병합
+
+마일스톤과 노드의 고정 ID로 세 데이터(공통 조상, 우리 쪽, 상대 쪽)를
+딕셔너리로 색인(해시 조인)해 한 번씩만 훑으므로 데이터 크기에 선형입니다.
+한쪽만 바꾼 내용은 자동으로 반영하고, 양쪽이 같은 필드를 다르게 바꿨거나
+한쪽이 지운 항목을 다른 쪽이 수정한 경우만 충돌(MergeConflict)로 보고합니다.
+충돌은 기본적으로 우리 쪽 값을 사용하며, 상대 쪽을 택할 충돌의 키를
+take_theirs로 넘겨 다시 병합하면 그 선택이 반영됩니다.
+
+공통 조상으로는 보통 raw.json.backup(DataManager.backup_filename())을 사용합니다.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Collection, Dict, List, NamedTuple, Optional, Tuple
+
+from diff import _same_node
+from json_stream import LazyMilestone
+
+
+# 충돌 종류
+FIELD_CONFLICT = "field"  # 양쪽이 같은 필드를 다르게 수정
+DELETE_CONFLICT = "delete"  # 한쪽은 삭제, 다른 쪽은 수정
+
+# 값이 없음을 나타내는 표식 (None과 구분)
+_ABSENT = object()
+
+
+class MergeConflict(NamedTuple):
+    """자동으로 병합할 수 없는 변경 하나"""
+
+    kind: str  # FIELD_CONFLICT 또는 DELETE_CONFLICT
+    milestone_id: str
+    node_id: str  # 마일스톤 자체의 충돌이면 ""
+    field: str  # 삭제 충돌이면 ""
+    base: Any  # 공통 조상의 값 (없으면 None)
+    ours: Any  # 우리 쪽 값 (삭제했으면 None)
+    theirs: Any  # 상대 쪽 값 (삭제했으면 None)
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        """충돌 위치 키 (take_theirs에 사용)"""
+        return (self.milestone_id, self.node_id, self.field)
+
+
+class MergeResult(NamedTuple):
+    """병합 결과"""
+
+    data: Dict  # 병합된 데이터 (충돌은 선택에 따라 반영됨)
+    conflicts: List[MergeConflict]
+
+
+def merge_data(base: Dict, ours: Dict, theirs: Dict,
+               take_theirs: Collection[Tuple[str, str, str]] = ()) -> MergeResult:
+    """세 데이터를 3-way 병합합니다.
+
+    Args:
+        base (Dict): 공통 조상 데이터
+        ours (Dict): 우리 쪽 데이터 (보통 현재 메모리 데이터)
+        theirs (Dict): 상대 쪽 데이터
+        take_theirs (Collection): 상대 쪽 값을 택할 충돌의 key 모음
+
+    Returns:
+        MergeResult: 병합된 데이터와 충돌 목록
+    """
+    merger = _Merger(set(take_theirs))
+    data = {k: v for k, v in ours.items() if k not in ("milestones", "keywords")}
+    data["milestones"] = merger.merge_milestones(
+        base.get("milestones", []), ours.get("milestones", []), theirs.get("milestones", []))
+    data["keywords"] = merge_lists(
+        base.get("keywords", []), ours.get("keywords", []), theirs.get("keywords", []))
+    return MergeResult(data, merger.conflicts)
+
+
+def merge_files(base_filename: str, ours_filename: str, theirs_filename: str,
+                take_theirs: Collection[Tuple[str, str, str]] = ()) -> MergeResult:
+    """세 데이터 파일(저널 포함)을 불러와 병합합니다.
+
+    Args:
+        base_filename (str): 공통 조상 파일 (예: raw.json.backup)
+        ours_filename (str): 우리 쪽 파일
+        theirs_filename (str): 상대 쪽 파일
+        take_theirs (Collection): 상대 쪽 값을 택할 충돌의 key 모음
+
+    Returns:
+        MergeResult: 병합 결과
+    """
+    return merge_data(load_file(base_filename), load_file(ours_filename),
+                      load_file(theirs_filename), take_theirs)
+
+
+def load_file(filename: str) -> Dict:
+    """병합에 사용할 데이터 파일을 불러옵니다 (노드는 필요할 때 파싱)."""
+    from data_manager import DataManager
+
+    return DataManager(filename, backup_count=0).load_data()
+
+
+def merge_lists(base: List, ours: List, theirs: List) -> List:
+    """키워드처럼 중복 없는 값 리스트를 3-way 병합합니다.
+
+    한쪽에서 추가한 값은 추가하고, 한쪽에서 지운 값은 지웁니다.
+    순서는 우리 쪽 순서 뒤에 상대 쪽에서 추가한 값을 붙입니다.
+    """
+    base_set, ours_set, theirs_set = set(base), set(ours), set(theirs)
+    result = [v for v in ours if v in theirs_set or v not in base_set]
+    result.extend(v for v in theirs if v not in ours_set and v not in base_set)
+    return result
+
+
+class _Merger:
+    """충돌을 모으며 마일스톤/노드를 병합하는 작업 객체"""
+
+    def __init__(self, take_theirs: set):
+        self.take_theirs = take_theirs
+        self.conflicts: List[MergeConflict] = []
+
+    def merge_milestones(self, base: List[Dict], ours: List[Dict], theirs: List[Dict]) -> List[Dict]:
+        base_index = {m["id"]: m for m in base}
+        theirs_index = {m["id"]: m for m in theirs}
+        ours_ids = set()
+        result = []
+        for milestone in ours:
+            milestone_id = milestone["id"]
+            ours_ids.add(milestone_id)
+            merged = self._merge_milestone(base_index.get(milestone_id), milestone,
+                                           theirs_index.get(milestone_id))
+            if merged is not None:
+                result.append(merged)
+
+        # 상대 쪽에서만 있는 마일스톤 (상대가 추가했거나, 우리가 지운 것을 상대가 수정)
+        extras = set()
+        for milestone in theirs:
+            milestone_id = milestone["id"]
+            if milestone_id in ours_ids:
+                continue
+            base_milestone = base_index.get(milestone_id)
+            if base_milestone is None:
+                extras.add(milestone_id)
+            elif not _same_milestone(base_milestone, milestone):
+                if self._conflict(DELETE_CONFLICT, milestone_id, "", "",
+                                  base_milestone, None, milestone) is not None:
+                    extras.add(milestone_id)
+        return _weave(result, theirs, extras)
+
+    def _merge_milestone(self, base: Optional[Dict], ours: Dict,
+                         theirs: Optional[Dict]) -> Optional[Dict]:
+        milestone_id = ours["id"]
+        if theirs is None:
+            if base is None:
+                return ours  # 우리가 추가
+            if _same_milestone(base, ours):
+                return None  # 상대가 삭제
+            # 상대는 삭제, 우리는 수정
+            return self._conflict(DELETE_CONFLICT, milestone_id, "", "", base, ours, None)
+        if base is None:
+            base = {}  # 양쪽이 같은 ID로 추가 - 빈 조상 기준으로 병합
+        if theirs is ours or _same_milestone(ours, theirs) or _same_milestone(base, theirs):
+            return ours
+        if _same_milestone(base, ours):
+            return theirs
+
+        header = self._merge_fields(milestone_id, "", _header(base), _header(ours), _header(theirs))
+        header["nodes"] = self._merge_nodes(milestone_id, base.get("nodes", []),
+                                            ours.get("nodes", []), theirs.get("nodes", []))
+        return header
+
+    def _merge_nodes(self, milestone_id: str, base: List[Mapping], ours: List[Mapping],
+                     theirs: List[Mapping]) -> List[Mapping]:
+        if _same_nodes(base, theirs):
+            return list(ours)
+        if _same_nodes(base, ours):
+            return list(theirs)
+        base_index = {n["id"]: n for n in base}
+        theirs_index = {n["id"]: n for n in theirs}
+        ours_ids = set()
+        result = []
+        for node in ours:
+            node_id = node["id"]
+            ours_ids.add(node_id)
+            base_node = base_index.get(node_id)
+            theirs_node = theirs_index.get(node_id)
+            if theirs_node is None:
+                if base_node is None:
+                    result.append(node)  # 우리가 추가
+                elif not _same_node(base_node, node):
+                    # 상대는 삭제, 우리는 수정
+                    kept = self._conflict(DELETE_CONFLICT, milestone_id, node_id, "",
+                                          base_node, node, None)
+                    if kept is not None:
+                        result.append(kept)
+                continue
+            if _same_node(node, theirs_node) or (base_node is not None and _same_node(base_node, theirs_node)):
+                result.append(node)
+            elif base_node is not None and _same_node(base_node, node):
+                result.append(theirs_node)
+            else:
+                result.append(self._merge_fields(milestone_id, node_id,
+                                                 base_node or {}, node, theirs_node))
+
+        extras = set()
+        for node in theirs:
+            node_id = node["id"]
+            if node_id in ours_ids:
+                continue
+            base_node = base_index.get(node_id)
+            if base_node is None:
+                extras.add(node_id)
+            elif not _same_node(base_node, node):
+                if self._conflict(DELETE_CONFLICT, milestone_id, node_id, "",
+                                  base_node, None, node) is not None:
+                    extras.add(node_id)
+        return _weave(result, theirs, extras)
+
+    def _merge_fields(self, milestone_id: str, node_id: str, base: Mapping,
+                      ours: Mapping, theirs: Mapping) -> Dict:
+        """필드 단위 3-way 병합 (양쪽이 같은 필드를 다르게 바꾸면 충돌)"""
+        result = {}
+        keys = list(ours)
+        keys.extend(k for k in theirs if k not in ours)
+        keys.extend(k for k in base if k not in ours and k not in theirs)
+        for key in keys:
+            base_value = base.get(key, _ABSENT)
+            ours_value = ours.get(key, _ABSENT)
+            theirs_value = theirs.get(key, _ABSENT)
+            if ours_value == theirs_value or theirs_value == base_value:
+                value = ours_value
+            elif ours_value == base_value:
+                value = theirs_value
+            else:
+                value = self._conflict(FIELD_CONFLICT, milestone_id, node_id, key,
+                                       base_value, ours_value, theirs_value)
+            if value is not _ABSENT:
+                result[key] = value
+        return result
+
+    def _conflict(self, kind: str, milestone_id: str, node_id: str, field: str,
+                  base: Any, ours: Any, theirs: Any) -> Any:
+        """충돌을 기록하고 선택된 쪽의 값을 그대로 반환합니다.
+
+        없는 필드는 _ABSENT로 받아 기록에는 None으로 표시하지만, 반환할 때는
+        _ABSENT 그대로 돌려주어 JSON null 값과 구분합니다.
+        """
+        conflict = MergeConflict(kind, milestone_id, node_id, field,
+                                 _present(base), _present(ours), _present(theirs))
+        self.conflicts.append(conflict)
+        return theirs if conflict.key in self.take_theirs else ours
+
+
+def _weave(result: List[Mapping], theirs: List[Mapping], extras: set) -> List[Mapping]:
+    """상대 쪽에만 있는 항목을 상대 쪽 순서에서 바로 앞에 있던 항목 뒤에 끼워 넣습니다."""
+    if not extras:
+        return result
+    result_ids = {item["id"] for item in result}
+    after: Dict[Optional[str], List[Mapping]] = {}
+    previous = None
+    for item in theirs:
+        item_id = item["id"]
+        if item_id in extras:
+            after.setdefault(previous, []).append(item)
+            previous = item_id
+        elif item_id in result_ids:
+            previous = item_id
+
+    woven = list(after.get(None, []))
+    for item in result:
+        woven.append(item)
+        chain = after.get(item["id"])
+        # 끼워 넣은 항목 뒤에 이어지는 항목도 차례로 붙임
+        while chain:
+            woven.extend(chain)
+            chain = after.get(chain[-1]["id"])
+    return woven
+
+
+def _header(milestone: Mapping) -> Dict:
+    """노드를 제외한 마일스톤 필드 (노드는 불러오지 않음)"""
+    return {k: v for k, v in dict.items(milestone) if k != "nodes"}
+
+
+def _present(value: Any) -> Any:
+    return None if value is _ABSENT else value
+
+
+def _same_milestone(a: Mapping, b: Mapping) -> bool:
+    """두 마일스톤의 헤더와 노드가 모두 같은지 확인합니다."""
+    if a is b:
+        return True
+    if _header(a) != _header(b):
+        return False
+    raw = _raw_nodes(a)
+    if raw is not None and raw == _raw_nodes(b):
+        return True
+    return _same_nodes(a.get("nodes", []), b.get("nodes", []))
+
+
+def _raw_nodes(milestone: Mapping) -> Optional[bytes]:
+    if isinstance(milestone, LazyMilestone):
+        return milestone.raw_nodes()
+    return None
+
+
+def _same_nodes(a: List[Mapping], b: List[Mapping]) -> bool:
+    if a is b:
+        return True
+    return len(a) == len(b) and all(x is y or _same_node(x, y) for x, y in zip(a, b))
+
+
+if __name__ == "__main__":
+    # 사용법: python merge.py base.json ours.json theirs.json [merged.json]
+    from storage import write_json_atomic
+
+    args = sys.argv[1:]
+    merged = merge_files(*args[:3])
+    for c in merged.conflicts:
+        print(f"충돌({c.kind}) 마일스톤 {c.milestone_id} 노드 {c.node_id or '-'} "
+              f"필드 {c.field or '-'}: 우리={c.ours!r} 상대={c.theirs!r}")
+    if len(args) > 3:
+        write_json_atomic(args[3], merged.data)
+    print(f"충돌 {len(merged.conflicts)}개")
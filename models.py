@@ -0,0 +1,153 @@
+"""데이터 모델 모듈 - 메모리를 적게 쓰는 노드 객체
+
+노드마다 같은 문자열 키를 반복해서 갖는 dict 대신 __slots__ 클래스를
+사용합니다. 도형/색상/날짜 값은 intern해서 노드끼리 공유하고, 날짜는
+불러올 때 dates.ParsedDate로 미리 해석해 둡니다. Node는 읽기 전용 Mapping이므로
+기존 코드(node.get("date"), node["id"], {**node})는 그대로 동작하며,
+to_dict()로 기존 JSON 스키마와 동일한 딕셔너리를 돌려받습니다.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from dates import ParsedDate, parse_date
+
+
+# 슬롯으로 저장하는 노드 필드 (JSON 출력 순서)
+NODE_FIELDS = ("shape", "color", "shape2", "color2", "date", "content", "memo", "attachment")
+# 값을 intern해서 노드끼리 공유하는 필드 (종류가 적고 반복되는 값)
+INTERNED_FIELDS = frozenset(("shape", "color", "shape2", "color2", "date"))
+
+_KEYS = ("id",) + NODE_FIELDS
+_KEY_SET = frozenset(_KEYS)
+
+# 필드가 원본 JSON에 없었음을 나타내는 표식 (무손실 왕복용)
+_MISSING = object()
+
+
+class Node(Mapping):
+    """타임라인 노드 하나 (읽기 전용)
+
+    DataManager는 노드를 수정하지 않고 새 객체로 교체하므로 불변으로 둡니다.
+    """
+
+    __slots__ = _KEYS + ("parsed_date", "_extra")
+
+    def __init__(self, data: Dict):
+        """
+        Args:
+            data (Dict): 기존 JSON 스키마의 노드 딕셔너리
+        """
+        set_slot = object.__setattr__
+        extra = None
+        for key, value in data.items():
+            if key in _KEY_SET:
+                if key in INTERNED_FIELDS and type(value) is str:
+                    value = sys.intern(value)
+                set_slot(self, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        for key in _KEYS:
+            if not hasattr(self, key):
+                set_slot(self, key, _MISSING)
+        set_slot(self, "_extra", extra)
+        date = self.date
+        set_slot(self, "parsed_date", parse_date(date) if type(date) is str else None)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Node":
+        """딕셔너리(또는 이미 Node인 객체)를 Node로 변환합니다."""
+        if isinstance(data, cls):
+            return data
+        return cls(data)
+
+    @property
+    def date_key(self) -> int:
+        """정렬/비교용 정수 날짜 (시작 월 서수, 해석할 수 없으면 -1)"""
+        return self.parsed_date.ordinal if self.parsed_date is not None else -1
+
+    @property
+    def span(self) -> Optional[Tuple[int, int]]:
+        """(시작 월 서수, 끝 월 서수), 날짜를 해석할 수 없으면 None"""
+        parsed = self.parsed_date
+        return (parsed.ordinal, parsed.last) if parsed is not None else None
+
+    def to_dict(self) -> Dict:
+        """기존 JSON 스키마와 같은 딕셔너리로 변환합니다."""
+        result = {}
+        for key in _KEYS:
+            value = getattr(self, key)
+            if value is not _MISSING:
+                result[key] = value
+        if self._extra:
+            result.update(self._extra)
+        return result
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _KEY_SET:
+            value = getattr(self, key)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _KEY_SET:
+            value = getattr(self, key)
+            return default if value is _MISSING else value
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        if key in _KEY_SET:
+            return getattr(self, key) is not _MISSING
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for key in _KEYS:
+            if getattr(self, key) is not _MISSING:
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        count = sum(1 for key in _KEYS if getattr(self, key) is not _MISSING)
+        return count + (len(self._extra) if self._extra else 0)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Node는 수정할 수 없습니다 (새 Node로 교체하세요)")
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (Node, (self.to_dict(),))
+
+    def __repr__(self) -> str:
+        return f"Node({self.to_dict()!r})"
+
+
+def node_date(node: Mapping) -> Optional[ParsedDate]:
+    """노드의 해석된 날짜를 반환합니다 (Node는 미리 해석된 값을 사용).
+
+    Args:
+        node (Mapping): Node 또는 노드 딕셔너리
+
+    Returns:
+        Optional[ParsedDate]: 해석된 날짜, 해석할 수 없으면 None
+    """
+    if isinstance(node, Node):
+        return node.parsed_date
+    return parse_date(node.get("date", ""))
+
+
+def to_json(obj: Any) -> Any:
+    """json.dump의 default 훅 - 모델 객체를 JSON 스키마 딕셔너리로 변환합니다."""
+    if isinstance(obj, Node):
+        return obj.to_dict()
+    raise TypeError(f"JSON으로 변환할 수 없는 객체입니다: {type(obj).__name__}")
@@ -0,0 +1,263 @@
+"""검색 쿼리 모듈 - 필드 검색어의 파서와 선택도 순 실행 계획
+
+한 줄 쿼리로 여러 조건을 함께 검색합니다 (모든 조건은 AND).
+
+    shape:★ date:24.Q3..25.Q1 content:반입 -category:R&D
+
+- 필드: shape(모양), color(색상), date(날짜, YY / YY.MM / YY.Qn 또는 범위 A..B),
+  category(카테고리), title(제목/부제목), content(노드 내용), id(마일스톤 ID).
+  필드 없이 쓴 단어는 제목/부제목 또는 노드 내용에서 찾습니다.
+- 앞에 -를 붙이면 조건을 뒤집고, 공백이 들어간 값은 "..."로 묶습니다.
+
+실행 계획은 DataManager가 유지하는 색인(패싯 비트셋, 날짜 색인, 텍스트 역색인)으로
+각 조건이 걸러낼 마일스톤 수를 추정해 적은 것부터 실행합니다. 남은 후보가 다음
+조건의 추정치보다 충분히 적으면 색인을 조회하지 않고 후보만 직접 확인합니다.
+"""
+
+import re
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from dates import month_span
+from facet_index import CATEGORY, COLOR, QUARTER, SHAPE
+from models import node_date
+from text_index import normalize
+
+# 필드 이름 (한글 별칭 포함)
+FIELDS = {
+    "shape": "shape", "모양": "shape",
+    "color": "color", "색상": "color",
+    "date": "date", "날짜": "date",
+    "category": "category", "카테고리": "category",
+    "title": "title", "제목": "title",
+    "content": "content", "내용": "content",
+    "id": "id",
+}
+TEXT = "text"  # 필드 없이 쓴 단어
+
+# 후보를 직접 확인하는 비용 (색인 조회로 찾는 마일스톤 하나 대비)
+VERIFY_COST = 8
+
+# 날짜 범위의 열린 끝 (A.. 또는 ..B)
+_MIN_ORDINAL = 0
+_MAX_ORDINAL = 100 * 12 - 1
+
+_TOKEN = re.compile(r'(-?)(?:([^\s:"]+):)?(?:"([^"]*)"|(\S+))')
+
+
+class Term(NamedTuple):
+    """쿼리 조건 하나"""
+
+    field: str
+    value: str
+    negated: bool = False
+
+
+def parse_query(text: str) -> List[Term]:
+    """쿼리 문자열을 조건 리스트로 해석합니다.
+
+    Args:
+        text (str): 쿼리 문자열
+
+    Returns:
+        List[Term]: 조건 리스트
+
+    Raises:
+        ValueError: 알 수 없는 필드, 빈 값, 잘못된 날짜가 있는 경우
+    """
+    terms = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        if text[position].isspace():
+            position += 1
+            continue
+        match = _TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"위치 {position}의 쿼리를 해석할 수 없습니다: {text[position:]}")
+        position = match.end()
+        negated, name, quoted, bare = match.groups()
+        value = quoted if quoted is not None else bare
+        if name is None:
+            if value.endswith(":") and value[:-1].lower() in FIELDS:
+                raise ValueError(f"'{value}' 뒤에 검색할 값이 없습니다.")
+            field = TEXT
+        else:
+            field = FIELDS.get(name.lower())
+            if field is None:
+                raise ValueError(f"알 수 없는 필드입니다: {name}")
+        if not value:
+            raise ValueError(f"'{name or ''}:' 뒤에 검색할 값이 없습니다.")
+        if field == "date":
+            date_range(value)  # 형식 검증
+        terms.append(Term(field, value, bool(negated)))
+    return terms
+
+
+def date_range(value: str) -> Tuple[int, int]:
+    """날짜 조건 값의 (시작 월 서수, 끝 월 서수)
+
+    Args:
+        value (str): YY, YY.MM, YY.Qn 또는 A..B (양쪽 끝은 생략 가능)
+
+    Returns:
+        Tuple[int, int]: 월 서수 범위
+
+    Raises:
+        ValueError: 해석할 수 없는 날짜인 경우
+    """
+    if ".." in value:
+        start, end = value.split("..", 1)
+        first = _date_bounds(start)[0] if start else _MIN_ORDINAL
+        last = _date_bounds(end)[1] if end else _MAX_ORDINAL
+        if first > last:
+            raise ValueError(f"날짜 범위의 시작이 끝보다 늦습니다: {value}")
+        return (first, last)
+    return _date_bounds(value)
+
+
+def _date_bounds(value: str) -> Tuple[int, int]:
+    value = value.strip()
+    if value.isdigit() and len(value) in (2, 4):
+        year = int(value) % 100
+        return (year * 12, year * 12 + 11)
+    span = month_span(value)
+    if span is None:
+        raise ValueError(f"날짜 형식이 올바르지 않습니다: {value} (예: 24, 24.07, 24.Q3)")
+    return span
+
+
+class QueryStage(NamedTuple):
+    """실행 계획의 단계 하나"""
+
+    term: Term
+    estimate: int  # 이 조건을 만족할 것으로 추정되는 마일스톤 수
+    lookup: Callable[[], Set[str]]  # 색인으로 만족하는 마일스톤 ID 조회
+    test: Callable[[Dict], bool]  # 마일스톤 하나를 직접 확인
+
+
+class QueryPlan:
+    """선택도(추정 마일스톤 수) 순으로 정렬된 쿼리 실행 계획"""
+
+    def __init__(self, stages: List[QueryStage], data_manager):
+        self.stages = sorted(stages, key=lambda stage: stage.estimate)
+        self.data_manager = data_manager
+
+    def execute(self) -> Set[str]:
+        """모든 조건을 만족하는 마일스톤 ID 집합을 구합니다."""
+        if not self.stages:
+            return {m["id"] for m in self.data_manager.get_milestones()}
+        get_milestone = self.data_manager.get_milestone
+        candidates: Optional[Set[str]] = None
+        for stage in self.stages:
+            if candidates is not None and len(candidates) * VERIFY_COST <= stage.estimate:
+                # 남은 후보가 적으면 색인을 조회하지 않고 후보만 확인
+                candidates = {milestone_id for milestone_id in candidates
+                              if stage.test(get_milestone(milestone_id))}
+            else:
+                ids = stage.lookup()
+                candidates = set(ids) if candidates is None else candidates & ids
+            if not candidates:
+                break
+        return candidates
+
+    def describe(self) -> List[str]:
+        """실행 순서대로 단계 설명 (추정 마일스톤 수 포함)"""
+        return [f"{'-' if stage.term.negated else ''}{stage.term.field}:{stage.term.value}"
+                f" (~{stage.estimate})" for stage in self.stages]
+
+
+def plan_query(terms: List[Term], data_manager) -> QueryPlan:
+    """조건마다 색인 조회/직접 확인 방법과 추정치를 정해 실행 계획을 만듭니다.
+
+    Args:
+        terms (List[Term]): parse_query()로 해석한 조건
+        data_manager (DataManager): 색인을 가진 데이터 관리자
+
+    Returns:
+        QueryPlan: 실행 계획
+    """
+    total = len(data_manager.get_milestones())
+    stages = []
+    for term in terms:
+        estimate, lookup, test = _plan_term(term, data_manager)
+        estimate = min(estimate, total)
+        if term.negated:
+            estimate = total - estimate
+            lookup = _complement(lookup, data_manager)
+            test = (lambda test: lambda milestone: not test(milestone))(test)
+        stages.append(QueryStage(term, estimate, lookup, test))
+    return QueryPlan(stages, data_manager)
+
+
+def query_test(terms: List[Term], data_manager) -> Callable[[Dict], bool]:
+    """모든 조건을 마일스톤 하나에 직접 확인하는 함수 (색인을 조회하지 않음)
+
+    Args:
+        terms (List[Term]): parse_query()로 해석한 조건
+        data_manager (DataManager): 색인을 가진 데이터 관리자
+
+    Returns:
+        Callable[[Dict], bool]: 마일스톤이 모든 조건을 만족하는지 확인하는 함수
+    """
+    tests = [stage.test for stage in plan_query(terms, data_manager).stages]
+    return lambda milestone: all(test(milestone) for test in tests)
+
+
+def _plan_term(term: Term, data_manager) -> Tuple[int, Callable[[], Set[str]], Callable[[Dict], bool]]:
+    """조건 하나의 (추정 마일스톤 수, 색인 조회 함수, 직접 확인 함수)"""
+    facets = data_manager.facet_index
+    field = term.field
+    if field in ("shape", "color", "category"):
+        facet, matches = _facet_matcher(field, term.value)
+        bits = facets.value_bits(facet, matches)
+        if facet == CATEGORY:
+            test = lambda milestone: matches(milestone.get("category", ""))
+        else:
+            test = lambda milestone: any(matches(node.get(facet, ""))
+                                         for node in milestone.get("nodes", []))
+        return bits.bit_count(), lambda: facets.milestone_ids(bits), test
+    if field == "date":
+        first, last = date_range(term.value)
+        # 범위에 걸친 분기 비트셋의 합 - 분기 경계에 맞으면 정확, 아니면 상한
+        quarters = range(first // 3, last // 3 + 1)
+        bits = facets.value_bits(QUARTER, lambda value: value[0] * 4 + value[1] - 1 in quarters)
+        return (bits.bit_count(),
+                lambda: data_manager.milestone_ids_in_month_range(first, last),
+                lambda milestone: any((parsed := node_date(node)) is not None
+                                      and parsed.overlaps(first, last)
+                                      for node in milestone.get("nodes", [])))
+    if field == "id":
+        exists = data_manager.get_milestone(term.value) is not None
+        return (int(exists), lambda: {term.value} if exists else set(),
+                lambda milestone: milestone["id"] == term.value)
+    text = normalize(term.value)
+    title_test = lambda milestone: text in normalize(
+        milestone.get("title", "") + "\x00" + milestone.get("subtitle", ""))
+    content_test = lambda milestone: any(text in normalize(node.get("content", ""))
+                                         for node in milestone.get("nodes", []))
+    if field == "title":
+        bits = facets.keyword_bits(text)
+        return bits.bit_count(), lambda: facets.milestone_ids(bits), title_test
+    content_estimate = data_manager.text_index.estimate_contents(text)
+    content_lookup = lambda: data_manager.milestone_ids_with_content(text)
+    if field == "content":
+        return content_estimate, content_lookup, content_test
+    # 필드 없는 단어 - 제목/부제목 또는 노드 내용
+    bits = facets.keyword_bits(text)
+    return (max(bits.bit_count(), content_estimate),
+            lambda: facets.milestone_ids(bits) | content_lookup(),
+            lambda milestone: title_test(milestone) or content_test(milestone))
+
+
+def _facet_matcher(field: str, value: str) -> Tuple[str, Callable[[str], bool]]:
+    """패싯 이름과 값 비교 함수 (모양은 기호나 이름 일부, 나머지는 대소문자 무시 일치)"""
+    if field == "shape":
+        return SHAPE, lambda shape: value in shape
+    folded = value.casefold()
+    facet = COLOR if field == "color" else CATEGORY
+    return facet, lambda candidate: candidate.casefold() == folded
+
+
+def _complement(lookup: Callable[[], Set[str]], data_manager) -> Callable[[], Set[str]]:
+    """조건을 뒤집은 조회 함수 (전체 마일스톤에서 제외)"""
+    return lambda: {m["id"] for m in data_manager.get_milestones()} - lookup()
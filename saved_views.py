@@ -0,0 +1,153 @@
+"""저장된 보기 모듈 - 이름을 붙여 저장한 필터와 증분 유지되는 결과
+
+자주 쓰는 filter_settings에 이름을 붙여 데이터 파일 옆(raw.json.views)에
+저장합니다. 보기마다 컴파일된 필터(FilterPlan)와 결과 마일스톤 ID 집합을
+유지하므로 보기를 바꾸거나 보기 이름 옆의 개수를 표시할 때 다시 필터링하지
+않습니다.
+
+- 결과는 보기를 처음 조회할 때 색인으로 한 번 구합니다.
+- 이후에는 DataManager가 트랜잭션마다 바뀐 마일스톤만 알려 주고, 보기마다
+  그 마일스톤만 조건을 직접 확인해 결과 집합에 넣거나 뺍니다.
+- 불러오기나 전체 교체처럼 데이터가 통째로 바뀌면 결과를 버리고 다음 조회 때
+  다시 구합니다 (보기 정의는 유지).
+
+이번달 일정 필터는 저장할 때의 연도/월을 그대로 사용합니다.
+"""
+
+import json
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from filter_plan import FilterPlan
+from storage import write_json_atomic
+
+VIEWS_VERSION = 1
+
+
+class SavedViews:
+    """이름 → 저장된 필터 (결과는 트랜잭션마다 증분 갱신)"""
+
+    def __init__(self):
+        self._path = ""
+        self._data_manager = None
+        self._settings: "OrderedDict[str, Dict]" = OrderedDict()  # 이름 → 필터 설정
+        self._plans: Dict[str, FilterPlan] = {}  # 이름 → 컴파일된 필터 (결과 보관)
+        self._loaded = False
+
+    def reset(self, path: str, data_manager) -> None:
+        """보관한 결과를 버립니다 (다음 조회 때 전체 데이터로 다시 구함).
+
+        Args:
+            path (str): 보기 정의를 저장할 파일 경로
+            data_manager (DataManager): 필터를 컴파일할 데이터 관리자
+        """
+        if path != self._path:
+            self._settings = OrderedDict()
+            self._loaded = False
+        self._path = path
+        self._data_manager = data_manager
+        self._plans = {}
+
+    def update(self, milestone_ids: Iterable[str],
+               get_milestone: Callable[[str], Optional[Dict]]) -> None:
+        """바뀐 마일스톤만 다시 확인해 보기별 결과를 갱신합니다.
+
+        Args:
+            milestone_ids (Iterable[str]): 바뀐 마일스톤 ID
+            get_milestone (Callable): ID로 현재 마일스톤을 찾는 함수
+        """
+        milestone_ids = list(milestone_ids)
+        for plan in self._plans.values():
+            plan.update(milestone_ids, get_milestone)
+
+    def names(self) -> List[str]:
+        """저장된 보기 이름 (저장한 순서)"""
+        self._ensure_loaded()
+        return list(self._settings)
+
+    def settings(self, name: str) -> Optional[Dict]:
+        """보기의 필터 설정 사본 (없으면 None)"""
+        self._ensure_loaded()
+        settings = self._settings.get(name)
+        return dict(settings) if settings is not None else None
+
+    def plan(self, name: str) -> Optional[FilterPlan]:
+        """보기의 컴파일된 필터 (결과 ID 집합을 계속 유지함, 없으면 None)"""
+        self._ensure_loaded()
+        settings = self._settings.get(name)
+        if settings is None:
+            return None
+        plan = self._plans.get(name)
+        if plan is None:
+            plan = FilterPlan.compile(settings, self._data_manager)
+            self._plans[name] = plan
+        return plan
+
+    def milestone_ids(self, name: str) -> Optional[Set[str]]:
+        """보기 결과의 마일스톤 ID 집합 (읽기 전용, 조건이 없거나 보기가 없으면 None)"""
+        plan = self.plan(name)
+        return plan.milestone_ids() if plan is not None else None
+
+    def count(self, name: str) -> int:
+        """보기 결과의 마일스톤 수"""
+        plan = self.plan(name)
+        if plan is None:
+            return 0
+        ids = plan.milestone_ids()
+        return len(self._data_manager.get_milestones()) if ids is None else len(ids)
+
+    def save_view(self, name: str, settings: Dict) -> None:
+        """필터 설정을 이름으로 저장합니다 (같은 이름이 있으면 덮어씀).
+
+        Args:
+            name (str): 보기 이름
+            settings (Dict): 필터 설정
+
+        Raises:
+            ValueError: 이름이 비어 있는 경우
+        """
+        name = name.strip()
+        if not name:
+            raise ValueError("보기 이름을 입력하세요.")
+        self._ensure_loaded()
+        self._settings[name] = dict(settings)
+        self._plans.pop(name, None)
+        self._write()
+
+    def delete_view(self, name: str) -> bool:
+        """보기를 삭제합니다.
+
+        Returns:
+            bool: 삭제 여부 (없는 보기면 False)
+        """
+        self._ensure_loaded()
+        if self._settings.pop(name, None) is None:
+            return False
+        self._plans.pop(name, None)
+        self._write()
+        return True
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self._path or not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(saved, dict) or saved.get("version") != VIEWS_VERSION:
+            return
+        for view in saved.get("views", []):
+            if isinstance(view, dict) and view.get("name") and isinstance(view.get("settings"), dict):
+                self._settings[view["name"]] = view["settings"]
+
+    def _write(self) -> None:
+        write_json_atomic(self._path, {
+            "version": VIEWS_VERSION,
+            "views": [{"name": name, "settings": settings}
+                      for name, settings in self._settings.items()],
+        })
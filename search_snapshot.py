@@ -0,0 +1,171 @@
+"""검색 스냅샷 모듈 - 빠른 검색(live_search.py)이 작업 스레드에서 읽는 텍스트 사본
+
+작업 스레드는 GUI 스레드가 고치는 데이터를 직접 읽지 않고, 데이터 버전 하나의
+읽기 전용 스냅샷(SearchSnapshot)만 읽습니다.
+
+- SnapshotTracker는 변경 알림마다 바뀐 마일스톤의 얕은 사본만 다음 버전의
+  빌드(SnapshotBuild)에 모아 둡니다. 검색을 시작할 때는 현재 빌드를 넘기기만
+  하므로 GUI 스레드의 비용은 글자마다 O(1)입니다.
+- 빌드는 작업 스레드에서 처음 필요할 때 이전 빌드의 스냅샷에 바뀐 마일스톤만
+  반영해 새 스냅샷을 만듭니다. 알림 없이 데이터가 바뀌었으면(불러오기, 전체
+  교체) 전체 마일스톤의 얕은 사본으로 새로 만듭니다.
+"""
+
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import events
+from data_manager import DataManager, snapshot_milestone
+from text_index import normalize
+
+# 결과를 나눠 보낼 마일스톤 수
+CHUNK_SIZE = 256
+
+# 여러 필드를 이어 붙일 때의 구분자 - 검색어가 필드 경계를 넘어 일치하지 않도록
+_SEPARATOR = "\x00"
+
+
+class SearchSnapshot:
+    """검색용 마일스톤 텍스트의 읽기 전용 스냅샷 (만든 뒤에는 바꾸지 않음)"""
+
+    def __init__(self, order: Tuple[str, ...], texts: Dict[str, str]):
+        self.order = order  # 데이터 순서의 마일스톤 ID
+        self.texts = texts  # 마일스톤 ID → 정규화된 제목/부제목/노드 내용
+
+    @classmethod
+    def build(cls, milestones: Iterable[Dict]) -> "SearchSnapshot":
+        """전체 데이터로 스냅샷을 만듭니다."""
+        texts = {milestone["id"]: search_text(milestone) for milestone in milestones}
+        return cls(tuple(texts), texts)
+
+    def with_changes(self, milestones: Dict[str, Optional[Dict]],
+                     order: Optional[Tuple[str, ...]] = None) -> "SearchSnapshot":
+        """바뀐 마일스톤만 다시 만든 새 스냅샷을 반환합니다 (자신은 그대로).
+
+        Args:
+            milestones (Dict[str, Optional[Dict]]): 바뀐 마일스톤 ID → 마일스톤 사본
+                (삭제되었으면 None)
+            order (Optional[Tuple[str, ...]]): 바뀐 데이터 순서 (None이면 그대로)
+
+        Returns:
+            SearchSnapshot: 새 스냅샷
+        """
+        texts = dict(self.texts)
+        for milestone_id, milestone in milestones.items():
+            if milestone is None:
+                texts.pop(milestone_id, None)
+            else:
+                texts[milestone_id] = search_text(milestone)
+        return SearchSnapshot(self.order if order is None else order, texts)
+
+    def matching_chunks(self, words: List[str],
+                        allowed: Optional[AbstractSet[str]] = None) -> Iterator[List[str]]:
+        """단어가 모두 포함된 마일스톤 ID를 CHUNK_SIZE개씩 검사하며 묶음으로 생성합니다.
+
+        묶음 사이에서 멈출 수 있도록 일치하는 것이 없는 묶음은 빈 리스트로 생성합니다.
+
+        Args:
+            words (List[str]): 정규화된 검색 단어
+            allowed (Optional[AbstractSet[str]]): 검색할 마일스톤 ID (None이면 전체)
+
+        Yields:
+            List[str]: 묶음에서 일치한 마일스톤 ID (데이터 순서)
+        """
+        texts = self.texts
+        order = self.order
+        for start in range(0, len(order), CHUNK_SIZE):
+            yield [milestone_id for milestone_id in order[start:start + CHUNK_SIZE]
+                   if (allowed is None or milestone_id in allowed)
+                   and all(word in texts[milestone_id] for word in words)]
+
+
+class SnapshotBuild:
+    """데이터 버전 하나의 스냅샷을 만드는 방법 - 작업 스레드에서 처음 필요할 때 만듦
+
+    전체 데이터의 얕은 사본으로 새로 만들거나 이전 빌드의 스냅샷에서 시작해,
+    바뀐 마일스톤의 사본을 반영합니다. 작업 스레드는 하나뿐이므로 동시에 만들지
+    않으며, 작업에 넘긴(shared) 뒤에는 GUI 스레드가 고치지 않습니다.
+    """
+
+    def __init__(self, version: int, base: Optional["SnapshotBuild"] = None,
+                 milestones: Optional[List[Dict]] = None):
+        self.version = version
+        self.base = base
+        self.milestones = milestones  # 새로 만들 때의 전체 마일스톤 사본
+        self.changes: Dict[str, Optional[Dict]] = {}  # base 이후 바뀐 마일스톤 사본
+        self.order: Optional[Tuple[str, ...]] = None  # base 이후 바뀐 데이터 순서
+        self.snapshot: Optional[SearchSnapshot] = None
+        self.shared = False  # 작업에 넘겼는지 여부
+
+    def get(self) -> SearchSnapshot:
+        """스냅샷을 (필요하면 만들어) 반환합니다 - 작업 스레드에서 호출"""
+        if self.snapshot is None:
+            if self.base is None:
+                snapshot = SearchSnapshot.build(self.milestones or ())
+            else:
+                snapshot = self.base.get()
+            if self.changes or self.order is not None:
+                snapshot = snapshot.with_changes(self.changes, self.order)
+            self.snapshot = snapshot
+            # 만든 뒤에는 이전 빌드와 사본을 놓아 메모리를 돌려줌
+            self.base = self.milestones = None
+            self.changes = {}
+        return self.snapshot
+
+
+class SnapshotTracker:
+    """데이터 변경을 따라가며 현재 버전의 스냅샷 빌드를 유지 (GUI 스레드에서 사용)"""
+
+    def __init__(self, data_manager: DataManager):
+        """
+        Args:
+            data_manager (DataManager): 변경 알림을 받을 데이터 매니저
+        """
+        self.data_manager = data_manager
+        # 현재 데이터 버전의 스냅샷 빌드 (데이터가 바뀔 때 교체)
+        self._build: Optional[SnapshotBuild] = None
+        data_manager.subscribe(self._on_data_changed)
+
+    def current(self) -> SnapshotBuild:
+        """현재 데이터 버전의 스냅샷 빌드 (작업에 넘길 수 있도록 shared로 표시)
+
+        변경 알림으로 버전을 따라왔으면 O(1)입니다. 불러오기/전체 교체처럼 알림
+        없이 바뀐 경우에만 전체 마일스톤의 얕은 사본(파싱하지 않음)을 만듭니다.
+        """
+        version = self.data_manager.version
+        if self._build is None or self._build.version != version:
+            self._build = SnapshotBuild(version, milestones=[
+                snapshot_milestone(milestone) for milestone in self.data_manager.get_milestones()])
+        self._build.shared = True
+        return self._build
+
+    def _on_data_changed(self, changes) -> None:
+        """변경 알림 - 바뀐 마일스톤의 사본을 다음 버전의 빌드에 모아 둠"""
+        version = self.data_manager.version
+        build = self._build
+        if build is None or build.version != version - 1:
+            self._build = None  # 알림 없이 바뀐 적이 있으면 다음 검색 때 새로 만듦
+            return
+        if build.shared:
+            following = SnapshotBuild(version, base=build)
+        else:
+            # 작업에 넘기지 않은 빌드는 그대로 고침 (검색 없이 편집만 이어질 때 빌드가 쌓이지 않음)
+            following = build
+            following.version = version
+        get_milestone = self.data_manager.get_milestone
+        for change in changes:
+            if change.kind == events.KEYWORDS_CHANGED:
+                continue
+            milestone = get_milestone(change.milestone_id)
+            following.changes[change.milestone_id] = (
+                snapshot_milestone(milestone) if milestone is not None else None)
+            if change.kind in events.MILESTONE_EVENTS:
+                # 추가/삭제/이동은 순서가 바뀜 - ID 순서만 기록
+                following.order = tuple(m["id"] for m in self.data_manager.get_milestones())
+        self._build = following
+
+
+def search_text(milestone: Dict) -> str:
+    """마일스톤의 검색 텍스트 (정규화된 제목/부제목/노드 내용)"""
+    parts = [milestone.get("title", ""), milestone.get("subtitle", "")]
+    parts.extend(node.get("content", "") for node in milestone.get("nodes", []))
+    return normalize(_SEPARATOR.join(parts))
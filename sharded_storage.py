@@ -0,0 +1,201 @@
+"""분할 저장소 백엔드 모듈 - 마일스톤마다 파일 하나 + 매니페스트
+
+raw.shards/
+    manifest.json          마일스톤 순서와 헤더, 키워드, 카테고리 인덱스
+    milestones/<id>.json   마일스톤 하나의 노드 배열
+
+저장할 때는 변경 레코드가 건드린 마일스톤의 파일과 (필요하면) 매니페스트만
+다시 쓰므로, 노드 하나를 고쳐도 전체 데이터를 직렬화하지 않습니다.
+불러올 때는 매니페스트만 읽고 각 마일스톤의 노드 파일은 처음 접근할 때
+읽습니다. raw.json에서 옮겨 올 때는 migrate_json_to_shards()를 사용합니다.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from json_stream import LazyMilestone
+from storage import StorageBackend, file_signature, migrate_storage, write_json_atomic
+
+
+MANIFEST_VERSION = 1
+
+# 파일 이름으로 그대로 쓸 수 있는 ID (그 외에는 해시로 변환)
+_SAFE_ID = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+# 노드 파일(shard)만 다시 쓰면 되는 레코드
+_SHARD_OPS = ("add_node", "update_node", "delete_node")
+
+
+class ShardedStorage(StorageBackend):
+    """마일스톤별 파일로 나누어 저장하는 백엔드"""
+
+    def __init__(self, filename: str = "raw.shards"):
+        """
+        Args:
+            filename (str): 저장소 디렉터리 경로
+        """
+        self.filename = filename
+        self.manifest_filename = os.path.join(filename, "manifest.json")
+        self.shard_directory = os.path.join(filename, "milestones")
+        self._categories: Dict[str, List[str]] = {}
+
+    def signature(self) -> Tuple:
+        # 노드 파일은 rename으로 교체되므로 디렉터리 수정 시각이 함께 바뀜
+        return (file_signature(self.manifest_filename), file_signature(self.shard_directory))
+
+    def exists(self) -> bool:
+        return os.path.exists(self.manifest_filename)
+
+    def load(self, on_milestone: Optional[Callable[[Dict], None]] = None) -> Tuple[Dict, List[Dict]]:
+        if not self.exists():
+            return {"milestones": [], "keywords": []}, []
+        with open(self.manifest_filename, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        self._categories = manifest.get("categories", {})
+
+        data = dict(manifest.get("fields", {}))
+        milestones = []
+        for header in manifest.get("milestones", []):
+            milestone = LazyMilestone(header, self._node_loader(header["id"]))
+            milestones.append(milestone)
+            if on_milestone is not None:
+                on_milestone(milestone)
+        data["milestones"] = milestones
+        data["keywords"] = manifest.get("keywords", [])
+        return data, []
+
+    def save(self, data: Dict, records: List[Dict]) -> None:
+        if not records:
+            return
+        dirty_shards: Set[str] = set()
+        deleted_shards: Set[str] = set()
+        manifest_dirty = False
+        for record in records:
+            op = record.get("op")
+            if op in _SHARD_OPS:
+                dirty_shards.add(record["milestone_id"])
+            elif op == "add_milestone":
+                dirty_shards.add(record["milestone"]["id"])
+                deleted_shards.discard(record["milestone"]["id"])
+                manifest_dirty = True
+            elif op == "delete_milestone":
+                dirty_shards.discard(record["id"])
+                deleted_shards.add(record["id"])
+                manifest_dirty = True
+            else:
+                manifest_dirty = True
+
+        os.makedirs(self.shard_directory, exist_ok=True)
+        if dirty_shards:
+            for milestone in data.get("milestones", []):
+                if milestone.get("id") in dirty_shards:
+                    self._write_shard(milestone)
+        # 노드 파일을 먼저 쓰고 매니페스트를 나중에 교체해야
+        # 중단되더라도 매니페스트가 없는 파일을 가리키지 않음
+        if manifest_dirty:
+            self._write_manifest(data)
+        for milestone_id in deleted_shards:
+            self._remove_shard(milestone_id)
+
+    def compact(self, data: Dict) -> None:
+        os.makedirs(self.shard_directory, exist_ok=True)
+        shard_names = set()
+        for milestone in data.get("milestones", []):
+            self._write_shard(milestone)
+            shard_names.add(os.path.basename(self._shard_filename(milestone["id"])))
+        self._write_manifest(data)
+        for name in os.listdir(self.shard_directory):
+            if name.endswith(".json") and name not in shard_names:
+                os.remove(os.path.join(self.shard_directory, name))
+
+    def milestone_ids_in_category(self, category: str) -> List[str]:
+        """매니페스트의 카테고리 인덱스로 마일스톤 ID를 조회합니다.
+
+        Args:
+            category (str): 카테고리 이름
+
+        Returns:
+            List[str]: 해당 카테고리의 마일스톤 ID (마일스톤 순서)
+        """
+        return list(self._categories.get(category, []))
+
+    def _node_loader(self, milestone_id: str) -> Callable[[], List[Dict]]:
+        """마일스톤의 노드를 처음 접근할 때 읽는 로더를 만듭니다."""
+        return lambda: self.load_nodes(milestone_id)
+
+    def load_nodes(self, milestone_id: str) -> List[Dict]:
+        """마일스톤의 노드 파일을 읽습니다.
+
+        Args:
+            milestone_id (str): 마일스톤 ID
+
+        Returns:
+            List[Dict]: 노드 리스트 (파일이 없으면 빈 리스트)
+        """
+        try:
+            with open(self._shard_filename(milestone_id), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+    def _shard_filename(self, milestone_id: str) -> str:
+        """마일스톤 ID에 해당하는 노드 파일 경로를 반환합니다."""
+        if _SAFE_ID.fullmatch(milestone_id):
+            name = milestone_id
+        else:
+            name = hashlib.sha1(milestone_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.shard_directory, name + ".json")
+
+    def _write_shard(self, milestone: Dict) -> None:
+        write_json_atomic(self._shard_filename(milestone["id"]), milestone.get("nodes", []))
+
+    def _remove_shard(self, milestone_id: str) -> None:
+        try:
+            os.remove(self._shard_filename(milestone_id))
+        except FileNotFoundError:
+            pass
+
+    def _write_manifest(self, data: Dict) -> None:
+        """마일스톤 순서와 헤더, 키워드, 카테고리 인덱스를 기록합니다.
+
+        LazyMilestone의 헤더는 dict.items로 읽으므로 노드를 불러오지 않습니다.
+        """
+        headers = []
+        categories: Dict[str, List[str]] = {}
+        for milestone in data.get("milestones", []):
+            header = {k: v for k, v in dict.items(milestone) if k != "nodes"}
+            headers.append(header)
+            categories.setdefault(header.get("category", ""), []).append(header["id"])
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "milestones": headers,
+            "keywords": data.get("keywords", []),
+            "categories": categories,
+            "fields": {k: v for k, v in data.items() if k not in ("milestones", "keywords")},
+        }
+        write_json_atomic(self.manifest_filename, manifest)
+        self._categories = categories
+
+
+def migrate_json_to_shards(json_filename: str = "raw.json", shard_directory: str = "raw.shards") -> int:
+    """raw.json(및 저널)의 데이터를 분할 저장소로 옮깁니다.
+
+    Args:
+        json_filename (str): 원본 JSON 파일 경로
+        shard_directory (str): 생성할 저장소 디렉터리 (.shards로 끝나야 함)
+
+    Returns:
+        int: 옮긴 마일스톤 개수
+    """
+    return migrate_storage(json_filename, shard_directory)
+
+
+if __name__ == "__main__":
+    # 사용법: python sharded_storage.py [raw.json] [raw.shards]
+    args = sys.argv[1:]
+    count = migrate_json_to_shards(*args[:2])
+    print(f"{count}개의 마일스톤을 옮겼습니다.")
@@ -0,0 +1,322 @@
+"""SQLite 저장소 백엔드 모듈 - 마일스톤/노드/키워드를 인덱스가 있는 테이블로 관리
+
+변경 레코드 하나가 행 단위 SQL 문으로 바로 반영되므로, 편집할 때마다
+파일 전체를 다시 쓰지 않습니다. raw.json에서 옮겨 올 때는
+migrate_json_to_sqlite()를 사용합니다.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from json_stream import LazyMilestone
+from dates import month_span
+from storage import StorageBackend, file_signature, migrate_storage
+
+
+# 테이블 컬럼으로 저장하는 필드 (그 외 필드는 extra 컬럼에 JSON으로 보관)
+MILESTONE_FIELDS = ("title", "subtitle", "category")
+NODE_FIELDS = ("shape", "color", "shape2", "color2", "date", "content", "memo", "attachment")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS milestones (
+    id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    title TEXT,
+    subtitle TEXT,
+    category TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_milestones_position ON milestones(position);
+CREATE INDEX IF NOT EXISTS idx_milestones_category ON milestones(category);
+
+CREATE TABLE IF NOT EXISTS nodes (
+    id TEXT PRIMARY KEY,
+    milestone_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    shape TEXT,
+    color TEXT,
+    shape2 TEXT,
+    color2 TEXT,
+    date TEXT,
+    content TEXT,
+    memo TEXT,
+    attachment TEXT,
+    month_start INTEGER,
+    month_end INTEGER,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_nodes_milestone ON nodes(milestone_id, position);
+CREATE INDEX IF NOT EXISTS idx_nodes_month ON nodes(month_start, month_end);
+CREATE INDEX IF NOT EXISTS idx_nodes_shape ON nodes(shape);
+
+CREATE TABLE IF NOT EXISTS keywords (
+    position INTEGER NOT NULL,
+    keyword TEXT PRIMARY KEY
+);
+"""
+
+
+class SqliteStorage(StorageBackend):
+    """sqlite3 기반 저장소 백엔드"""
+
+    writes_immediately = True
+
+    def __init__(self, filename: str = "raw.db"):
+        """
+        Args:
+            filename (str): SQLite 데이터베이스 파일 경로
+        """
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """연결을 열고 스키마를 준비합니다 (최초 1회)."""
+        if self._connection is None:
+            connection = sqlite3.connect(self.filename, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def signature(self) -> Tuple:
+        # WAL 모드에서는 커밋이 먼저 -wal 파일에 기록됨
+        return (file_signature(self.filename), file_signature(self.filename + "-wal"))
+
+    def exists(self) -> bool:
+        return os.path.exists(self.filename)
+
+    def load(self, on_milestone: Optional[Callable[[Dict], None]] = None) -> Tuple[Dict, List[Dict]]:
+        with self._lock:
+            connection = self._connect()
+            rows = connection.execute(
+                "SELECT id, title, subtitle, category, extra FROM milestones ORDER BY position"
+            ).fetchall()
+            keywords = [row[0] for row in connection.execute(
+                "SELECT keyword FROM keywords ORDER BY position")]
+        milestones = []
+        for milestone_id, title, subtitle, category, extra in rows:
+            header = {"id": milestone_id}
+            for field, value in zip(MILESTONE_FIELDS, (title, subtitle, category)):
+                if value is not None:
+                    header[field] = value
+            if extra:
+                header.update(json.loads(extra))
+            milestone = LazyMilestone(header, self._node_loader(milestone_id))
+            milestones.append(milestone)
+            if on_milestone is not None:
+                on_milestone(milestone)
+        return {"milestones": milestones, "keywords": keywords}, []
+
+    def _node_loader(self, milestone_id: str) -> Callable[[], List[Dict]]:
+        """마일스톤의 노드를 처음 접근할 때 조회하는 로더를 만듭니다."""
+        return lambda: self.load_nodes(milestone_id)
+
+    def load_nodes(self, milestone_id: str) -> List[Dict]:
+        """마일스톤에 속한 노드들을 순서대로 조회합니다.
+
+        Args:
+            milestone_id (str): 마일스톤 ID
+
+        Returns:
+            List[Dict]: 노드 리스트
+        """
+        columns = ", ".join(NODE_FIELDS)
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT id, {columns}, extra FROM nodes WHERE milestone_id = ? ORDER BY position",
+                (milestone_id,)
+            ).fetchall()
+        return [self._row_to_node(row) for row in rows]
+
+    @staticmethod
+    def _row_to_node(row: tuple) -> Dict:
+        node = {"id": row[0]}
+        for field, value in zip(NODE_FIELDS, row[1:-1]):
+            if value is not None:
+                node[field] = value
+        if row[-1]:
+            node.update(json.loads(row[-1]))
+        return node
+
+    def save(self, data: Dict, records: List[Dict]) -> None:
+        if not records:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:  # 하나의 트랜잭션으로 커밋 (예외 시 롤백)
+                for record in records:
+                    self._apply_record(connection, record)
+
+    def compact(self, data: Dict) -> None:
+        # 지연 로드되지 않은 노드를 먼저 읽어 둠 (아래에서 테이블을 비우며, 로더도 같은 락을 사용)
+        for milestone in data.get("milestones", []):
+            milestone.get("nodes")
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM nodes")
+                connection.execute("DELETE FROM milestones")
+                connection.execute("DELETE FROM keywords")
+                for position, milestone in enumerate(data.get("milestones", [])):
+                    self._write_milestone(connection, milestone, position)
+                self._write_keywords(connection, data.get("keywords", []))
+            connection.execute("VACUUM")
+
+    def milestone_ids_in_month_range(self, first: int, last: int) -> Optional[Set[str]]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT DISTINCT milestone_id FROM nodes WHERE month_start <= ? AND month_end >= ?",
+                (last, first)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def _apply_record(self, connection: sqlite3.Connection, record: Dict) -> None:
+        """변경 레코드 하나를 행 단위 SQL 문으로 반영합니다."""
+        op = record.get("op")
+        if op == "add_milestone":
+            milestone = record["milestone"]
+            row = connection.execute(
+                "SELECT position FROM milestones WHERE id = ?", (milestone["id"],)).fetchone()
+            if row:
+                position = row[0]
+            else:
+                position = self._insert_position(connection, "milestones", record.get("position"))
+            connection.execute("DELETE FROM nodes WHERE milestone_id = ?", (milestone["id"],))
+            self._write_milestone(connection, milestone, position)
+        elif op == "update_milestone":
+            fields = [field for field in MILESTONE_FIELDS if field in record]
+            if fields:
+                connection.execute(
+                    f"UPDATE milestones SET {', '.join(f'{field} = ?' for field in fields)} WHERE id = ?",
+                    (*(record[field] for field in fields), record["id"])
+                )
+        elif op == "move_milestone":
+            # 행을 뺀 뒤 새 자리에 다시 넣음 (노드 행은 그대로)
+            row = connection.execute(
+                "SELECT title, subtitle, category, extra FROM milestones WHERE id = ?",
+                (record["id"],)).fetchone()
+            if row is None:
+                return
+            connection.execute("DELETE FROM milestones WHERE id = ?", (record["id"],))
+            position = self._insert_position(connection, "milestones", record["position"])
+            connection.execute(
+                "INSERT INTO milestones (id, position, title, subtitle, category, extra) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (record["id"], position, *row)
+            )
+        elif op == "delete_milestone":
+            connection.execute("DELETE FROM nodes WHERE milestone_id = ?", (record["id"],))
+            connection.execute("DELETE FROM milestones WHERE id = ?", (record["id"],))
+        elif op in ("add_node", "update_node"):
+            node = record["node"]
+            row = connection.execute(
+                "SELECT position FROM nodes WHERE id = ?", (node["id"],)).fetchone()
+            if row:
+                position = row[0]
+            elif op == "add_node":
+                position = self._insert_position(connection, "nodes", record.get("position"),
+                                                 record["milestone_id"])
+            else:
+                return
+            self._write_node(connection, record["milestone_id"], node, position)
+        elif op == "delete_node":
+            connection.execute("DELETE FROM nodes WHERE id = ?", (record["node_id"],))
+        elif op == "set_keywords":
+            connection.execute("DELETE FROM keywords")
+            self._write_keywords(connection, record.get("keywords", []))
+
+    @classmethod
+    def _insert_position(cls, connection: sqlite3.Connection, table: str, index: Optional[int],
+                         milestone_id: Optional[str] = None) -> int:
+        """index번째(0부터) 자리에 넣을 position 값을 구하고 뒤쪽 행을 한 칸씩 밉니다.
+
+        index가 없거나 범위를 넘으면 맨 뒤 position을 반환합니다.
+        """
+        if index is None:
+            return cls._next_position(connection, table, milestone_id)
+        where, params = ("WHERE milestone_id = ?", (milestone_id,)) if milestone_id is not None else ("", ())
+        row = connection.execute(
+            f"SELECT position FROM {table} {where} ORDER BY position LIMIT 1 OFFSET ?",
+            (*params, index)
+        ).fetchone()
+        if row is None:
+            return cls._next_position(connection, table, milestone_id)
+        shift_where = f"{where} AND position >= ?" if where else "WHERE position >= ?"
+        connection.execute(f"UPDATE {table} SET position = position + 1 {shift_where}",
+                           (*params, row[0]))
+        return row[0]
+
+    @staticmethod
+    def _next_position(connection: sqlite3.Connection, table: str,
+                       milestone_id: Optional[str] = None) -> int:
+        if milestone_id is None:
+            row = connection.execute(f"SELECT MAX(position) FROM {table}").fetchone()
+        else:
+            row = connection.execute(
+                f"SELECT MAX(position) FROM {table} WHERE milestone_id = ?", (milestone_id,)
+            ).fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    def _write_milestone(self, connection: sqlite3.Connection, milestone: Dict, position: int) -> None:
+        extra = {k: v for k, v in milestone.items()
+                 if k not in MILESTONE_FIELDS and k not in ("id", "nodes")}
+        connection.execute(
+            "INSERT OR REPLACE INTO milestones (id, position, title, subtitle, category, extra) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (milestone["id"], position, milestone.get("title"), milestone.get("subtitle"),
+             milestone.get("category"), json.dumps(extra, ensure_ascii=False) if extra else None)
+        )
+        for node_position, node in enumerate(milestone.get("nodes", [])):
+            self._write_node(connection, milestone["id"], node, node_position)
+
+    @staticmethod
+    def _write_node(connection: sqlite3.Connection, milestone_id: str, node: Dict, position: int) -> None:
+        extra = {k: v for k, v in node.items() if k not in NODE_FIELDS and k != "id"}
+        span = month_span(node.get("date", "")) or (None, None)
+        connection.execute(
+            f"INSERT OR REPLACE INTO nodes (id, milestone_id, position, {', '.join(NODE_FIELDS)}, "
+            "month_start, month_end, extra) "
+            f"VALUES (?, ?, ?, {', '.join('?' for _ in NODE_FIELDS)}, ?, ?, ?)",
+            (node["id"], milestone_id, position, *(node.get(f) for f in NODE_FIELDS),
+             span[0], span[1], json.dumps(extra, ensure_ascii=False) if extra else None)
+        )
+
+    @staticmethod
+    def _write_keywords(connection: sqlite3.Connection, keywords: List[str]) -> None:
+        connection.executemany(
+            "INSERT OR IGNORE INTO keywords (position, keyword) VALUES (?, ?)",
+            list(enumerate(keywords))
+        )
+
+
+def migrate_json_to_sqlite(json_filename: str = "raw.json", db_filename: str = "raw.db") -> int:
+    """raw.json(및 저널)의 데이터를 SQLite 데이터베이스로 옮깁니다.
+
+    Args:
+        json_filename (str): 원본 JSON 파일 경로
+        db_filename (str): 생성할 SQLite 파일 경로 (기존 내용은 대체됨)
+
+    Returns:
+        int: 옮긴 마일스톤 개수
+    """
+    return migrate_storage(json_filename, db_filename)
+
+
+if __name__ == "__main__":
+    # 사용법: python sqlite_storage.py [raw.json] [raw.db]
+    args = sys.argv[1:]
+    count = migrate_json_to_sqlite(*args[:2])
+    print(f"{count}개의 마일스톤을 옮겼습니다.")
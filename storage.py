@@ -0,0 +1,271 @@
+"""저장소 백엔드 모듈 - DataManager가 사용하는 영속화 계층
+
+기본 백엔드는 raw.json 스냅샷 + 변경 저널(JsonStorage)이며,
+sqlite_storage.SqliteStorage 등 같은 인터페이스의 백엔드로 교체할 수 있습니다.
+"""
+
+import json
+import os
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from journal import ChangeJournal
+from json_stream import load_lazily
+from models import to_json
+
+
+class StorageBackend:
+    """저장소 백엔드 베이스 클래스
+
+    DataManager는 메모리의 데이터와 변경 레코드(journal.py 형식)를 넘기고,
+    백엔드는 이를 각자의 방식으로 영속화합니다.
+    """
+
+    # True면 변경 레코드가 생길 때마다 즉시 save()가 호출됨
+    writes_immediately = False
+
+    def exists(self) -> bool:
+        """저장된 데이터가 있는지 확인합니다."""
+        raise NotImplementedError
+
+    def load(self, on_milestone: Optional[Callable[[Dict], None]] = None) -> Tuple[Dict, List[Dict]]:
+        """저장된 데이터를 불러옵니다.
+
+        Args:
+            on_milestone (Optional[Callable]): 마일스톤이 읽힐 때마다 호출되는 콜백
+
+        Returns:
+            Tuple[Dict, List[Dict]]: (데이터, 데이터 위에 재적용할 변경 레코드)
+        """
+        raise NotImplementedError
+
+    def peek(self) -> Tuple[Dict, List[Dict]]:
+        """저장소를 고치지 않고 현재 상태를 읽습니다 (외부 변경 확인용).
+
+        Returns:
+            Tuple[Dict, List[Dict]]: load()와 같은 (데이터, 재적용할 변경 레코드)
+        """
+        return self.load()
+
+    def save(self, data: Dict, records: List[Dict]) -> None:
+        """변경 레코드를 영속화합니다.
+
+        Args:
+            data (Dict): 레코드가 이미 반영된 현재 데이터
+            records (List[Dict]): 마지막 저장 이후의 변경 레코드
+        """
+        raise NotImplementedError
+
+    def compact(self, data: Dict) -> None:
+        """데이터 전체를 새로 기록합니다.
+
+        Args:
+            data (Dict): 저장할 전체 데이터
+        """
+        raise NotImplementedError
+
+    def backup_filename(self, generation: int = 0) -> str:
+        """백업 파일 경로를 반환합니다 (백업을 만들지 않는 백엔드는 빈 문자열)."""
+        return ""
+
+    def signature(self) -> Tuple:
+        """저장된 파일의 상태를 반환합니다 (외부 변경 감지용).
+
+        파일을 읽지 않고 크기와 수정 시각만 비교하므로 자주 호출해도 됩니다.
+
+        Returns:
+            Tuple: 저장 파일들의 (크기, 수정 시각) 목록
+        """
+        return (file_signature(getattr(self, "filename", "")),)
+
+    def milestone_ids_in_month_range(self, first: int, last: int) -> Optional[Set[str]]:
+        """월 범위와 겹치는 노드를 가진 마일스톤 ID를 조회합니다.
+
+        Args:
+            first (int): 시작 월 서수
+            last (int): 끝 월 서수
+
+        Returns:
+            Optional[Set[str]]: 마일스톤 ID 집합 (백엔드가 지원하지 않으면 None)
+        """
+        return None
+
+
+class JsonStorage(StorageBackend):
+    """raw.json 스냅샷 + raw.json.journal 저널 백엔드
+
+    저장 시 변경 레코드만 저널에 추가하고, 저널이 일정 크기를 넘으면
+    raw.json 스냅샷으로 합칩니다(compaction). 스냅샷은 임시 파일에 쓴 뒤
+    rename으로 교체하며, 이전 세대는 하드링크 백업으로 보존합니다.
+    """
+
+    # 저널 레코드 수가 이 값을 넘으면 스냅샷으로 합침
+    COMPACT_RECORD_LIMIT = 1000
+    # 저널 크기가 이 값과 스냅샷 크기 중 큰 값을 넘으면 스냅샷으로 합침
+    COMPACT_MIN_BYTES = 1024 * 1024
+
+    def __init__(self, filename: str = "raw.json", backup_count: int = 3):
+        """
+        Args:
+            filename (str): 스냅샷 JSON 파일 경로
+            backup_count (int): 유지할 백업 세대 수 (0이면 백업하지 않음)
+        """
+        self.filename = filename
+        self.backup_count = backup_count
+        self.journal = ChangeJournal(filename + ".journal")
+
+    def exists(self) -> bool:
+        return os.path.exists(self.filename) or os.path.exists(self.journal.filename)
+
+    def load(self, on_milestone: Optional[Callable[[Dict], None]] = None) -> Tuple[Dict, List[Dict]]:
+        return self._load_snapshot(on_milestone), self.journal.read()
+
+    def peek(self) -> Tuple[Dict, List[Dict]]:
+        # 다른 프로그램이 저널에 쓰는 중일 수 있으므로 잘린 줄을 고치지 않음
+        return self._load_snapshot(), self.journal.read(repair=False)
+
+    def _load_snapshot(self, on_milestone: Optional[Callable[[Dict], None]] = None) -> Dict:
+        if os.path.exists(self.filename):
+            return load_lazily(self.filename, on_milestone)
+        return {"milestones": [], "keywords": []}
+
+    def save(self, data: Dict, records: List[Dict]) -> None:
+        if self._needs_compaction(len(records)):
+            self.compact(data)
+            return
+        self.journal.append(records)
+
+    def compact(self, data: Dict) -> None:
+        write_json_atomic(self.filename, data, before_replace=self._rotate_backups)
+        self.journal.clear()
+
+    def signature(self) -> Tuple:
+        return (file_signature(self.filename), file_signature(self.journal.filename))
+
+    def backup_filename(self, generation: int = 0) -> str:
+        """백업 파일 경로를 반환합니다.
+
+        Args:
+            generation (int): 백업 세대 (0이 가장 최근)
+
+        Returns:
+            str: 백업 파일 경로 (예: raw.json.backup, raw.json.backup.1)
+        """
+        name = self.filename + ".backup"
+        return name if generation == 0 else f"{name}.{generation}"
+
+    def _needs_compaction(self, pending_count: int) -> bool:
+        """저널을 스냅샷으로 합칠 시점인지 판단합니다."""
+        if not os.path.exists(self.filename):
+            return True
+        if self.journal.record_count + pending_count > self.COMPACT_RECORD_LIMIT:
+            return True
+        snapshot_size = os.path.getsize(self.filename)
+        return self.journal.size() > max(self.COMPACT_MIN_BYTES, snapshot_size)
+
+    def _rotate_backups(self) -> None:
+        """백업 세대를 한 칸씩 밀고 현재 raw.json을 최신 백업으로 보존합니다.
+
+        파일 내용을 복사하지 않고 rename과 하드링크만 사용합니다.
+        """
+        if self.backup_count <= 0 or not os.path.exists(self.filename):
+            return
+        oldest = self.backup_filename(self.backup_count - 1)
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for generation in range(self.backup_count - 1, 0, -1):
+            previous = self.backup_filename(generation - 1)
+            if os.path.exists(previous):
+                os.replace(previous, self.backup_filename(generation))
+        try:
+            os.link(self.filename, self.backup_filename(0))
+        except OSError:
+            # 하드링크를 지원하지 않는 파일 시스템은 rename으로 대체
+            os.replace(self.filename, self.backup_filename(0))
+
+
+def write_json_atomic(filename: str, data, indent: Optional[int] = 2,
+                      before_replace: Optional[Callable[[], None]] = None) -> None:
+    """JSON을 임시 파일에 쓰고 fsync한 뒤 rename으로 교체합니다.
+
+    쓰기 도중 중단되어도 기존 파일은 손상되지 않습니다.
+
+    Args:
+        filename (str): 대상 파일 경로
+        data: 저장할 JSON 데이터
+        indent (Optional[int]): 들여쓰기 (None이면 한 줄로 기록)
+        before_replace (Optional[Callable]): rename 직전에 호출할 함수 (백업 등)
+    """
+    temp_filename = filename + ".tmp"
+    with open(temp_filename, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent, default=to_json)
+        f.flush()
+        os.fsync(f.fileno())
+    if before_replace is not None:
+        before_replace()
+    os.replace(temp_filename, filename)
+    fsync_directory(os.path.dirname(os.path.abspath(filename)))
+
+
+def file_signature(filename: str) -> Optional[Tuple[int, int]]:
+    """파일의 (크기, 수정 시각 ns)를 반환합니다 (파일이 없으면 None)."""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def fsync_directory(directory: str) -> None:
+    """rename 결과가 디스크에 남도록 디렉터리를 동기화합니다."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return  # Windows 등 디렉터리를 열 수 없는 환경
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def create_storage(filename: str, backup_count: int = 3) -> StorageBackend:
+    """파일 확장자에 맞는 저장소 백엔드를 생성합니다.
+
+    Args:
+        filename (str): 데이터 파일 경로
+            (.db/.sqlite/.sqlite3이면 SQLite, .shards면 마일스톤별 분할 저장)
+        backup_count (int): JSON 백엔드의 백업 세대 수
+
+    Returns:
+        StorageBackend: 생성된 백엔드
+    """
+    extension = os.path.splitext(filename.rstrip("/\\"))[1].lower()
+    if extension in (".db", ".sqlite", ".sqlite3"):
+        from sqlite_storage import SqliteStorage
+        return SqliteStorage(filename)
+    if extension == ".shards":
+        from sharded_storage import ShardedStorage
+        return ShardedStorage(filename)
+    return JsonStorage(filename, backup_count)
+
+
+def migrate_storage(source_filename: str, target_filename: str) -> int:
+    """한 저장소의 데이터(저널 포함)를 다른 형식의 저장소로 옮깁니다.
+
+    Args:
+        source_filename (str): 원본 데이터 파일 경로 (예: raw.json)
+        target_filename (str): 대상 경로 (예: raw.db, raw.shards)
+
+    Returns:
+        int: 옮긴 마일스톤 개수
+    """
+    from data_manager import DataManager
+
+    data = DataManager(source_filename).load_data()
+    target = create_storage(target_filename)
+    target.compact(data)
+    close = getattr(target, "close", None)
+    if close is not None:
+        close()
+    return len(data.get("milestones", []))
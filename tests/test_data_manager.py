@@ -0,0 +1,149 @@
+"""DataManager(data_manager.py) 테스트 - ID 인덱스, 트랜잭션, 실행 취소"""
+
+import json
+
+import pytest
+
+from data_manager import DataManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data({"milestones": [
+        {"id": f"m{i}", "title": f"제목{i}", "subtitle": "", "nodes": [
+            {"id": f"n{i}", "content": "내용", "date": "24.05"}]}
+        for i in range(5)], "keywords": []})
+    return manager
+
+
+def _ids(manager):
+    return [m["id"] for m in manager.get_milestones()]
+
+
+def test_lookup_by_id(manager):
+    assert manager.get_milestone("m3")["title"] == "제목3"
+    milestone, node = manager.get_node("n2")
+    assert milestone["id"] == "m2" and node["content"] == "내용"
+    assert manager.get_milestone("없음") is None
+
+
+def test_undo_delete_restores_position(manager):
+    manager.delete_milestone("m1")
+    manager.delete_milestone("m3")
+    assert _ids(manager) == ["m0", "m2", "m4"]
+    manager.undo()
+    manager.undo()
+    assert _ids(manager) == ["m0", "m1", "m2", "m3", "m4"]
+    manager.redo()
+    assert _ids(manager) == ["m0", "m2", "m3", "m4"]
+    manager.update_milestone("m4", "바뀜", "")
+    assert manager.get_milestone("m4")["title"] == "바뀜"
+    assert _ids(manager) == ["m0", "m2", "m3", "m4"]
+
+
+def test_duplicate_ids_are_repaired_on_load(tmp_path):
+    path = tmp_path / "raw.json"
+    path.write_text(json.dumps({"milestones": [
+        {"id": "1", "title": "가", "subtitle": "", "nodes": [{"id": "9", "content": "a"}]},
+        {"id": "1", "title": "나", "subtitle": "", "nodes": [{"id": "9", "content": "b"}]},
+    ], "keywords": []}), encoding='utf-8')
+    manager = DataManager(str(path))
+    manager.load_data()
+    milestones = manager.get_milestones()
+    node_ids = [node["id"] for milestone in milestones for node in milestone["nodes"]]
+    assert len({m["id"] for m in milestones}) == 2
+    assert len(set(node_ids)) == 2
+    assert manager.get_milestone(milestones[1]["id"])["title"] == "나"
+
+    # 고친 ID는 다음 저장 때 파일에도 기록됨
+    manager.save_data()
+    reloaded = DataManager(str(path))
+    reloaded.load_data()
+    assert [m["id"] for m in reloaded.get_milestones()] == [m["id"] for m in milestones]
+
+
+def test_new_ids_are_unique_and_increasing(manager):
+    ids = [manager.add_milestone(f"새{i}", "")["id"] for i in range(100)]
+    ids += manager.reserve_ids(100)
+    assert len(set(ids)) == 200
+    assert [int(i) for i in ids] == sorted(int(i) for i in ids)
+
+
+def test_transaction_notifies_once(manager):
+    notified = []
+    manager.subscribe(notified.append)
+    version = manager.version
+    with manager.transaction():
+        manager.delete_milestone("m0")
+        manager.update_milestone("m1", "바뀜", "")
+        assert manager.get_milestone("m0") is None  # 블록 안에서도 바로 반영
+    assert len(notified) == 1 and len(notified[0]) == 2
+    assert manager.version == version + 1
+    manager.undo()
+    assert _ids(manager) == ["m0", "m1", "m2", "m3", "m4"]
+    assert manager.get_milestone("m1")["title"] == "제목1"
+
+
+def test_failed_transaction_rolls_back(manager):
+    notified = []
+    manager.subscribe(notified.append)
+    with pytest.raises(ValueError):
+        with manager.transaction():
+            manager.delete_milestone("m0")
+            manager.update_node("m1", "n1", {"content": "바뀜"})
+            manager.update_milestone("없음", "제목", "")
+    assert _ids(manager) == ["m0", "m1", "m2", "m3", "m4"]
+    assert manager.get_node("n1")[1]["content"] == "내용"
+    assert notified == [] and not manager.can_undo()
+
+
+def test_external_changes_apply_only_the_diff(manager):
+    other = DataManager(manager.filename)
+    other.load_data()
+    other.update_milestone("m2", "밖에서 바꿈", "")
+    other.delete_milestone("m4")
+    other.save_data()
+
+    notified = []
+    manager.subscribe(notified.append)
+    assert manager.apply_external_changes() == 2
+    assert _ids(manager) == ["m0", "m1", "m2", "m3"]
+    assert manager.get_milestone("m2")["title"] == "밖에서 바꿈"
+    assert {change.milestone_id for change in notified[0]} == {"m2", "m4"}
+    assert not manager.can_undo()
+
+
+@pytest.mark.parametrize("filename", ["raw.db", "raw.shards"])
+def test_external_changes_other_backends(tmp_path, filename):
+    manager = DataManager(str(tmp_path / filename))
+    manager.save_data({"milestones": [
+        {"id": f"m{i}", "title": f"제목{i}", "subtitle": "", "nodes": []} for i in range(3)],
+        "keywords": []})
+    other = DataManager(manager.filename)
+    other.load_data()
+    other.add_node("m1", {"content": "밖에서 추가"})
+    other.delete_milestone("m0")
+    other.save_data()
+
+    assert manager.apply_external_changes() == 2
+    assert _ids(manager) == ["m1", "m2"]
+    assert manager.get_milestone("m1")["nodes"][0]["content"] == "밖에서 추가"
+    assert manager.apply_external_changes() == 0
+
+
+def test_external_check_does_not_touch_a_journal_being_written(manager):
+    other = DataManager(manager.filename)
+    other.load_data()
+    other.update_milestone("m2", "밖에서 바꿈", "")
+    other.save_data()
+    journal_filename = manager.storage.journal.filename
+    with open(journal_filename, 'ab') as f:
+        f.write(b'{"op":"delete_milestone","i')  # 다른 프로그램이 아직 쓰는 중
+    with open(journal_filename, 'rb') as f:
+        before = f.read()
+
+    assert manager.apply_external_changes() == 1
+    assert manager.get_milestone("m2")["title"] == "밖에서 바꿈"
+    with open(journal_filename, 'rb') as f:
+        assert f.read() == before
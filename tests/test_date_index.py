@@ -0,0 +1,45 @@
+"""날짜 해석(dates.py)과 날짜 색인(date_index.py) 테스트"""
+
+import random
+
+import pytest
+
+from data_manager import DataManager
+from dates import MONTH, QUARTER, is_valid_date, month_ordinal, parse_date
+
+DATES = ["23.12", "24.01", "24.Q1", "24.05", "24.Q3", "25.02", "25.Q4", "", "미정"]
+
+
+def test_parse_date():
+    assert parse_date("24.05") == (month_ordinal(24, 5), MONTH)
+    assert parse_date("24.Q3") == (month_ordinal(24, 7), QUARTER)
+    assert parse_date(" 24q3 ") == parse_date("24.Q3")  # 저장된 데이터 호환
+    assert parse_date("24.Q3").last == month_ordinal(24, 9)
+    assert parse_date("24.13") is None and parse_date("24.Q5") is None and parse_date("") is None
+    assert is_valid_date("24.Q3") and not is_valid_date("24q3")
+
+
+@pytest.mark.parametrize("filename", ["raw.json", "raw.db"])
+def test_month_range_matches_scan(tmp_path, filename):
+    rng = random.Random(19)
+    manager = DataManager(str(tmp_path / filename))
+    manager.save_data({"milestones": [
+        {"id": f"m{i}", "title": "", "subtitle": "",
+         "nodes": [{"id": f"m{i}-n{j}", "content": "", "date": rng.choice(DATES)}
+                   for j in range(rng.randrange(3))]}
+        for i in range(40)], "keywords": []})
+    ranges = [(month_ordinal(24, 1), month_ordinal(24, 3)), (month_ordinal(24, 9), month_ordinal(24, 9)),
+              (month_ordinal(23, 1), month_ordinal(26, 12)), (month_ordinal(22, 1), month_ordinal(22, 12))]
+
+    def scan(first, last):
+        return {m["id"] for m in manager.get_milestones()
+                if any((parsed := parse_date(node.get("date", ""))) is not None
+                       and parsed.overlaps(first, last) for node in m["nodes"])}
+
+    for first, last in ranges:
+        assert manager.milestone_ids_in_month_range(first, last) == scan(first, last)
+    manager.add_node("m0", {"content": "", "date": "22.06"})
+    manager.delete_milestone("m1")
+    manager.add_node("m2", {"content": "", "date": "24.Q1"})
+    for first, last in ranges:
+        assert manager.milestone_ids_in_month_range(first, last) == scan(first, last)
@@ -0,0 +1,68 @@
+"""데이터 비교(diff.py) 테스트 - 순서 변경은 옮긴 마일스톤만 레코드로 만듦"""
+
+import random
+
+import pytest
+
+from data_manager import DataManager
+from diff import diff_data
+
+
+def _data(ids):
+    return {"milestones": [
+        {"id": milestone_id, "title": milestone_id, "subtitle": "", "nodes": [
+            {"id": f"{milestone_id}-n", "content": "내용", "date": "24.05"}]}
+        for milestone_id in ids], "keywords": []}
+
+
+def _ids(data):
+    return [m["id"] for m in data["milestones"]]
+
+
+def _apply(manager, records):
+    with manager.transaction():
+        for record in records:
+            manager._commit(record)
+
+
+def test_moving_one_milestone_emits_one_record():
+    ids = [f"m{i}" for i in range(10)]
+    records = diff_data(_data(ids), _data(ids[1:] + ids[:1]))
+    assert records == [{"op": "move_milestone", "id": "m0", "position": 9}]
+
+
+def test_unchanged_order_emits_nothing():
+    ids = [f"m{i}" for i in range(10)]
+    assert diff_data(_data(ids), _data(ids)) == []
+
+
+@pytest.mark.parametrize("filename", ["raw.json", "raw.db"])
+def test_records_reproduce_target_order(tmp_path, filename):
+    rng = random.Random(14)
+    manager = DataManager(str(tmp_path / filename))
+    ids = [f"m{i}" for i in range(30)]
+    manager.save_data(_data(ids))
+    for _ in range(5):
+        target_ids = [i for i in ids if rng.random() > 0.2] + [f"새{rng.random()}" for _ in range(3)]
+        rng.shuffle(target_ids)
+        records = diff_data(manager.data, _data(target_ids))
+        moves = [r for r in records if r["op"] == "move_milestone"]
+        assert len(moves) < len(target_ids)
+        _apply(manager, records)
+        assert _ids(manager.data) == target_ids
+        ids = target_ids
+
+    # 저장소에 반영된 순서도 같아야 함
+    manager.save_data()
+    assert _ids(DataManager(str(tmp_path / filename)).load_data()) == ids
+
+
+def test_undo_move(tmp_path):
+    manager = DataManager(str(tmp_path / "raw.json"))
+    ids = [f"m{i}" for i in range(5)]
+    manager.save_data(_data(ids))
+    _apply(manager, diff_data(manager.data, _data(["m3", "m0", "m1", "m2", "m4"])))
+    assert _ids(manager.data) == ["m3", "m0", "m1", "m2", "m4"]
+    manager.undo()
+    assert _ids(manager.data) == ids
+    assert manager.get_milestone("m3")["title"] == "m3"
@@ -0,0 +1,89 @@
+"""패싯 색인(facet_index.py) 테스트 - 비트셋 결과가 전체 조회와 같은지 확인"""
+
+import random
+from collections import Counter
+
+from data_manager import DataManager
+from facet_index import CATEGORY, COLOR, QUARTER, SHAPE, YEAR, node_facets
+
+SHAPES = ["●", "■", "▲"]
+COLORS = ["#ff0000", "#00ff00"]
+DATES = ["23.02", "24.05", "24.11", "25.01", ""]
+CATEGORIES = ["", "업무", "개인"]
+
+
+def _node(rng, node_id):
+    return {"id": node_id, "content": "내용", "shape": rng.choice(SHAPES),
+            "color": rng.choice(COLORS), "date": rng.choice(DATES)}
+
+
+def _expected(manager):
+    """색인 없이 패싯 키별 (마일스톤 ID 집합, 노드 수)를 구함"""
+    ids, counts = {}, Counter()
+    for milestone in manager.get_milestones():
+        keys = Counter()
+        for node in milestone["nodes"]:
+            keys.update(node_facets(node))
+        keys[(CATEGORY, milestone.get("category", ""))] += len(milestone["nodes"])
+        for key, count in keys.items():
+            ids.setdefault(key, set()).add(milestone["id"])
+            counts[key] += count
+    return ids, counts
+
+
+def _check(manager):
+    index = manager.facet_index
+    ids, counts = _expected(manager)
+    for facet in (SHAPE, COLOR, YEAR, QUARTER, CATEGORY):
+        values = {value for name, value in ids if name == facet}
+        for value in values:
+            assert index.milestone_ids(index.bits(facet, value)) == ids[(facet, value)]
+            assert index.node_count(facet, value) == counts[(facet, value)]
+            assert index.milestone_count(facet, value) == len(ids[(facet, value)])
+        assert index.values(facet) == {value: counts[(facet, value)] for value in values
+                                       if counts[(facet, value)] > 0}
+    for keyword in ("제목1", "부제", "없는말"):
+        expected = {m["id"] for m in manager.get_milestones()
+                    if keyword in m["title"] or keyword in m["subtitle"]}
+        assert index.milestone_ids(index.keyword_bits(keyword)) == expected
+    assert index.milestone_ids(index.all_bits()) == {m["id"] for m in manager.get_milestones()}
+
+
+def test_bitsets_follow_edits(tmp_path):
+    rng = random.Random(21)
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data({"milestones": [
+        {"id": f"m{i}", "title": f"제목{i}", "subtitle": "부제" if i % 3 else "",
+         "category": rng.choice(CATEGORIES),
+         "nodes": [_node(rng, f"m{i}-n{j}") for j in range(rng.randrange(4))]}
+        for i in range(40)], "keywords": []})
+    _check(manager)
+
+    for step in range(30):
+        milestones = manager.get_milestones()
+        milestone = rng.choice(milestones)
+        action = step % 4
+        if action == 0:
+            manager.delete_milestone(milestone["id"])
+        elif action == 1:
+            manager.add_milestone(f"제목{step}", "부제", rng.choice(CATEGORIES))
+        elif action == 2:
+            manager.add_node(milestone["id"], {k: v for k, v in _node(rng, "").items() if k != "id"})
+        elif milestone["nodes"]:
+            node = rng.choice(milestone["nodes"])
+            manager.update_node(milestone["id"], node["id"], {"shape": rng.choice(SHAPES),
+                                                              "date": rng.choice(DATES)})
+        _check(manager)
+
+
+def test_combining_facets_is_an_and(tmp_path):
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data({"milestones": [
+        {"id": "a", "title": "", "subtitle": "", "nodes": [
+            {"id": "a1", "shape": "●", "color": "#ff0000", "date": "24.05"}]},
+        {"id": "b", "title": "", "subtitle": "", "nodes": [
+            {"id": "b1", "shape": "●", "color": "#00ff00", "date": "24.05"}]},
+    ], "keywords": []})
+    index = manager.facet_index
+    bits = index.bits(SHAPE, "●") & index.bits(COLOR, "#ff0000")
+    assert index.milestone_ids(bits) == {"a"}
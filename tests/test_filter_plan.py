@@ -0,0 +1,113 @@
+"""필터 계획(filter_plan.py) 테스트"""
+
+import random
+
+import pytest
+
+from data_manager import DataManager
+from filter_plan import FilterPlan, FilterResultCache
+
+DATES = ["23.12", "24.01", "24.Q1", "24.05", "24.08", "24.Q3", "25.02", ""]
+
+
+def _sample():
+    rng = random.Random(20)
+    return {"milestones": [
+        {"id": f"m{i}", "title": rng.choice(["노광기 점검", "장비 반입"]), "subtitle": "",
+         "nodes": [{"id": f"m{i}-n{j}", "content": "", "shape": rng.choice(["★", "●"]),
+                    "date": rng.choice(DATES)} for j in range(rng.randrange(3))]}
+        for i in range(40)], "keywords": []}
+
+
+def _scan(manager, plan):
+    return {m["id"] for m in manager.get_milestones() if plan.evaluate(m)}
+
+
+@pytest.mark.parametrize("settings", [
+    {"date_filter": True, "filter_year": 24, "filter_quarter": 1},
+    {"date_filter": True, "filter_year": 24, "filter_quarter": 3, "keyword": "점검"},
+    {"date_filter": True, "filter_year": 24, "filter_quarter": 3, "shape": "★"},
+])
+def test_quarter_filter_is_pushed_down_to_sqlite(tmp_path, settings):
+    DataManager(str(tmp_path / "raw.db")).save_data(_sample())
+    manager = DataManager(str(tmp_path / "raw.db"))
+    manager.load_data()
+    sqlite_ids = FilterPlan.compile(settings, manager).milestone_ids()
+    if "shape" not in settings and "keyword" not in settings:
+        # 날짜 조건만 있으면 노드를 파싱하지 않고 저장소에서 조회
+        assert not manager.facet_index.is_built
+        assert not manager.date_index.is_built
+
+    index = DataManager(str(tmp_path / "raw.json"))
+    index.save_data(_sample())
+    index.facet_index.all_bits()  # 패싯 색인을 먼저 만들어 비트셋 경로 사용
+    plan = FilterPlan.compile(settings, index)
+    assert plan.milestone_ids() == sqlite_ids == _scan(index, plan)
+    assert sqlite_ids
+
+
+@pytest.fixture
+def counted(monkeypatch):
+    """FilterPlan.apply 호출 수 (캐시를 거치지 않고 다시 계산한 횟수)"""
+    calls = []
+    apply = FilterPlan.apply
+
+    def counting_apply(plan, milestones):
+        calls.append(plan.key)
+        return apply(plan, milestones)
+    monkeypatch.setattr(FilterPlan, "apply", counting_apply)
+    return calls
+
+
+def test_cache_hit_until_version_changes(tmp_path, counted):
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data(_sample())
+    cache = FilterResultCache()
+    plan = FilterPlan.compile({"keyword": "점검"}, manager)
+
+    first = cache.filter(plan, manager.version, manager.get_milestones)
+    second = cache.filter(plan, manager.version, manager.get_milestones)
+    assert len(counted) == 1
+    assert second == first and all(a is b for a, b in zip(first, second))
+    second.clear()  # 반환값은 사본이므로 바꿔도 캐시는 그대로
+    assert cache.filter(plan, manager.version, manager.get_milestones) == first
+
+    manager.update_milestone(first[0]["id"], "회의", "")
+    third = cache.filter(plan, manager.version, manager.get_milestones)
+    assert len(counted) == 2
+    assert [m["id"] for m in third] == [m["id"] for m in first[1:]]
+
+
+def test_equal_filters_share_a_key(tmp_path):
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data(_sample())
+    settings = [
+        {"keyword": "점검", "shape": "★"},
+        {"shape": "★", "keyword": "점검"},
+        {"shape": "★", "keyword": "점검", "content_keyword": "", "this_month": False,
+         "date_filter": None, "milestone_id": ""},
+        {"shape": "★", "keyword": "점검", "keywords": ["점검"]},
+    ]
+    keys = {FilterPlan.compile(s, manager).key for s in settings}
+    assert len(keys) == 1
+    assert FilterPlan.compile({"shape": "●", "keyword": "점검"}, manager).key not in keys
+
+
+def test_least_recently_used_result_is_evicted(tmp_path, counted):
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data(_sample())
+    cache = FilterResultCache(capacity=2)
+    plans = [FilterPlan.compile({"shape": shape}, manager) for shape in ("★", "●", "■")]
+
+    def run(plan):
+        cache.filter(plan, manager.version, manager.get_milestones)
+
+    run(plans[0])
+    run(plans[1])
+    run(plans[0])  # ★가 최근 사용으로 바뀜
+    run(plans[2])  # 가장 오래 쓰지 않은 ●가 밀려남
+    assert len(counted) == 3
+    run(plans[0])
+    assert len(counted) == 3
+    run(plans[1])
+    assert len(counted) == 4
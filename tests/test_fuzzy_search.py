@@ -0,0 +1,118 @@
+"""퍼지 검색(fuzzy_search.py) 테스트 - 초성 검색과 자모 오타 허용"""
+
+import math
+import random
+import time
+
+import pytest
+
+from data_manager import DataManager
+from fuzzy_search import MIN_SIMILARITY, FuzzyIndex, decompose, initials, is_initials_query
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data({"milestones": [
+        {"id": "m1", "title": "노광기 점검", "subtitle": "A라인", "nodes": [
+            {"id": "n1", "content": "렌즈 교체", "date": "24.05"}]},
+        {"id": "m2", "title": "식각 설비", "subtitle": "", "nodes": [
+            {"id": "n2", "content": "노광 조건 변경", "date": "24.06"}]},
+        {"id": "m3", "title": "회의", "subtitle": "", "nodes": []},
+    ], "keywords": []})
+    return manager
+
+
+def test_decompose_and_initials():
+    assert decompose("노광기") == "ㄴㅗㄱㅘㅇㄱㅣ"
+    assert initials("노광기 점검") == "ㄴㄱㄱㅈㄱ"
+    assert is_initials_query("ㄴㄱㄱ") and not is_initials_query("노광")
+
+
+def test_initials_query(manager):
+    hits = manager.fuzzy_search("ㄴㄱㄱ")
+    assert hits[0].milestone_id == "m1" and hits[0].node_id == ""
+    assert hits[0].text == "노광기 점검 - A라인"
+
+
+def test_typo_is_tolerated(manager):
+    hits = manager.fuzzy_search("노광귀 점검")
+    assert hits and hits[0].milestone_id == "m1"
+    assert not any(hit.milestone_id == "m3" for hit in hits)
+
+
+def test_heading_ranks_above_node_content(manager):
+    hits = manager.fuzzy_search("노광")
+    assert [hit.milestone_id for hit in hits] == ["m1", "m2"]
+    assert hits[1].node_id == "n2"
+
+
+def test_index_follows_edits(manager):
+    manager.fuzzy_search("노광")  # 색인을 만든 뒤 편집
+    manager.update_milestone("m3", "노광 회의", "")
+    manager.delete_milestone("m1")
+    assert {hit.milestone_id for hit in manager.fuzzy_search("노광")} == {"m2", "m3"}
+    assert manager.fuzzy_search("ㄴㄱㄱ") == []
+
+
+WORDS = ["노광기", "렌즈", "교체", "점검", "식각", "설비", "회의", "일정", "A라인", "납기"]
+
+
+def _random_milestones(count, nodes, seed=17):
+    rng = random.Random(seed)
+    return [{"id": f"m{i}", "title": " ".join(rng.sample(WORDS, 2)),
+             "subtitle": rng.choice(["", "A라인", "노광"]),
+             "nodes": [{"id": f"m{i}-n{j}", "content": " ".join(rng.sample(WORDS, rng.randint(1, 4)))}
+                       for j in range(nodes)]}
+            for i in range(count)]
+
+
+def _scan_scores(index, query):
+    """색인 없이 모든 문서를 훑어 자모 퍼지 검색 점수를 계산"""
+    jamo_query = decompose(query)
+    grams = {jamo_query[i:i + 3] for i in range(len(jamo_query) - 2)}
+    needed = max(1, math.ceil(len(grams) * MIN_SIMILARITY))
+    scores = {}
+    for doc_id, jamo in index._jamo.items():
+        shared = sum(gram in jamo for gram in grams)
+        document = index._documents[doc_id]
+        key = (document.milestone_id, document.node_id)
+        if shared == len(grams):
+            position = jamo.find(jamo_query)
+            exact = 0.0 if position < 0 else (1.0 if position == 0 else 0.5)
+            scores[key] = 1.0 + exact + index._bonus[doc_id]
+        elif shared >= needed:
+            scores[key] = shared / len(grams) + index._bonus[doc_id]
+    return scores
+
+
+@pytest.mark.parametrize("query", ["노광기", "노광귀", "노광기 렌즈", "렌즈 교체 일정", "점검 회의",
+                                   "식각셜비", "A라인", "납기 노광", "없는 말"])
+@pytest.mark.parametrize("limit", [1, 5, 50])
+def test_capped_candidates_match_a_full_scan(query, limit):
+    index = FuzzyIndex()
+    index.reset(lambda: _random_milestones(200, 5))
+    hits = index.search(query, limit)
+    expected = _scan_scores(index, query)
+    assert [hit.score for hit in hits] == pytest.approx(
+        sorted(expected.values(), reverse=True)[:limit])
+    assert all(hit.score == pytest.approx(expected[(hit.milestone_id, hit.node_id)]) for hit in hits)
+
+
+@pytest.fixture(scope="module")
+def large_index():
+    """노드 5만 개 - "노광기"가 문서 절반 가까이에 나옴"""
+    index = FuzzyIndex()
+    index.reset(lambda: _random_milestones(5000, 10))
+    index.search("노광기")
+    return index
+
+
+@pytest.mark.parametrize("query", ["노광기", "노광기 점검"])
+def test_common_query_is_fast(large_index, query):
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        large_index.search(query)
+        timings.append(time.perf_counter() - start)
+    assert min(timings) < 0.010
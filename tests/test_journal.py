@@ -0,0 +1,105 @@
+"""변경 저널(journal.py) 테스트"""
+
+import json
+
+from data_manager import DataManager
+from journal import ChangeJournal, replay
+from models import to_json
+
+
+def _titles(filename):
+    manager = DataManager(filename)
+    manager.load_data()
+    return [m["title"] for m in manager.get_milestones()]
+
+
+def _journaled_manager(tmp_path):
+    """스냅샷을 만든 뒤 마일스톤 하나(k1)를 저널에 기록한 데이터 매니저"""
+    filename = str(tmp_path / "raw.json")
+    manager = DataManager(filename)
+    manager.save_data({"milestones": [], "keywords": []})
+    manager.add_milestone("k1", "")
+    manager.save_data()
+    return filename, manager.storage.journal.filename
+
+
+def test_append_and_read_round_trip(tmp_path):
+    journal = ChangeJournal(str(tmp_path / "raw.json.journal"))
+    journal.append([{"op": "a", "n": 1}, {"op": "b", "text": "한글"}])
+    journal.append([{"op": "c"}])
+    assert journal.read() == [{"op": "a", "n": 1}, {"op": "b", "text": "한글"}, {"op": "c"}]
+    assert journal.record_count == 3
+
+
+def test_torn_tail_is_truncated_before_next_append(tmp_path):
+    filename, journal_filename = _journaled_manager(tmp_path)
+    with open(journal_filename, "ab") as f:
+        f.write('{"op":"add_milestone","milestone":{"id":"x","title":"잘'.encode("utf-8")[:-1])
+
+    manager = DataManager(filename)
+    manager.load_data()
+    manager.add_milestone("k2", "")
+    manager.save_data()
+    manager.add_milestone("k3", "")
+    manager.save_data()
+
+    assert _titles(filename) == ["k1", "k2", "k3"]
+
+
+def test_append_after_unterminated_line_starts_new_line(tmp_path):
+    journal = ChangeJournal(str(tmp_path / "raw.json.journal"))
+    with open(journal.filename, "wb") as f:
+        f.write(b'{"op":"a"}\n{"op":"b"')
+    journal.append([{"op": "c"}])
+    assert journal.read() == [{"op": "a"}, {"op": "c"}]
+
+
+def test_complete_record_missing_newline_is_kept(tmp_path):
+    journal = ChangeJournal(str(tmp_path / "raw.json.journal"))
+    with open(journal.filename, "wb") as f:
+        f.write(b'{"op":"a"}\n{"op":"b"}')
+    assert journal.read() == [{"op": "a"}, {"op": "b"}]
+    journal.append([{"op": "c"}])
+    assert journal.read() == [{"op": "a"}, {"op": "b"}, {"op": "c"}]
+
+
+def test_corrupt_line_is_skipped(tmp_path):
+    journal = ChangeJournal(str(tmp_path / "raw.json.journal"))
+    with open(journal.filename, "wb") as f:
+        f.write(b'{"op":"a"}\n{"op":\n{"op":"c"}\n')
+    assert journal.read() == [{"op": "a"}, {"op": "c"}]
+
+
+def test_replay_matches_data_manager(tmp_path):
+    filename = str(tmp_path / "raw.json")
+    manager = DataManager(filename)
+    manager.save_data({"milestones": [
+        {"id": f"m{i}", "title": f"제목{i}", "subtitle": "", "category": "",
+         "nodes": [{"id": f"m{i}-n{j}", "content": "내용"} for j in range(2)]}
+        for i in range(5)], "keywords": []})
+    snapshot = json.loads(json.dumps(manager.data, default=to_json))
+    manager.add_milestone("새", "부제")
+    manager.update_milestone("m1", "바뀜", "", "분류")
+    manager.delete_milestone("m2")
+    manager.add_node("m0", {"content": "추가"})
+    manager.update_node("m3", "m3-n0", {"content": "수정"})
+    manager.delete_node("m4", "m4-n1")
+    manager.add_keyword("가")
+    with manager.transaction():
+        manager._commit({"op": "move_milestone", "id": "m4", "position": 0})
+    manager.save_data()
+
+    replayed = replay(snapshot, manager.storage.journal.read())
+    assert json.loads(json.dumps(replayed, default=to_json)) == \
+        json.loads(json.dumps(manager.data, default=to_json))
+
+
+def test_read_without_repair_leaves_torn_tail(tmp_path):
+    filename, journal_filename = _journaled_manager(tmp_path)
+    with open(journal_filename, 'ab') as f:
+        f.write(b'{"op":"add_milestone","milest')  # 다른 프로그램이 쓰는 중
+    with open(journal_filename, 'rb') as f:
+        before = f.read()
+    assert len(ChangeJournal(journal_filename).read(repair=False)) == 1
+    with open(journal_filename, 'rb') as f:
+        assert f.read() == before
@@ -0,0 +1,58 @@
+"""스트리밍 JSON 로더(json_stream.py) 테스트"""
+
+import json
+
+import pytest
+
+import json_stream
+from json_stream import LazyMilestone, load_lazily
+from models import to_json
+
+DATA = {
+    "version": 2,
+    "milestones": [
+        {"id": "1", "title": "따옴표 \"와\" 역슬래시 \\", "subtitle": "줄바꿈\n탭\t",
+         "extra": {"중첩": [1, 2.5, None, True, {"깊이": "값"}]},
+         "nodes": [{"id": "11", "content": "내용 [괄호] {중괄호}", "date": "24.05", "memo": "😀"},
+                   {"id": "12", "content": "", "date": "", "memo": "\u0000 제어 문자"}]},
+        {"id": "2", "title": "노드 없음", "subtitle": "", "nodes": []},
+        {"id": "3", "title": "긴 내용", "subtitle": "",
+         "nodes": [{"id": f"3-{i}", "content": "가나다" * 50, "date": "23.12"} for i in range(40)]},
+    ],
+    "keywords": ["가", "나"],
+}
+
+
+def _write(tmp_path, indent):
+    path = tmp_path / "raw.json"
+    path.write_text(json.dumps(DATA, ensure_ascii=False, indent=indent), encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1024 * 1024])
+def test_matches_json_load(tmp_path, monkeypatch, indent, chunk_size):
+    monkeypatch.setattr(json_stream, "READ_CHUNK_SIZE", chunk_size)
+    loaded = load_lazily(_write(tmp_path, indent))
+    assert json.loads(json.dumps(loaded, ensure_ascii=False, default=to_json)) == DATA
+
+
+def test_nodes_are_parsed_on_first_access(tmp_path):
+    loaded_ids = []
+    data = load_lazily(_write(tmp_path, 2))
+    first = data["milestones"][0]
+    assert isinstance(first, LazyMilestone) and not first.is_loaded
+    assert first["title"] == DATA["milestones"][0]["title"]
+    assert json.loads(first.raw_nodes()) == DATA["milestones"][0]["nodes"]
+
+    first.set_on_load(lambda milestone: loaded_ids.append(milestone["id"]))
+    assert first["nodes"] == DATA["milestones"][0]["nodes"]
+    assert first.is_loaded and first.raw_nodes() is None
+    assert loaded_ids == ["1"]
+
+
+def test_unterminated_file_raises(tmp_path):
+    path = tmp_path / "raw.json"
+    path.write_text(json.dumps(DATA, ensure_ascii=False)[:-40], encoding='utf-8')
+    with pytest.raises(ValueError):
+        load_lazily(str(path))
@@ -0,0 +1,84 @@
+"""빠른 검색(live_search.py) 테스트 - 세대 번호로 지난 결과 거르기와 취소
+
+작업 스레드 대신 작업을 모아 두었다가 테스트에서 직접 실행합니다 (PyQt6 필요).
+"""
+
+import pytest
+
+QCoreApplication = pytest.importorskip("PyQt6.QtCore").QCoreApplication
+
+from data_manager import DataManager
+from live_search import LiveSearch
+from search_snapshot import CHUNK_SIZE
+
+
+class _RecordingPool:
+    """시작한 작업을 실행하지 않고 모아 두는 스레드 풀 대용"""
+
+    def __init__(self):
+        self.tasks = []
+
+    def start(self, task):
+        self.tasks.append(task)
+
+    def tryTake(self, task):
+        if task in self.tasks:
+            self.tasks.remove(task)
+            return True
+        return False
+
+
+@pytest.fixture
+def live(tmp_path):
+    app = QCoreApplication.instance() or QCoreApplication([])
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data({"milestones": [
+        {"id": f"m{i}", "title": "노광기" if i % 2 else "장비", "subtitle": "", "nodes": []}
+        for i in range(CHUNK_SIZE * 2 + 10)], "keywords": []})
+    live = LiveSearch(manager)
+    live._pool = _RecordingPool()
+    live.results = {"partial": [], "finished": []}
+    live.partial_results.connect(live.results["partial"].append)
+    live.finished.connect(live.results["finished"].append)
+    live.app = app
+    return live
+
+
+def _start(live, query):
+    """디바운스를 기다리지 않고 검색을 시작해 작업을 반환"""
+    live.search(query)
+    live._start()
+    return live._pool.tasks[-1]
+
+
+def test_results_of_an_older_generation_are_dropped(live):
+    old = _start(live, "노광기")
+    new = _start(live, "장비")
+    assert old.cancelled
+    assert live._pool.tasks == [new]  # 시작하지 않은 작업은 풀에서 빠짐
+
+    old.cancelled = False  # 취소가 늦게 전달되어 끝까지 실행되더라도
+    old.run()
+    assert live.results == {"partial": [], "finished": []}
+
+    new.run()
+    expected = [m["id"] for m in live.data_manager.get_milestones() if m["title"] == "장비"]
+    assert live.results["finished"] == [expected]
+    assert [i for chunk in live.results["partial"] for i in chunk] == expected
+
+
+def test_cancel_stops_between_chunks(live):
+    task = _start(live, "노광기")
+    task.signals.partial.connect(lambda generation, chunk: task.cancel())
+    task.run()
+    assert len(live.results["partial"]) == 1
+    assert live.results["finished"] == []
+
+
+def test_search_sees_edits_made_after_the_previous_search(live):
+    _start(live, "노광기").run()
+    live.data_manager.update_milestone("m0", "노광기 추가", "")
+    live.data_manager.delete_milestone("m1")
+    _start(live, "노광기").run()
+    result = live.results["finished"][-1]
+    assert "m0" in result and "m1" not in result
@@ -0,0 +1,34 @@
+"""메모 색인 백그라운드 빌드(memo_indexer.py) 테스트 (PyQt6 필요)"""
+
+import os
+
+import pytest
+
+QCoreApplication = pytest.importorskip("PyQt6.QtCore").QCoreApplication
+
+from data_manager import MEMO_INDEX_SUFFIX, DataManager
+from memo_indexer import MemoIndexer
+from memo_search import MemoIndex
+
+
+def test_index_is_built_off_the_first_search(tmp_path, monkeypatch):
+    QCoreApplication.instance() or QCoreApplication([])
+    filename = str(tmp_path / "raw.json")
+    DataManager(filename).save_data({"milestones": [
+        {"id": "m1", "title": "가", "subtitle": "", "nodes": [
+            {"id": "n1", "content": "", "memo": "노광기 렌즈 교체"}]}], "keywords": []})
+    manager = DataManager(filename)
+    manager.load_data()
+    indexer = MemoIndexer(manager)
+    ready = []
+    indexer.ready.connect(lambda: ready.append(True))
+
+    indexer.start()
+    indexer.wait()
+    assert ready == [True] and not indexer.is_building
+    assert os.path.exists(filename + MEMO_INDEX_SUFFIX)
+
+    def fail(self, milestone):
+        raise AssertionError("검색하면서 색인을 다시 만듦")
+    monkeypatch.setattr(MemoIndex, "_add_milestone", fail)
+    assert [hit.node_id for hit in manager.search_memos("렌즈")] == ["n1"]
@@ -0,0 +1,140 @@
+"""메모 검색(memo_search.py) 테스트 - BM25 점수와 저장된 색인 재사용"""
+
+import math
+import os
+from collections import Counter
+
+import pytest
+
+from data_manager import MEMO_INDEX_SUFFIX, DataManager
+from memo_search import B, K1, MemoIndex, make_snippet, tokenize
+
+MEMOS = {
+    "n1": "노광기 렌즈 교체 일정 협의. 렌즈 납기 2주",
+    "n2": "회의록: 식각 설비 점검, 노광기 언급 없음",
+    "n3": "렌즈 렌즈 렌즈",
+    "n4": "Lens supplier meeting",
+    "n5": "",
+}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data({"milestones": [
+        {"id": "m1", "title": "가", "subtitle": "", "nodes": [
+            {"id": "n1", "content": "", "memo": MEMOS["n1"]},
+            {"id": "n2", "content": "", "memo": MEMOS["n2"]}]},
+        {"id": "m2", "title": "나", "subtitle": "", "nodes": [
+            {"id": node_id, "content": "", "memo": MEMOS[node_id]} for node_id in ("n3", "n4", "n5")]},
+    ], "keywords": []})
+    return manager
+
+
+def _bm25(memos, query):
+    """색인 없이 BM25 점수를 직접 계산"""
+    documents = {node_id: Counter(tokenize(memo)) for node_id, memo in memos.items() if tokenize(memo)}
+    average = sum(sum(tf.values()) for tf in documents.values()) / len(documents)
+    scores = Counter()
+    for term, query_tf in Counter(tokenize(query)).items():
+        containing = [node_id for node_id, tf in documents.items() if term in tf]
+        idf = math.log(1 + (len(documents) - len(containing) + 0.5) / (len(containing) + 0.5))
+        for node_id in containing:
+            tf = documents[node_id][term]
+            norm = K1 * (1 - B + B * sum(documents[node_id].values()) / average)
+            scores[node_id] += query_tf * idf * tf * (K1 + 1) / (tf + norm)
+    return scores
+
+
+def test_tokenize():
+    assert tokenize("노광기 Lens2 교체") == ["노광", "광기", "lens2", "교체"]
+
+
+@pytest.mark.parametrize("query", ["렌즈", "노광기 렌즈", "LENS", "점검 회의록", "없는말"])
+def test_scores_match_bm25(manager, query):
+    expected = _bm25(MEMOS, query)
+    hits = manager.search_memos(query)
+    assert {hit.node_id: hit.score for hit in hits} == pytest.approx(dict(expected))
+    assert [hit.score for hit in hits] == sorted((hit.score for hit in hits), reverse=True)
+
+
+def test_index_follows_edits(manager):
+    manager.search_memos("렌즈")
+    manager.update_node("m2", "n3", {"memo": "메모 삭제"})
+    manager.delete_node("m1", "n1")
+    memos = {**MEMOS, "n3": "메모 삭제"}
+    del memos["n1"]
+    assert {hit.node_id: hit.score for hit in manager.search_memos("렌즈 메모")} == \
+        pytest.approx(dict(_bm25(memos, "렌즈 메모")))
+
+
+def test_saved_index_is_reused_only_for_the_same_file(manager, monkeypatch):
+    expected = [(hit.node_id, hit.score) for hit in manager.search_memos("렌즈")]
+    manager.save_search_indexes()
+
+    def fail(self, milestone):
+        raise AssertionError("저장된 색인을 쓰지 않고 다시 색인함")
+
+    reloaded = DataManager(manager.filename)
+    reloaded.load_data()
+    with monkeypatch.context() as patch:
+        patch.setattr(MemoIndex, "_add_milestone", fail)
+        assert [(hit.node_id, hit.score) for hit in reloaded.search_memos("렌즈")] == expected
+
+    # 저장 파일이 바뀌었으면 저장된 색인을 버리고 다시 만듦
+    reloaded.update_node("m2", "n3", {"memo": "바뀐 메모"})
+    reloaded.save_data()
+    again = DataManager(manager.filename)
+    again.load_data()
+    assert "n3" not in {hit.node_id for hit in again.search_memos("렌즈")}
+
+
+def test_snippet_centers_on_match():
+    text = "가" * 100 + " 렌즈 교체 " + "나" * 100
+    snippet = make_snippet(text, "렌즈", radius=10)
+    assert "렌즈" in snippet and snippet.startswith("…") and snippet.endswith("…")
+
+
+def _fail_to_rebuild(monkeypatch):
+    def fail(self, milestone):
+        raise AssertionError("검색하면서 색인을 다시 만듦")
+    monkeypatch.setattr(MemoIndex, "_add_milestone", fail)
+
+
+def test_background_build_is_saved_and_follows_edits(manager, monkeypatch):
+    reloaded = DataManager(manager.filename)
+    reloaded.load_data()
+    build = reloaded.start_memo_index_build()
+    reloaded.update_node("m2", "n3", {"memo": "메모 삭제"})  # 빌드가 실행되는 동안의 편집
+    build.run()
+    assert not build.loaded and os.path.exists(manager.filename + MEMO_INDEX_SUFFIX)
+    assert reloaded.install_memo_index(build)
+    assert reloaded.start_memo_index_build() is None
+
+    memos = {**MEMOS, "n3": "메모 삭제"}
+    with monkeypatch.context() as patch:
+        _fail_to_rebuild(patch)
+        assert {hit.node_id: hit.score for hit in reloaded.search_memos("렌즈 메모")} == \
+            pytest.approx(dict(_bm25(memos, "렌즈 메모")))
+
+        # 작업 스레드에서 기록한 색인은 다음 실행 때 그대로 불러옴
+        again = DataManager(manager.filename)
+        again.load_data()
+        build = again.start_memo_index_build()
+        build.run()
+        assert build.loaded and again.install_memo_index(build)
+        assert {hit.node_id: hit.score for hit in again.search_memos("렌즈")} == \
+            pytest.approx(dict(_bm25(MEMOS, "렌즈")))
+
+
+def test_background_build_of_reloaded_data_is_dropped(manager):
+    build = manager.start_memo_index_build()
+    manager.load_data()
+    build.run()
+    assert not manager.install_memo_index(build)
+
+    # 검색하면서 먼저 만들었으면 빌드 결과는 버림
+    build = manager.start_memo_index_build()
+    assert {hit.node_id for hit in manager.search_memos("렌즈")} == {"n1", "n3"}
+    build.run()
+    assert not manager.install_memo_index(build)
@@ -0,0 +1,65 @@
+"""3-way 병합(merge.py) 테스트"""
+
+from merge import FIELD_CONFLICT, merge_data, merge_lists
+
+
+def _data(*milestones, keywords=()):
+    return {"milestones": list(milestones), "keywords": list(keywords)}
+
+
+def _milestone(milestone_id="m1", nodes=(), **fields):
+    return {"id": milestone_id, "title": "제목", "subtitle": "", **fields, "nodes": list(nodes)}
+
+
+def test_one_sided_changes_merge_without_conflicts():
+    base = _data(_milestone(nodes=[{"id": "n1", "content": "a"}]))
+    ours = _data(_milestone(title="우리", nodes=[{"id": "n1", "content": "a"}]))
+    theirs = _data(_milestone(nodes=[{"id": "n1", "content": "b"}, {"id": "n2", "content": "c"}]))
+
+    result = merge_data(base, ours, theirs)
+
+    assert result.conflicts == []
+    milestone = result.data["milestones"][0]
+    assert milestone["title"] == "우리"
+    assert [dict(node) for node in milestone["nodes"]] == [
+        {"id": "n1", "content": "b"}, {"id": "n2", "content": "c"}]
+
+
+def test_field_conflict_takes_chosen_side():
+    base = _data(_milestone(title="기준"))
+    ours = _data(_milestone(title="우리"))
+    theirs = _data(_milestone(title="상대"))
+
+    result = merge_data(base, ours, theirs)
+    assert [(c.kind, c.field, c.ours, c.theirs) for c in result.conflicts] == [
+        (FIELD_CONFLICT, "title", "우리", "상대")]
+    assert result.data["milestones"][0]["title"] == "우리"
+
+    result = merge_data(base, ours, theirs, [result.conflicts[0].key])
+    assert result.data["milestones"][0]["title"] == "상대"
+
+
+def test_choosing_explicit_null_keeps_the_field():
+    base = _data(_milestone(extra=1))
+    ours = _data(_milestone(extra=2))
+    theirs = _data(_milestone(extra=None))
+
+    conflict = merge_data(base, ours, theirs).conflicts[0]
+    merged = merge_data(base, ours, theirs, [conflict.key]).data["milestones"][0]
+
+    assert "extra" in merged and merged["extra"] is None
+
+
+def test_choosing_removed_field_drops_it():
+    base = _data(_milestone(extra=1))
+    ours = _data(_milestone(extra=2))
+    theirs = _data(_milestone())
+
+    conflict = merge_data(base, ours, theirs).conflicts[0]
+    merged = merge_data(base, ours, theirs, [conflict.key]).data["milestones"][0]
+
+    assert "extra" not in merged
+
+
+def test_merge_lists_applies_both_sides():
+    assert merge_lists(["a", "b"], ["a", "b", "c"], ["b", "d"]) == ["b", "c", "d"]
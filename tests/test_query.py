@@ -0,0 +1,71 @@
+"""검색 쿼리(query.py) 테스트 - 파서와 선택도 순 실행 계획"""
+
+import random
+
+import pytest
+
+from data_manager import DataManager
+from query import TEXT, Term, date_range, parse_query, plan_query, query_test
+
+
+@pytest.fixture
+def manager(tmp_path):
+    rng = random.Random(24)
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data({"milestones": [
+        {"id": f"m{i}", "title": rng.choice(["장비 반입", "노광기 점검", "회의"]),
+         "subtitle": rng.choice(["", "A라인", "R&D 과제"]),
+         "category": rng.choice(["", "R&D", "양산"]),
+         "nodes": [{"id": f"m{i}-n{j}", "content": rng.choice(["반입 완료", "점검", "설비 교체"]),
+                    "shape": rng.choice(["★", "●", "■"]), "color": rng.choice(["#FF0000", "#0000ff"]),
+                    "date": rng.choice(["23.11", "24.02", "24.08", "25.01", "25.03", "25.Q1", ""])}
+                   for j in range(rng.randrange(4))]}
+        for i in range(60)], "keywords": []})
+    return manager
+
+
+def test_parse_query():
+    assert parse_query('shape:★ -category:R&D "설비 교체" 제목:"노광기 점검"') == [
+        Term("shape", "★"), Term("category", "R&D", True),
+        Term(TEXT, "설비 교체"), Term("title", "노광기 점검")]
+
+
+@pytest.mark.parametrize("text", ["unknown:값", "shape:", "date:24.13", "date:25..24", 'title:""'])
+def test_parse_errors(text):
+    with pytest.raises(ValueError):
+        parse_query(text)
+
+
+def test_date_range():
+    assert date_range("24") == (24 * 12, 24 * 12 + 11)
+    assert date_range("24.Q3") == (24 * 12 + 6, 24 * 12 + 8)
+    assert date_range("24.Q3..25.01") == (24 * 12 + 6, 25 * 12)
+    assert date_range("..24.02")[1] == 24 * 12 + 1
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "shape:★",
+    "shape:★ date:24.Q3..25.Q1 content:반입 -category:R&D",
+    "color:#ff0000 -shape:●",
+    "date:24 title:점검",
+    "반입 -date:..24",
+    "category:양산 -content:설비",
+    "id:m3 shape:■",
+    "id:없음",
+    "r&d date:25.03",
+])
+def test_plan_matches_direct_check(manager, text):
+    terms = parse_query(text)
+    test = query_test(terms, manager)
+    expected = {m["id"] for m in manager.get_milestones() if test(m)}
+    assert manager.query_ids(text) == expected
+    assert [m["id"] for m in manager.query(text)] == \
+        [m["id"] for m in manager.get_milestones() if m["id"] in expected]
+
+
+def test_stages_run_most_selective_first(manager):
+    plan = plan_query(parse_query("-shape:★ id:m1 content:반입"), manager)
+    assert [stage.term.field for stage in plan.stages][0] == "id"
+    estimates = [stage.estimate for stage in plan.stages]
+    assert estimates == sorted(estimates)
@@ -0,0 +1,71 @@
+"""저장된 보기(saved_views.py) 테스트 - 증분 갱신한 결과가 다시 필터링한 결과와 같은지 확인"""
+
+import random
+
+import pytest
+
+from data_manager import DataManager
+from filter_plan import FilterPlan
+
+VIEWS = {
+    "별 모양": {"shape": "★"},
+    "점검": {"keyword": "점검"},
+    "반입 24.Q3": {"content_keyword": "반입", "date_filter": True, "filter_year": 24, "filter_quarter": 3},
+    "쿼리": {"query": "-shape:● category:R&D"},
+}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    rng = random.Random(25)
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data({"milestones": [
+        {"id": f"m{i}", "title": rng.choice(["노광기 점검", "장비 반입", "회의"]), "subtitle": "",
+         "category": rng.choice(["", "R&D"]),
+         "nodes": [{"id": f"m{i}-n{j}", "content": rng.choice(["반입 완료", "설비 교체"]),
+                    "shape": rng.choice(["★", "●"]), "date": rng.choice(["24.08", "24.Q3", "25.01"])}
+                   for j in range(rng.randrange(3))]}
+        for i in range(40)], "keywords": []})
+    for name, settings in VIEWS.items():
+        manager.saved_views.save_view(name, settings)
+    return manager
+
+
+def _check(manager):
+    views = manager.saved_views
+    for name, settings in VIEWS.items():
+        fresh = FilterPlan.compile(settings, manager)
+        expected = {m["id"] for m in manager.get_milestones() if fresh.evaluate(m)}
+        assert views.milestone_ids(name) == expected, name
+        assert views.count(name) == len(expected)
+
+
+def test_results_follow_edits(manager):
+    _check(manager)
+    manager.update_milestone("m0", "점검 추가", "", "R&D")
+    manager.delete_milestone("m1")
+    manager.add_node("m2", {"content": "반입 예정", "shape": "★", "date": "24.09"})
+    milestone = manager.add_milestone("새 점검", "", "R&D")
+    manager.add_node(milestone["id"], {"content": "", "shape": "★", "date": "25.01"})
+    _check(manager)
+    manager.undo()
+    _check(manager)
+
+
+def test_views_are_saved_next_to_the_data_file(manager):
+    reloaded = DataManager(manager.filename)
+    reloaded.load_data()
+    assert reloaded.saved_views.names() == list(VIEWS)
+    assert reloaded.saved_views.settings("점검") == VIEWS["점검"]
+    _check(reloaded)
+
+    assert reloaded.saved_views.delete_view("점검")
+    assert not reloaded.saved_views.delete_view("점검")
+    again = DataManager(manager.filename)
+    assert again.saved_views.names() == [name for name in VIEWS if name != "점검"]
+
+
+def test_blank_name_is_rejected(manager):
+    with pytest.raises(ValueError):
+        manager.saved_views.save_view("  ", {"shape": "★"})
+    assert manager.saved_views.plan("없는 보기") is None
@@ -0,0 +1,89 @@
+"""검색 스냅샷(search_snapshot.py) 테스트 - 바뀐 마일스톤만 고친 스냅샷이 새로 만든 것과 같은지 확인"""
+
+import random
+
+import pytest
+
+from data_manager import DataManager
+from search_snapshot import CHUNK_SIZE, SearchSnapshot, SnapshotTracker
+from text_index import normalize
+
+WORDS = ["노광기", "장비", "반입", "검사", "Lens"]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    rng = random.Random(23)
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data({"milestones": [
+        {"id": f"m{i}", "title": rng.choice(WORDS), "subtitle": "",
+         "nodes": [{"id": f"m{i}-n{j}", "content": rng.choice(WORDS)} for j in range(2)]}
+        for i in range(CHUNK_SIZE + 50)], "keywords": []})
+    return manager
+
+
+def _fresh(manager):
+    return SearchSnapshot.build(manager.get_milestones())
+
+
+def _search(snapshot, query, allowed=None):
+    return [milestone_id for chunk in snapshot.matching_chunks(normalize(query).split(), allowed)
+            for milestone_id in chunk]
+
+
+def test_patched_snapshot_matches_fresh_build(manager):
+    rng = random.Random(1)
+    tracker = SnapshotTracker(manager)
+    taken = []  # 작업에 넘긴 빌드 (나중에 스냅샷을 만들어도 그 버전 그대로여야 함)
+    for step in range(150):
+        milestone = rng.choice(manager.get_milestones())
+        action = rng.random()
+        if action < 0.3:
+            manager.add_node(milestone["id"], {"content": rng.choice(WORDS) + " 추가"})
+        elif action < 0.5:
+            manager.update_milestone(milestone["id"], rng.choice(WORDS) + "x", "")
+        elif action < 0.6:
+            manager.delete_milestone(milestone["id"])
+        elif action < 0.7:
+            manager.add_milestone("신규 검사", "")
+        elif action < 0.8:
+            manager.undo()
+        elif action < 0.85:
+            manager.add_keyword(f"키워드{step}")
+        if rng.random() < 0.4:
+            build = tracker.current()
+            taken.append((build, _fresh(manager)))
+    rng.shuffle(taken)  # 만드는 순서와 상관없이 각 버전 그대로
+    for build, expected in taken:
+        snapshot = build.get()
+        assert snapshot.order == expected.order
+        assert snapshot.texts == expected.texts
+
+
+def test_reload_without_notification_rebuilds(manager):
+    tracker = SnapshotTracker(manager)
+    tracker.current().get()
+    manager.update_milestone("m0", "바뀐 제목", "")
+    manager.save_data()
+    manager.load_data()  # 알림 없이 버전만 바뀜
+    assert tracker.current().get().texts == _fresh(manager).texts
+
+
+def test_matching_chunks(manager):
+    snapshot = _fresh(manager)
+    chunks = list(snapshot.matching_chunks(["노광기"]))
+    assert len(chunks) == 2  # 묶음마다 하나씩 (일치가 없어도)
+    for query in ["노광기", "장비 반입", "lens", "없는말"]:
+        words = normalize(query).split()
+        expected = [m["id"] for m in manager.get_milestones()
+                    if all(word in snapshot.texts[m["id"]] for word in words)]
+        assert _search(snapshot, query) == expected
+    allowed = frozenset(f"m{i}" for i in range(0, 300, 2))
+    assert set(_search(snapshot, "검사", allowed)) == set(_search(snapshot, "검사")) & allowed
+
+
+def test_words_do_not_match_across_fields(tmp_path):
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data({"milestones": [
+        {"id": "a", "title": "노광", "subtitle": "기", "nodes": []}], "keywords": []})
+    assert _search(_fresh(manager), "노광기") == []
@@ -0,0 +1,131 @@
+"""저장소 백엔드(storage.py, sqlite_storage.py, sharded_storage.py) 테스트"""
+
+import json
+import os
+
+import pytest
+
+from data_manager import DataManager
+from models import to_json
+from storage import JsonStorage, create_storage, migrate_storage, write_json_atomic
+
+BACKENDS = ["raw.json", "raw.db", "raw.shards"]
+
+
+def _plain(data):
+    """지연 로딩 객체를 일반 dict/list로 바꿔 비교할 수 있게 함"""
+    return json.loads(json.dumps(data, ensure_ascii=False, default=to_json))
+
+
+def _sample():
+    return {"milestones": [
+        {"id": f"m{i}", "title": f"제목{i}", "subtitle": "부제목", "category": "업무" if i % 2 else "",
+         "nodes": [{"id": f"m{i}-n{j}", "content": f"내용 {i}-{j}", "date": "24.05",
+                    "shape": "●", "color": "#ff0000", "memo": "메모"}
+                   for j in range(3)]}
+        for i in range(4)], "keywords": ["가", "나"]}
+
+
+def _reload(tmp_path, filename):
+    return _plain(DataManager(str(tmp_path / filename)).load_data())
+
+
+@pytest.mark.parametrize("filename", BACKENDS)
+def test_save_and_load_round_trip(tmp_path, filename):
+    manager = DataManager(str(tmp_path / filename))
+    manager.save_data(_sample())
+    assert _reload(tmp_path, filename) == _plain(manager.data)
+
+
+@pytest.mark.parametrize("filename", BACKENDS)
+def test_incremental_changes_round_trip(tmp_path, filename):
+    manager = DataManager(str(tmp_path / filename))
+    manager.save_data(_sample())
+    manager.add_milestone("새 마일스톤", "부제목", "개인")
+    manager.update_milestone("m1", "바뀐 제목", "바뀐 부제목", "업무")
+    manager.delete_milestone("m2")
+    manager.add_node("m0", {"content": "추가한 노드", "date": "24.06"})
+    manager.update_node("m3", "m3-n1", {"content": "바뀐 내용", "memo": ""})
+    manager.delete_node("m3", "m3-n2")
+    manager.add_keyword("다")
+    manager.save_data()
+
+    reloaded = _reload(tmp_path, filename)
+    assert reloaded == _plain(manager.data)
+    assert [m["title"] for m in reloaded["milestones"]] == ["제목0", "바뀐 제목", "제목3", "새 마일스톤"]
+    assert reloaded["keywords"] == ["가", "나", "다"]
+
+
+@pytest.mark.parametrize("filename", BACKENDS)
+def test_undo_round_trip(tmp_path, filename):
+    manager = DataManager(str(tmp_path / filename))
+    manager.save_data(_sample())
+    original = _plain(manager.data)
+    manager.delete_milestone("m1")
+    manager.delete_node("m0", "m0-n0")
+    manager.undo()
+    manager.undo()
+    manager.save_data()
+    assert _plain(manager.data) == original
+    assert _reload(tmp_path, filename) == original
+
+
+@pytest.mark.parametrize("filename", BACKENDS[1:])
+def test_migrate_from_json(tmp_path, filename):
+    source = DataManager(str(tmp_path / "raw.json"))
+    source.save_data(_sample())
+    source.delete_milestone("m0")
+    source.save_data()  # 저널에만 있는 변경도 함께 옮겨야 함
+
+    assert migrate_storage(str(tmp_path / "raw.json"), str(tmp_path / filename)) == 3
+    assert _reload(tmp_path, filename) == _plain(source.data)
+
+
+def test_create_storage_by_extension(tmp_path):
+    assert type(create_storage(str(tmp_path / "raw.json"))).__name__ == "JsonStorage"
+    assert type(create_storage(str(tmp_path / "raw.sqlite3"))).__name__ == "SqliteStorage"
+    assert type(create_storage(str(tmp_path / "raw.shards") + os.sep)).__name__ == "ShardedStorage"
+
+
+def test_json_journal_then_compaction(tmp_path):
+    filename = str(tmp_path / "raw.json")
+    manager = DataManager(filename)
+    manager.save_data(_sample())
+    with open(filename, 'rb') as f:
+        snapshot = f.read()
+
+    manager.update_milestone("m0", "저널에만", "")
+    manager.save_data()
+    with open(filename, 'rb') as f:
+        assert f.read() == snapshot  # 스냅샷은 그대로, 변경은 저널에
+    assert _reload(tmp_path, "raw.json")["milestones"][0]["title"] == "저널에만"
+
+    manager.compact()
+    assert not os.path.exists(filename + ".journal")
+    with open(filename, encoding='utf-8') as f:
+        assert json.load(f)["milestones"][0]["title"] == "저널에만"
+
+
+def test_json_backup_generations(tmp_path):
+    filename = str(tmp_path / "raw.json")
+    storage = JsonStorage(filename, backup_count=2)
+    for generation in range(4):
+        storage.compact({"milestones": [], "keywords": [str(generation)]})
+
+    def keywords(path):
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)["keywords"]
+
+    assert keywords(filename) == ["3"]
+    assert keywords(storage.backup_filename(0)) == ["2"]
+    assert keywords(storage.backup_filename(1)) == ["1"]
+    assert not os.path.exists(storage.backup_filename(2))
+
+
+def test_write_json_atomic_keeps_old_file_on_failure(tmp_path):
+    filename = str(tmp_path / "raw.json")
+    write_json_atomic(filename, {"keywords": ["원본"]})
+    with pytest.raises(TypeError):
+        write_json_atomic(filename, {"keywords": [object()]})
+    with open(filename, encoding='utf-8') as f:
+        assert json.load(f) == {"keywords": ["원본"]}
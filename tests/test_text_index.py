@@ -0,0 +1,55 @@
+"""텍스트 색인(text_index.py) 테스트 - 결과가 부분 문자열 검색과 같은지 확인"""
+
+import random
+
+from data_manager import DataManager
+from text_index import normalize
+
+
+def _scan(manager, query, contents):
+    query = normalize(query)
+    result = set()
+    for milestone in manager.get_milestones():
+        if contents:
+            texts = [node.get("content", "") for node in milestone["nodes"]]
+        else:
+            texts = [milestone.get("title", ""), milestone.get("subtitle", "")]
+        if any(query in normalize(text) for text in texts):
+            result.add(milestone["id"])
+    return result
+
+
+def test_matches_substring_scan_after_edits(tmp_path):
+    rng = random.Random(16)
+    words = ["노광기", "설비", "점검", "Wafer", "검사", "교체", "라인", "A1"]
+
+    def phrase():
+        return " ".join(rng.choice(words) for _ in range(3))
+
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data({"milestones": [
+        {"id": f"m{i}", "title": phrase(), "subtitle": phrase(),
+         "nodes": [{"id": f"m{i}-n{j}", "content": phrase(), "date": "24.05"} for j in range(3)]}
+        for i in range(30)], "keywords": []})
+    queries = ["노광", "설비 점검", "wafer", "a1", "검", "광기 설", "없는말"]
+    for query in queries:
+        assert manager.milestone_ids_with_heading(query) == _scan(manager, query, False)
+        assert manager.milestone_ids_with_content(query) == _scan(manager, query, True)
+
+    # 편집 후에는 바뀐 마일스톤만 다시 색인됨
+    manager.update_milestone("m0", "새 제목 노광기", "")
+    manager.delete_milestone("m1")
+    manager.update_node("m2", "m2-n0", {"content": "없는말 추가"})
+    manager.add_milestone("라인 교체", "")
+    for query in queries:
+        assert manager.milestone_ids_with_heading(query) == _scan(manager, query, False)
+        assert manager.milestone_ids_with_content(query) == _scan(manager, query, True)
+
+
+def test_empty_query_matches_every_milestone(tmp_path):
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data({"milestones": [
+        {"id": "a", "title": "제목", "subtitle": "", "nodes": []},
+        {"id": "b", "title": "", "subtitle": "", "nodes": []}], "keywords": []})
+    assert manager.milestone_ids_with_heading("") == {"a", "b"}
+    assert manager.milestone_ids_with_content("") == {"a", "b"}
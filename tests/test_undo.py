@@ -0,0 +1,83 @@
+"""실행 취소(undo.py) 테스트 - 역방향 레코드로 되돌리기, 합치기, 메모리 예산"""
+
+import json
+import random
+
+from data_manager import DataManager
+from models import to_json
+from undo import UndoHistory
+
+
+def _state(manager):
+    return json.dumps(manager.data, ensure_ascii=False, default=to_json, sort_keys=True)
+
+
+def _manager(tmp_path, **history):
+    manager = DataManager(str(tmp_path / "raw.json"))
+    manager.save_data({"milestones": [
+        {"id": f"m{i}", "title": f"제목{i}", "subtitle": "", "category": "",
+         "nodes": [{"id": f"m{i}-n{j}", "content": f"내용{j}", "date": "24.05"} for j in range(3)]}
+        for i in range(10)], "keywords": ["가"]})
+    manager.history = UndoHistory(**history)
+    return manager
+
+
+def test_undo_and_redo_random_edits(tmp_path):
+    rng = random.Random(13)
+    manager = _manager(tmp_path, coalesce_seconds=0)
+    states = [_state(manager)]
+    for step in range(60):
+        milestones = manager.get_milestones()
+        milestone = rng.choice(milestones)
+        action = step % 6
+        if action == 0 and len(milestones) > 3:
+            manager.delete_milestone(milestone["id"])
+        elif action == 1:
+            manager.add_milestone(f"새{step}", "부제")
+        elif action == 2:
+            manager.add_node(milestone["id"], {"content": f"노드{step}", "date": "24.06"})
+        elif action == 3 and milestone["nodes"]:
+            node = rng.choice(milestone["nodes"])
+            manager.update_node(milestone["id"], node["id"], {"content": f"수정{step}"})
+        elif action == 4 and milestone["nodes"]:
+            manager.delete_node(milestone["id"], rng.choice(milestone["nodes"])["id"])
+        else:
+            with manager.transaction():
+                manager.update_milestone(milestone["id"], f"제목{step}", "", "분류")
+                manager.add_keyword(f"키워드{step}")
+        states.append(_state(manager))
+
+    for expected in reversed(states[:-1]):
+        assert manager.undo()
+        assert _state(manager) == expected
+    assert not manager.undo()
+    for expected in states[1:]:
+        assert manager.redo()
+        assert _state(manager) == expected
+    assert not manager.redo()
+
+
+def test_quick_edits_of_the_same_target_are_one_step(tmp_path):
+    manager = _manager(tmp_path)
+    original = _state(manager)
+    for text in ("가", "가나", "가나다"):
+        manager.update_node("m0", "m0-n0", {"content": text})
+    manager.update_milestone("m1", "바뀜", "")
+    manager.undo()
+    assert manager.get_node("m0-n0")[1]["content"] == "가나다"
+    manager.undo()
+    assert _state(manager) == original
+    assert not manager.can_undo()
+
+
+def test_budget_drops_oldest_steps(tmp_path):
+    manager = _manager(tmp_path, budget=2000, coalesce_seconds=0)
+    for i in range(50):
+        manager.update_node("m0", "m0-n0", {"content": "내용" * 20 + str(i)})
+    assert manager.history.size <= 2000
+    kept = len(manager.history)
+    assert 1 <= kept < 50
+    while manager.undo():
+        pass
+    # 남은 단계만큼만 되돌아감
+    assert manager.get_node("m0-n0")[1]["content"] == "내용" * 20 + str(49 - kept)
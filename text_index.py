@@ -0,0 +1,173 @@
+"""텍스트 색인 모듈 - 제목/부제목/노드 내용 부분 문자열 검색용 역색인
+
+한국어는 조사가 단어에 붙어 공백 단위 토큰으로는 "노광기"로 "노광기의"를
+찾을 수 없으므로, 음절(문자) 단위 1-gram과 2-gram을 색인합니다. 검색어의
+n-gram 포스팅을 교집합해 후보를 좁힌 뒤 후보만 실제 부분 문자열로 확인하므로
+결과는 기존의 소문자 부분 문자열 검색과 같습니다. 조합형(NFD)으로 입력된
+한글도 완성형(NFC)으로 맞춰 비교합니다.
+
+DataManager가 트랜잭션마다 바뀐 마일스톤만 다시 색인합니다. 노드 내용 색인은
+노드를 모두 파싱해야 하므로 처음 내용 검색을 할 때 만듭니다.
+"""
+
+import unicodedata
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set
+
+# 여러 필드를 이어 붙일 때의 구분자 - 검색어가 필드 경계를 넘어 일치하지 않도록
+_SEPARATOR = "\x00"
+
+
+def normalize(text: str) -> str:
+    """비교용 정규화 (완성형 한글 + 소문자)"""
+    if not text.isascii():
+        text = unicodedata.normalize("NFC", text)
+    return text.lower()
+
+
+def ngrams(text: str) -> Set[str]:
+    """정규화된 텍스트의 1-gram과 2-gram 집합 (구분자를 걸치는 것은 제외)"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    grams.discard(_SEPARATOR)
+    return {gram for gram in grams if _SEPARATOR not in gram}
+
+
+def _query_grams(query: str) -> List[str]:
+    """검색어의 포스팅 키 (2글자 이상이면 2-gram, 한 글자면 1-gram)"""
+    if len(query) == 1:
+        return [query]
+    return list({query[i:i + 2] for i in range(len(query) - 1)})
+
+
+class _Postings:
+    """문서 ID(마일스톤 ID) 단위 n-gram 역색인"""
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = {}
+        self._grams: Dict[str, FrozenSet[str]] = {}
+        self._texts: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, doc_id: str, text: str) -> None:
+        """문서를 색인합니다 (이미 있으면 교체)."""
+        self.remove(doc_id)
+        grams = frozenset(ngrams(text))
+        postings = self._postings
+        for gram in grams:
+            posting = postings.get(gram)
+            if posting is None:
+                postings[gram] = {doc_id}
+            else:
+                posting.add(doc_id)
+        self._grams[doc_id] = grams
+        self._texts[doc_id] = text
+
+    def remove(self, doc_id: str) -> None:
+        """문서를 색인에서 제거합니다."""
+        grams = self._grams.pop(doc_id, None)
+        if grams is None:
+            return
+        del self._texts[doc_id]
+        postings = self._postings
+        for gram in grams:
+            posting = postings[gram]
+            posting.discard(doc_id)
+            if not posting:
+                del postings[gram]
+
+    def estimate(self, query: str) -> int:
+        """정규화된 검색어를 포함하는 문서 수의 상한 (가장 짧은 포스팅 길이)"""
+        if not query:
+            return len(self._texts)
+        return min(len(self._postings.get(gram, ())) for gram in _query_grams(query))
+
+    def search(self, query: str) -> Set[str]:
+        """정규화된 검색어를 부분 문자열로 포함하는 문서 ID 집합"""
+        if not query:
+            return set(self._texts)
+        postings = []
+        for gram in _query_grams(query):
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return candidates
+        if len(query) <= 2:
+            return candidates  # 포스팅 키가 검색어 자체이므로 확인 불필요
+        texts = self._texts
+        return {doc_id for doc_id in candidates if query in texts[doc_id]}
+
+
+class TextIndex:
+    """마일스톤 제목/부제목과 노드 내용의 역색인"""
+
+    def __init__(self):
+        self._headings = _Postings()
+        self._contents: Optional[_Postings] = None  # 처음 내용 검색 때 생성
+        self._milestones: Callable[[], Iterable[Dict]] = lambda: ()
+
+    def reset(self, milestones: Callable[[], Iterable[Dict]]) -> None:
+        """전체 데이터로 색인을 다시 만듭니다 (데이터를 새로 불러올 때).
+
+        Args:
+            milestones (Callable): 현재 마일스톤 목록을 반환하는 함수
+                (내용 색인을 나중에 만들 때 다시 호출)
+        """
+        self._milestones = milestones
+        self._headings = _Postings()
+        self._contents = None
+        for milestone in milestones():
+            self._headings.add(milestone["id"], _heading_text(milestone))
+
+    def update(self, milestone_ids: Iterable[str],
+               get_milestone: Callable[[str], Optional[Dict]]) -> None:
+        """바뀐 마일스톤만 다시 색인합니다 (없어진 마일스톤은 제거).
+
+        Args:
+            milestone_ids (Iterable[str]): 바뀐 마일스톤 ID
+            get_milestone (Callable): ID로 현재 마일스톤을 찾는 함수
+        """
+        for milestone_id in milestone_ids:
+            milestone = get_milestone(milestone_id)
+            if milestone is None:
+                self._headings.remove(milestone_id)
+                if self._contents is not None:
+                    self._contents.remove(milestone_id)
+                continue
+            self._headings.add(milestone_id, _heading_text(milestone))
+            if self._contents is not None:
+                self._contents.add(milestone_id, _content_text(milestone))
+
+    def search_headings(self, query: str) -> Set[str]:
+        """제목 또는 부제목에 검색어가 포함된 마일스톤 ID 집합"""
+        return self._headings.search(normalize(query))
+
+    def search_contents(self, query: str) -> Set[str]:
+        """노드 내용 중 하나에 검색어가 포함된 마일스톤 ID 집합"""
+        return self._content_postings().search(normalize(query))
+
+    def estimate_contents(self, query: str) -> int:
+        """노드 내용에 검색어가 포함된 마일스톤 수의 상한 (실행 계획용)"""
+        return self._content_postings().estimate(normalize(query))
+
+    def _content_postings(self) -> _Postings:
+        if self._contents is None:
+            self._contents = _Postings()
+            for milestone in self._milestones():
+                self._contents.add(milestone["id"], _content_text(milestone))
+        return self._contents
+
+
+def _heading_text(milestone: Dict) -> str:
+    return normalize(milestone.get("title", "") + _SEPARATOR + milestone.get("subtitle", ""))
+
+
+def _content_text(milestone: Dict) -> str:
+    return normalize(_SEPARATOR.join(node.get("content", "") for node in milestone.get("nodes", [])))
@@ -11,6 +11,8 @@ import math
 import os
 import platform
 
+from models import node_date
+
 
 class MemoDialog(QDialog):
     """메모 표시 다이얼로그"""
@@ -111,14 +113,14 @@ class TimelineCanvas(QWidget):
         from datetime import datetime
         current_year = datetime.now().year % 100  # 2025 -> 25
         
-        sorted_nodes = sorted(nodes, key=lambda n: self._parse_date(n.get("date", ""))) if nodes else []
+        sorted_nodes = sorted(nodes, key=self._date_value) if nodes else []
         
         # 연도 추출 (빈 연도 포함 + 현재 년도 기본 포함)
         years_set = set()
         years_set.add(current_year)  # 현재 년도는 항상 포함
         
         for node in sorted_nodes:
-            date_val = self._parse_date(node.get("date", ""))
+            date_val = self._date_value(node)
             year = date_val // 100
             years_set.add(year)
         
@@ -295,30 +297,12 @@ class TimelineCanvas(QWidget):
             for node_data, x, y in node_positions:
                 self._draw_node(node_data, x, y, timeline_y)
     
-    def _parse_date(self, date_str: str) -> int:
-        """날짜 문자열을 숫자로 변환"""
-        date_str = date_str.strip().upper()
-        
-        if "Q" in date_str:
-            parts = date_str.split("Q")
-            if len(parts) == 2:
-                try:
-                    year = int(parts[0].replace(".", "").strip())
-                    quarter = int(parts[1].strip())
-                    month = quarter * 3
-                    return year * 100 + month
-                except:
-                    return 2000
-        else:
-            parts = date_str.split(".")
-            if len(parts) == 2:
-                try:
-                    year = int(parts[0].strip())
-                    month = int(parts[1].strip())
-                    return year * 100 + month
-                except:
-                    return 2000
-        return 2000
+    def _date_value(self, node: Dict) -> int:
+        """노드 날짜를 배치용 숫자(연도*100 + 월, 분기는 마지막 달)로 변환"""
+        parsed = node_date(node)
+        if parsed is None:
+            return 2000
+        return parsed.year * 100 + parsed.timeline_month
     
     def _calculate_node_positions(self, nodes: List[Dict], years: List[int], 
                                    year_spacing: float, start_x: float, 
@@ -331,8 +315,7 @@ class TimelineCanvas(QWidget):
         from collections import defaultdict
         date_groups = defaultdict(list)
         for node in nodes:
-            date = node.get("date", "")
-            date_val = self._parse_date(date)
+            date_val = self._date_value(node)
             date_groups[date_val].append(node)
         
         # 1.5단계: 연도별 실제 존재하는 월 추출 (동적 높이 재할당을 위해)
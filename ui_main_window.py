@@ -2,16 +2,25 @@
 
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QScrollArea, QLabel, QCheckBox,
-                             QFrame, QMessageBox, QFileDialog)
-from PyQt6.QtCore import Qt, QSize
+                             QFrame, QMessageBox, QFileDialog, QLineEdit, QMenu,
+                             QInputDialog)
+from PyQt6.QtCore import Qt, QSize, QTimer
 from PyQt6.QtGui import QShortcut, QKeySequence, QPixmap, QPainter
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, FrozenSet
 
+import events
+from autosave import AutoSaver
 from data_manager import DataManager
+from events import ChangeEvent
 from custom_widgets import (MilestoneDialog, NodeDialog, SearchFilterDialog,
                             DateFilterDialog, ZoomableTimelineDialog,
                             KeywordBlock, MilestoneListBlock, ThisMonthBlock,
-                            MilestoneTreeDialog)
+                            MilestoneTreeDialog, MergeConflictDialog,
+                            MemoSearchDialog)
+from filter_plan import FilterPlan, FilterResultCache
+from live_search import LiveSearch
+from memo_indexer import MemoIndexer
+from merge import load_file, merge_data
 from timeline_canvas import TimelineCanvas
 
 
@@ -32,6 +41,14 @@ class MainWindow(QMainWindow):
         self.current_milestone_index = 0  # 현재 표시 중인 마일스톤 인덱스
         self.filtered_milestones = []  # 필터링된 마일스톤 목록
         self.selected_milestone_id_from_list: Optional[str] = None  # Milestone List에서 선택된 마일스톤 ID
+        self._filter_plan: Optional[FilterPlan] = None  # filter_settings를 컴파일한 필터 (설정이 바뀔 때까지 재사용)
+        self._filter_results = FilterResultCache()  # (데이터 버전, 필터) → 필터 결과
+        self._live_query = ""  # 툴바 빠른 검색어 (필터 결과 안에서 작업 스레드로 검색)
+        self._live_streaming = False  # 현재 빠른 검색의 결과가 목록에 표시되기 시작했는지
+        self._live_scope: Optional[FrozenSet[str]] = None  # 빠른 검색 범위 (필터 결과 ID)
+        self._live_scope_key = None  # 범위를 만든 (필터 키, 데이터 버전)
+        self._displayed_milestone_id: Optional[str] = None  # 행3에 표시 중인 마일스톤 ID
+        self._displayed_timeline: Optional[TimelineCanvas] = None  # 행3의 타임라인 캔버스
 
         self.setStyleSheet("""
             QMainWindow {
@@ -84,6 +101,27 @@ class MainWindow(QMainWindow):
 
         self._create_ui()
 
+        # 마지막 편집 2초 후 작업 스레드에서 자동 저장
+        self.autosaver = AutoSaver(self.data_manager, parent=self)
+        self.autosaver.state_changed.connect(lambda _state: self._update_data_status())
+        self.autosaver.save_failed.connect(self._on_autosave_failed)
+        self.data_manager.subscribe(self._on_data_changed)
+
+        # 툴바 빠른 검색 - 입력할 때마다 작업 스레드에서 검색해 결과를 나눠 표시
+        self.live_search = LiveSearch(self.data_manager, parent=self)
+        self.live_search.started.connect(self._on_live_search_started)
+        self.live_search.partial_results.connect(self._on_live_search_partial)
+        self.live_search.finished.connect(self._on_live_search_finished)
+
+        # 메모 검색 색인 - 데이터를 불러오면 작업 스레드에서 미리 준비
+        self.memo_indexer = MemoIndexer(self.data_manager, parent=self)
+
+        # 공유 폴더 동기화 등 외부에서 바뀐 데이터 파일 감지 (크기/수정 시각 폴링)
+        self.file_watch_timer = QTimer(self)
+        self.file_watch_timer.setInterval(2000)
+        self.file_watch_timer.timeout.connect(self._check_external_changes)
+        self.file_watch_timer.start()
+
         # 단축키 설정
         load_shortcut = QShortcut(QKeySequence("Ctrl+L"), self)
         load_shortcut.activated.connect(self.load_data)
@@ -94,6 +132,12 @@ class MainWindow(QMainWindow):
         delete_node_shortcut = QShortcut(QKeySequence("Ctrl+D"), self)
         delete_node_shortcut.activated.connect(self._delete_node_shortcut)
 
+        undo_shortcut = QShortcut(QKeySequence("Ctrl+Z"), self)
+        undo_shortcut.activated.connect(self.undo)
+
+        redo_shortcut = QShortcut(QKeySequence("Ctrl+Y"), self)
+        redo_shortcut.activated.connect(self.redo)
+
         # 프로그램 시작 시 자동 로드
         self.load_data(auto_load=True)
 
@@ -171,6 +215,11 @@ class MainWindow(QMainWindow):
         search_btn.clicked.connect(self.open_search_filter)
         toolbar.addWidget(search_btn)
 
+        memo_search_btn = QPushButton("📝 메모")
+        memo_search_btn.setObjectName("secondary")
+        memo_search_btn.clicked.connect(self.open_memo_search)
+        toolbar.addWidget(memo_search_btn)
+
         date_filter_btn = QPushButton("🗓️ 날짜")
         date_filter_btn.setObjectName("secondary")
         date_filter_btn.clicked.connect(self.filter_by_date)
@@ -186,6 +235,40 @@ class MainWindow(QMainWindow):
         export_btn.clicked.connect(self.export_image)
         toolbar.addWidget(export_btn)
 
+        merge_btn = QPushButton("🔀 병합")
+        merge_btn.setObjectName("secondary")
+        merge_btn.clicked.connect(self.merge_data_file)
+        toolbar.addWidget(merge_btn)
+
+        # 저장된 보기 (메뉴를 열 때마다 보기 목록과 개수를 다시 채움)
+        views_btn = QPushButton("⭐ 보기")
+        views_btn.setObjectName("secondary")
+        self.views_menu = QMenu(views_btn)
+        self.views_menu.aboutToShow.connect(self._rebuild_views_menu)
+        views_btn.setMenu(self.views_menu)
+        toolbar.addWidget(views_btn)
+
+        # 빠른 검색 입력란 (제목/부제목/노드 내용, 입력하는 동안 검색)
+        self.live_search_input = QLineEdit()
+        self.live_search_input.setPlaceholderText("⚡ 빠른 검색 (제목·내용)")
+        self.live_search_input.setClearButtonEnabled(True)
+        self.live_search_input.setFixedWidth(180)
+        self.live_search_input.setStyleSheet("""
+            QLineEdit {
+                background: white;
+                border: 1px solid #d2d2d7;
+                border-radius: 4px;
+                padding: 3px 8px;
+                font-size: 11px;
+                color: #1d1d1f;
+            }
+            QLineEdit:focus {
+                border: 1px solid #007AFF;
+            }
+        """)
+        self.live_search_input.textChanged.connect(self._on_live_search_changed)
+        toolbar.addWidget(self.live_search_input)
+
         toolbar.addStretch()
 
         # 필터 상태 표시 레이블
@@ -274,7 +357,7 @@ class MainWindow(QMainWindow):
         row2_layout.addWidget(self.keyword_block)
 
         # 이번달 일정 Block - 고정 높이
-        self.this_month_block = ThisMonthBlock(self)
+        self.this_month_block = ThisMonthBlock(self, self.data_manager)
         self.this_month_block.setFixedHeight(450)  # 고정 높이
         self.this_month_block.milestone_clicked.connect(
             self._filter_by_milestone_id)
@@ -358,8 +441,14 @@ class MainWindow(QMainWindow):
     def load_data(self, auto_load=False):
         """데이터 로드"""
         try:
+            # 진행 중인 백그라운드 저장이 끝난 뒤 다시 읽음
+            self.autosaver.wait()
             self.data_manager.load_data()
+            self.memo_indexer.start()
+            self.keyword_block.load_keywords()
             self._refresh_ui()
+            # 이번달 일정 Block - 노드 파싱이 필요하므로 목록을 먼저 그린 뒤 처리
+            QTimer.singleShot(0, self._update_this_month_block)
             self._update_data_status()
             if not auto_load:
                 self._show_message(QMessageBox.Icon.Information, "성공",
@@ -370,7 +459,7 @@ class MainWindow(QMainWindow):
                 self._show_message(QMessageBox.Icon.Critical, "오류", str(e))
 
     def save_data(self):
-        """데이터 저장 - 백업 자동 생성"""
+        """데이터 저장 - 변경 저널 기록"""
         milestones = self.data_manager.get_milestones()
 
         # 빈 데이터 저장 경고
@@ -401,27 +490,198 @@ class MainWindow(QMainWindow):
             if msg.exec() != QMessageBox.StandardButton.Yes:
                 return
 
+        # 작업 스레드에서 저장 - 결과는 데이터 상태 레이블에 표시
+        self.autosaver.save_now()
+
+    def _on_data_changed(self, changes: List[ChangeEvent]):
+        """데이터 변경 알림 - 바뀐 마일스톤만 다시 그리고 자동 저장 예약
+
+        키워드 Block과 이번달 일정 Block은 각자 변경 알림을 받아 갱신합니다.
+        """
+        # 빈 데이터는 자동 저장하지 않음 (저장 버튼에서 경고 후 저장)
+        if self.data_manager.get_milestones():
+            self.autosaver.schedule()
+        else:
+            self.autosaver.cancel()
+
+        changed_ids = {change.milestone_id for change in changes
+                       if change.kind != events.KEYWORDS_CHANGED}
+        if changed_ids:
+            self._patch_milestones(changes, changed_ids)
+
+    def _patch_milestones(self, changes: List[ChangeEvent], changed_ids: Set[str]):
+        """바뀐 마일스톤만 필터를 다시 평가해 목록과 행3을 갱신"""
+        if self._live_query:
+            # 빠른 검색 중이면 바뀐 데이터로 다시 검색 (이전 검색은 취소)
+            self._refresh_ui()
+            return
+        visible_ids = {m["id"] for m in self.filtered_milestones}
+        for milestone_id in changed_ids:
+            milestone = self.data_manager.get_milestone(milestone_id)
+            if milestone is not None and self._should_show_milestone(milestone):
+                visible_ids.add(milestone_id)
+            else:
+                visible_ids.discard(milestone_id)
+        self.filtered_milestones = [
+            m for m in self.data_manager.get_milestones() if m["id"] in visible_ids
+        ]
+
+        self.milestone_list_block.patch_milestones(self.filtered_milestones, changed_ids)
+
+        # 행3 - 표시 중이던 마일스톤을 계속 표시 (목록 안 위치가 바뀌어도 유지)
+        displayed_id = self._displayed_milestone_id
+        for i, m in enumerate(self.filtered_milestones):
+            if m["id"] == displayed_id:
+                self.current_milestone_index = i
+                break
+        else:
+            self._clamp_milestone_index()
+
+        if self._row3_milestone_id() != displayed_id:
+            self._show_current_milestone_for_row3()
+        elif displayed_id not in changed_ids:
+            self._update_milestone_nav()
+        elif self._displayed_timeline is not None and all(
+                change.kind in events.NODE_EVENTS
+                for change in changes if change.milestone_id == displayed_id):
+            # 노드만 바뀌었으면 블록은 두고 타임라인만 다시 그림
+            self._displayed_timeline.milestone_data = self.data_manager.get_milestone(displayed_id)
+            self._displayed_timeline.draw_timeline()
+            self._update_milestone_nav()
+        else:
+            self._show_current_milestone_for_row3()
+
+    def undo(self):
+        """실행 취소 (Ctrl+Z)"""
+        self._replay_history(self.data_manager.undo)
+
+    def redo(self):
+        """다시 실행 (Ctrl+Y)"""
+        self._replay_history(self.data_manager.redo)
+
+    def _replay_history(self, action):
+        """실행 취소/다시 실행 - 화면 갱신은 변경 알림에서 처리"""
         try:
-            import os
-            import shutil
+            if action():
+                # 다시 그려진 타임라인에는 선택 표시가 없으므로 노드 선택도 해제
+                self.selected_nodes_by_milestone.clear()
+        except Exception as e:
+            self._show_message(QMessageBox.Icon.Critical, "오류", str(e))
 
-            # 기존 파일이 있으면 백업 생성
-            if os.path.exists("raw.json"):
-                shutil.copy2("raw.json", "raw.json.backup")
+    def _check_external_changes(self):
+        """데이터 파일이 외부에서 바뀌었으면 바뀐 마일스톤/노드만 반영
 
-            data = {
-                "milestones": milestones,
-                "keywords": self.data_manager.get_keywords()
-            }
-            self.data_manager.save_data(data)
-            self._update_data_status()
+        필터, 선택, 페이지 위치는 변경 알림 경로(_on_data_changed)에서 유지됩니다.
+        """
+        # 자체 저장 중에는 파일이 바뀌는 중이므로 다음 확인으로 미룸
+        if self.autosaver.is_saving or not self.data_manager.has_external_changes():
+            return
+        try:
+            if self.data_manager.apply_external_changes():
+                self._update_data_status()
+        except Exception:
+            pass  # 다른 프로그램이 쓰는 도중일 수 있으므로 다음 확인 때 다시 시도
+
+    def merge_data_file(self):
+        """다른 곳에서 수정한 데이터 파일을 현재 데이터와 3-way 병합
+
+        공통 조상(두 파일이 갈라지기 전 상태)은 최근 백업(raw.json.backup)을
+        제안하되, 사용자가 확인하거나 다른 파일로 바꿉니다.
+        한쪽만 바꾼 내용은 자동으로 합치고, 양쪽이 다르게 바꾼 항목만
+        충돌 다이얼로그에서 선택합니다. 병합은 한 번에 실행 취소할 수 있습니다.
+        """
+        theirs_filename, _ = QFileDialog.getOpenFileName(
+            self, "병합할 데이터 파일 선택", "", "JSON Files (*.json);;All Files (*)")
+        if not theirs_filename:
+            return
+
+        base_filename = self._choose_merge_base(theirs_filename)
+        if not base_filename:
+            return
 
-            backup_msg = "\n(백업: raw.json.backup)" if os.path.exists(
-                "raw.json.backup") else ""
+        try:
+            base = load_file(base_filename)
+            theirs = load_file(theirs_filename)
+            result = merge_data(base, self.data_manager.data, theirs)
+            if result.conflicts:
+                dialog = MergeConflictDialog(self, result.conflicts)
+                if not dialog.exec():
+                    return
+                if dialog.take_theirs:
+                    result = merge_data(base, self.data_manager.data, theirs, dialog.take_theirs)
+            count = self.data_manager.apply_merged(result.data)
+            self._update_data_status()
             self._show_message(QMessageBox.Icon.Information, "성공",
-                               f"데이터가 저장되었습니다.{backup_msg}")
+                               f"병합을 마쳤습니다. ({count}개 변경 반영)")
         except Exception as e:
-            self._show_message(QMessageBox.Icon.Critical, "오류", str(e))
+            self._show_message(QMessageBox.Icon.Critical, "오류", f"병합 실패: {str(e)}")
+
+    def _choose_merge_base(self, theirs_filename: str) -> str:
+        """병합 기준(공통 조상) 파일을 확인받습니다.
+
+        최근 백업은 두 파일의 실제 공통 조상이 아닐 수 있으므로(그 뒤의 양쪽
+        수정이 새 변경으로 보여 잘못된 충돌이나 되돌림이 생김) 제안만 하고,
+        사용자가 확인하거나 다른 파일을 고르게 합니다.
+
+        Returns:
+            str: 병합 기준 파일 경로 (취소하면 "")
+        """
+        import os
+        from datetime import datetime
+
+        base_filename = self.data_manager.backup_filename()
+        while True:
+            if not base_filename or not os.path.exists(base_filename):
+                base_filename, _ = QFileDialog.getOpenFileName(
+                    self, "공통 조상(병합 기준) 파일 선택", os.path.dirname(theirs_filename),
+                    "JSON Files (*.json *.backup*);;All Files (*)")
+                if not base_filename:
+                    return ""
+            modified = datetime.fromtimestamp(os.path.getmtime(base_filename))
+            msg = QMessageBox(self)
+            msg.setIcon(QMessageBox.Icon.Question)
+            msg.setWindowTitle("병합 기준 확인")
+            msg.setText(f"병합 기준(공통 조상) 파일:\n{base_filename}\n"
+                        f"(수정: {modified:%Y-%m-%d %H:%M})\n\n"
+                        "두 파일이 갈라지기 전의 상태여야 합니다. 기준이 다르면 "
+                        "이미 반영된 수정이 충돌로 보이거나 되돌려질 수 있습니다.")
+            use_btn = msg.addButton("이 파일 사용", QMessageBox.ButtonRole.AcceptRole)
+            change_btn = msg.addButton("다른 파일 선택...", QMessageBox.ButtonRole.ActionRole)
+            msg.addButton("취소", QMessageBox.ButtonRole.RejectRole)
+            msg.exec()
+            clicked = msg.clickedButton()
+            if clicked is use_btn:
+                return base_filename
+            if clicked is not change_btn:
+                return ""
+            base_filename = ""  # 다음 반복에서 파일 선택
+
+    def _on_autosave_failed(self, message: str):
+        """자동 저장 실패 알림"""
+        self._show_message(QMessageBox.Icon.Critical, "오류", message)
+
+    def closeEvent(self, event):
+        """종료 전 저장되지 않은 변경 사항 기록"""
+        try:
+            if self.data_manager.get_milestones():
+                self.autosaver.flush()
+            else:
+                self.autosaver.wait()  # 빈 데이터는 경고 없이 저장하지 않음
+        except Exception as e:
+            reply = QMessageBox.question(
+                self, "저장 실패",
+                f"변경 사항을 저장하지 못했습니다.\n{str(e)}\n\n그래도 종료하시겠습니까?")
+            if reply != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+        self.live_search.cancel()
+        self.memo_indexer.wait()
+        try:
+            # 메모 검색 색인은 캐시이므로 기록하지 못해도 다음 실행 때 다시 만듦
+            self.data_manager.save_search_indexes()
+        except Exception:
+            pass
+        super().closeEvent(event)
 
     def create_milestone(self):
         """마일스톤 생성"""
@@ -432,7 +692,6 @@ class MainWindow(QMainWindow):
                 dialog.result["subtitle"],
                 dialog.result.get("category", "")
             )
-            self._refresh_ui()
 
     def delete_selected_milestones(self):
         """선택된 마일스톤 삭제"""
@@ -468,22 +727,36 @@ class MainWindow(QMainWindow):
         reply = msg.exec()
 
         if reply == QMessageBox.StandardButton.Yes:
-            for milestone_id in self.selected_milestone_ids:
-                self.data_manager.delete_milestone(milestone_id)
-            self.selected_milestone_ids.clear()
-            self._refresh_ui()
+            # 한 트랜잭션으로 삭제 - 화면 갱신은 끝날 때 한 번
+            with self.data_manager.transaction():
+                for milestone_id in self.selected_milestone_ids:
+                    self.data_manager.delete_milestone(milestone_id)
+                self.selected_milestone_ids.clear()
 
     def open_search_filter(self):
         """검색/필터 다이얼로그"""
-        dialog = SearchFilterDialog(self)
+        dialog = SearchFilterDialog(self, self.data_manager, self.filter_settings)
         if dialog.exec() and dialog.result:
-            self.filter_settings = dialog.result
+            # 검색 조건만 바꾸고 날짜/키워드 등 다른 필터는 유지
+            self._merge_filter_settings(**dialog.result)
             self._update_filter_status()
             self._refresh_ui()
 
+    def open_memo_search(self):
+        """메모 검색 다이얼로그 - 결과를 선택하면 해당 마일스톤으로 이동"""
+        dialog = MemoSearchDialog(self, self.data_manager)
+        dialog.milestone_selected.connect(self._jump_to_milestone)
+        dialog.exec()
+
+    def _jump_to_milestone(self, milestone_id: str):
+        """마일스톤 블록으로 이동 - 현재 필터에 없는 마일스톤이면 필터를 해제"""
+        if all(m["id"] != milestone_id for m in self.filtered_milestones):
+            self.clear_filter()
+        self._on_milestone_selected_from_tree(milestone_id)
+
     def filter_by_date(self):
         """날짜 필터 다이얼로그"""
-        dialog = DateFilterDialog(self)
+        dialog = DateFilterDialog(self, self.data_manager)
         if dialog.exec() and dialog.result:
             year = dialog.result["year"]
             quarter = dialog.result["quarter"]
@@ -497,12 +770,13 @@ class MainWindow(QMainWindow):
                 4: [10, 11, 12]
             }
 
-            self.filter_settings = {
-                "date_filter": True,
-                "filter_year": year % 100,  # 2025 -> 25
-                "filter_quarter": quarter,
-                "filter_months": quarter_months[quarter]
-            }
+            # 이번달 필터를 대신하고 다른 필터는 유지
+            self._merge_filter_settings(
+                date_filter=True,
+                filter_year=year % 100,  # 2025 -> 25
+                filter_quarter=quarter,
+                filter_months=quarter_months[quarter],
+                this_month=None, current_year=None, current_month=None)
             self._update_filter_status()
             self._refresh_ui()
 
@@ -513,33 +787,109 @@ class MainWindow(QMainWindow):
         current_year = today.year % 100
         current_month = today.month
 
-        self.filter_settings = {
-            "this_month": True,
-            "current_year": current_year,
-            "current_month": current_month
-        }
+        # 날짜 필터를 대신하고 다른 필터는 유지
+        self._merge_filter_settings(
+            this_month=True,
+            current_year=current_year,
+            current_month=current_month,
+            date_filter=None, filter_year=None, filter_quarter=None, filter_months=None)
         self._update_filter_status()
         self._refresh_ui()
 
     def _filter_by_milestone_id(self, milestone_id: str):
         """마일스톤 ID로 필터링 (KPI Chart 클릭 시)"""
         # 마일스톤 제목 찾기
-        milestone_title = ""
-        for m in self.data_manager.get_milestones():
-            if m.get("id") == milestone_id:
-                milestone_title = m.get("title", "")
-                break
+        milestone = self.data_manager.get_milestone(milestone_id)
+        milestone_title = milestone.get("title", "") if milestone else ""
         
-        self.filter_settings = {
-            "milestone_id": milestone_id,
-            "milestone_title": milestone_title
-        }
+        self._merge_filter_settings(milestone_id=milestone_id, milestone_title=milestone_title)
+        self._update_filter_status()
+        self._refresh_ui()
+
+    def _merge_filter_settings(self, **changes):
+        """필터 조건 일부만 바꾸고 나머지 조건은 유지 (빈 값은 조건 제거)"""
+        settings = dict(self.filter_settings or {})
+        for key, value in changes.items():
+            if value:
+                settings[key] = value
+            else:
+                settings.pop(key, None)
+        self.filter_settings = settings or None
+
+    def _rebuild_views_menu(self):
+        """저장된 보기 메뉴 - 보기 이름과 결과 마일스톤 수"""
+        views = self.data_manager.saved_views
+        self.views_menu.clear()
+        names = views.names()
+        for name in names:
+            # 결과는 증분 유지되므로 개수를 다시 필터링하지 않고 바로 표시
+            action = self.views_menu.addAction(f"{name} ({views.count(name)})")
+            action.triggered.connect(lambda checked=False, name=name: self.apply_saved_view(name))
+        if not names:
+            self.views_menu.addAction("저장된 보기 없음").setEnabled(False)
+        self.views_menu.addSeparator()
+        save_action = self.views_menu.addAction("💾 현재 필터 저장...")
+        save_action.setEnabled(bool(self.filter_settings))
+        save_action.triggered.connect(self.save_current_view)
+        if names:
+            delete_menu = self.views_menu.addMenu("🗑️ 보기 삭제")
+            for name in names:
+                action = delete_menu.addAction(name)
+                action.triggered.connect(lambda checked=False, name=name: self.delete_saved_view(name))
+
+    def save_current_view(self):
+        """현재 필터를 이름을 붙여 저장"""
+        if not self.filter_settings:
+            self._show_message(QMessageBox.Icon.Warning, "필터 필요",
+                               "저장할 필터를 먼저 적용해주세요.")
+            return
+        name, ok = QInputDialog.getText(self, "보기 저장", "보기 이름:")
+        name = name.strip()
+        if not ok or not name:
+            return
+        views = self.data_manager.saved_views
+        if name in views.names():
+            reply = QMessageBox.question(
+                self, "보기 저장", f"'{name}' 보기가 이미 있습니다.\n현재 필터로 바꾸시겠습니까?")
+            if reply != QMessageBox.StandardButton.Yes:
+                return
+        try:
+            views.save_view(name, self.filter_settings)
+        except Exception as e:
+            self._show_message(QMessageBox.Icon.Critical, "오류", f"보기 저장 실패: {str(e)}")
+
+    def apply_saved_view(self, name: str):
+        """저장된 보기의 필터 적용 (보기가 유지하는 결과를 그대로 사용)"""
+        plan = self.data_manager.saved_views.plan(name)
+        if plan is None:
+            return
+        # 보기의 조건으로 바꾸므로 키워드/Milestone List 선택 표시는 해제
+        self.keyword_block.clear_all_selections()
+        self.milestone_list_block.clear_selection()
+        self.selected_milestone_id_from_list = None
+        self.filter_settings = dict(plan.settings) if plan.settings else None
+        self._filter_plan = plan
         self._update_filter_status()
         self._refresh_ui()
 
+    def delete_saved_view(self, name: str):
+        """저장된 보기 삭제"""
+        reply = QMessageBox.question(self, "보기 삭제", f"'{name}' 보기를 삭제하시겠습니까?")
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        try:
+            self.data_manager.saved_views.delete_view(name)
+        except Exception as e:
+            self._show_message(QMessageBox.Icon.Critical, "오류", f"보기 삭제 실패: {str(e)}")
+
     def clear_filter(self):
         """필터 해제"""
         self.filter_settings = None
+        # 빠른 검색어도 해제 (아래 _refresh_ui에서 한 번만 갱신)
+        self._live_query = ""
+        self.live_search_input.blockSignals(True)
+        self.live_search_input.clear()
+        self.live_search_input.blockSignals(False)
         # 키워드 블록의 선택도 해제
         self.keyword_block.clear_all_selections()
         # Milestone List 블록의 선택도 해제
@@ -566,6 +916,7 @@ class MainWindow(QMainWindow):
             if milestone_list_id and milestone_list_title:
                 status_parts.append(f"📋 선택: {milestone_list_title}")
 
+            query = self.filter_settings.get("query", "")
             keyword = self.filter_settings.get("keyword", "")
             content_keyword = self.filter_settings.get("content_keyword", "")
             shape = self.filter_settings.get("shape", "")
@@ -583,6 +934,8 @@ class MainWindow(QMainWindow):
                 year = self.filter_settings.get("filter_year", 0)
                 quarter = self.filter_settings.get("filter_quarter", 0)
                 status_parts.append(f"🗓️ {year}년 Q{quarter}")
+            if query:
+                status_parts.append(f"쿼리: '{query}'")
             if keyword:
                 status_parts.append(f"제목/부제목: '{keyword}'")
             if content_keyword:
@@ -667,22 +1020,75 @@ class MainWindow(QMainWindow):
     def _refresh_ui(self):
         """UI 새로고침 - 페이지네이션 방식"""
         milestones = self.data_manager.get_milestones()
+        plan = self._current_filter_plan()
 
-        # 필터링된 마일스톤 목록 생성 (키워드 필터 적용)
-        self.filtered_milestones = [
-            m for m in milestones if self._should_show_milestone(m)
-        ]
+        if self._live_query:
+            # 빠른 검색어가 있으면 필터 결과 안에서 작업 스레드로 검색
+            # - 목록과 행3은 결과가 도착할 때 갱신 (_on_live_search_partial/finished)
+            # - 입력할 때마다 목록을 만들지 않도록 필터 결과 ID 집합을 재사용
+            self.live_search.search(self._live_query, self._live_search_scope(plan))
+            return
 
-        # 키워드 Block reload
-        self.keyword_block.load_keywords()
+        # 컴파일된 필터로 목록 생성 - 데이터 버전과 필터가 그대로면 캐시된 결과 사용
+        # (키워드 Block 갱신, 선택 해제, 이전 필터로 되돌아가기 등)
+        filtered = self._filter_results.filter(plan, self.data_manager.version, lambda: milestones)
+        self.live_search.cancel()
+        self.filtered_milestones = filtered
 
         # Milestone List Block 업데이트 (키워드 필터링된 결과만 표시)
         self.milestone_list_block.update_milestones(self.filtered_milestones)
 
-        # 이번달 일정 Block 업데이트
-        self.this_month_block.update_nodes(milestones)
-
         # 현재 인덱스 범위 확인 및 조정
+        self._clamp_milestone_index()
+
+        # 현재 마일스톤 표시 (행3)
+        self._show_current_milestone_for_row3()
+
+    def _live_search_scope(self, plan: FilterPlan) -> Optional[FrozenSet[str]]:
+        """빠른 검색 범위 - 필터 결과 ID (필터가 없으면 None)
+
+        작업 스레드가 읽으므로 고정된 사본을 넘기며, 필터와 데이터 버전이
+        그대로면 같은 사본을 다시 씁니다.
+        """
+        ids = plan.milestone_ids()
+        if ids is None:
+            return None
+        key = (plan.key, self.data_manager.version)
+        if self._live_scope_key != key:
+            self._live_scope = frozenset(ids)
+            self._live_scope_key = key
+        return self._live_scope
+
+    def _on_live_search_changed(self, text: str):
+        """빠른 검색어 입력 - 검색어가 없으면 필터 결과로 되돌림"""
+        self._live_query = text.strip()
+        self._refresh_ui()
+
+    def _on_live_search_started(self):
+        """새 빠른 검색 시작 - 첫 결과가 오면 목록을 교체"""
+        self._live_streaming = False
+
+    def _on_live_search_partial(self, milestone_ids: List[str]):
+        """빠른 검색의 중간 결과를 목록에 이어서 표시"""
+        milestones = [m for m in map(self.data_manager.get_milestone, milestone_ids)
+                      if m is not None]
+        if self._live_streaming:
+            self.milestone_list_block.append_milestones(milestones)
+        else:
+            self._live_streaming = True
+            self.milestone_list_block.update_milestones(milestones)
+
+    def _on_live_search_finished(self, milestone_ids: List[str]):
+        """빠른 검색 완료 - 결과를 현재 목록으로 삼고 행3 갱신"""
+        self.filtered_milestones = [m for m in map(self.data_manager.get_milestone, milestone_ids)
+                                    if m is not None]
+        if not self._live_streaming:
+            self.milestone_list_block.update_milestones(self.filtered_milestones)
+        self._clamp_milestone_index()
+        self._show_current_milestone_for_row3()
+
+    def _clamp_milestone_index(self):
+        """현재 인덱스를 필터링된 목록 범위 안으로 조정"""
         if not self.filtered_milestones:
             self.current_milestone_index = 0
         elif self.current_milestone_index >= len(self.filtered_milestones):
@@ -690,177 +1096,61 @@ class MainWindow(QMainWindow):
                 0,
                 len(self.filtered_milestones) - 1)
 
-        # 현재 마일스톤 표시 (행3)
-        self._show_current_milestone_for_row3()
+    def _current_filter_plan(self) -> FilterPlan:
+        """현재 filter_settings의 컴파일된 필터 (설정이 바뀌었을 때만 다시 컴파일)"""
+        if self._filter_plan is None or not self._filter_plan.compiled_from(self.filter_settings):
+            self._filter_plan = FilterPlan.compile(self.filter_settings, self.data_manager)
+        return self._filter_plan
+
+    def _update_this_month_block(self):
+        """이번달 일정 Block 갱신"""
+        self.this_month_block.update_nodes()
 
     def _update_data_status(self):
         """데이터 상태 레이블 업데이트"""
         milestones = self.data_manager.get_milestones()
         count = len(milestones)
 
+        save_status = self._save_status_text()
+
         if count == 0:
-            self.data_status_label.setText("⚠️ 데이터 없음")
+            self.data_status_label.setText(f"⚠️ 데이터 없음{save_status}")
             self.data_status_label.setStyleSheet("""
                 color: #FF9500;
                 font-size: 9px;
                 padding: 0px;
             """)
+        elif self.autosaver.state == AutoSaver.FAILED:
+            self.data_status_label.setText(f"❌ 데이터 로드됨 ({count}개){save_status}")
+            self.data_status_label.setStyleSheet("""
+                color: #FF3B30;
+                font-size: 9px;
+                padding: 0px;
+            """)
         else:
-            self.data_status_label.setText(f"✅ 데이터 로드됨 ({count}개)")
+            self.data_status_label.setText(f"✅ 데이터 로드됨 ({count}개){save_status}")
             self.data_status_label.setStyleSheet("""
                 color: #34C759;
                 font-size: 9px;
                 padding: 0px;
             """)
 
+    def _save_status_text(self) -> str:
+        """자동 저장 상태 문구"""
+        state = self.autosaver.state
+        if state == AutoSaver.SAVING:
+            return " · 저장 중..."
+        if state == AutoSaver.FAILED:
+            return " · 저장 실패"
+        if self.data_manager.has_unsaved_changes():
+            return " · 저장 대기"
+        if state == AutoSaver.SAVED:
+            return f" · 저장됨 ({self.autosaver.last_latency_ms:.0f}ms)"
+        return ""
+
     def _should_show_milestone(self, milestone: Dict) -> bool:
-        """필터링 - 제목과 부제목에서만 검색"""
-        if not self.filter_settings:
-            return True
-
-        # 마일스톤 ID 필터 (KPI Chart 클릭)
-        milestone_id_filter = self.filter_settings.get("milestone_id", "")
-        if milestone_id_filter:
-            return milestone.get("id") == milestone_id_filter
-
-        # 키워드 필터 (여러 키워드 AND 조건)
-        if self.filter_settings.get("type") == "keyword":
-            keywords = self.filter_settings.get("keywords", [])
-            if keywords:
-                title = milestone.get("title", "").lower()
-                subtitle = milestone.get("subtitle", "").lower()
-                combined_text = title + " " + subtitle
-
-                # 모든 키워드가 제목+부제목에 포함되어야 함 (AND 조건)
-                for kw in keywords:
-                    if kw.lower() not in combined_text:
-                        return False
-
-        keyword = self.filter_settings.get("keyword", "")
-        shape_filter = self.filter_settings.get("shape")
-        this_month = self.filter_settings.get("this_month", False)
-
-        # 이번달 일정 필터
-        if this_month:
-            current_year = self.filter_settings.get("current_year", 0)
-            current_month = self.filter_settings.get("current_month", 0)
-
-            # 노드 중에 이번달에 해당하는 노드가 있는지 확인
-            has_this_month_node = False
-            for node in milestone.get("nodes", []):
-                date_str = node.get("date", "").strip().upper()
-
-                # 날짜 파싱
-                if "Q" in date_str:
-                    # 24.Q3 형식
-                    parts = date_str.split("Q")
-                    if len(parts) == 2:
-                        try:
-                            year = int(parts[0].replace(".", "").strip())
-                            quarter = int(parts[1].strip())
-                            # 분기를 월로 변환 (Q1=3월, Q2=6월, Q3=9월, Q4=12월)
-                            month = quarter * 3
-                            if year == current_year and month == current_month:
-                                has_this_month_node = True
-                                break
-                        except:
-                            pass
-                else:
-                    # 24.10 형식
-                    parts = date_str.split(".")
-                    if len(parts) == 2:
-                        try:
-                            year = int(parts[0].strip())
-                            month = int(parts[1].strip())
-                            if year == current_year and month == current_month:
-                                has_this_month_node = True
-                                break
-                        except:
-                            pass
-
-            if not has_this_month_node:
-                return False
-
-        # 날짜 필터 (년도 + 분기)
-        date_filter = self.filter_settings.get("date_filter", False)
-        if date_filter:
-            filter_year = self.filter_settings.get("filter_year", 0)
-            filter_months = self.filter_settings.get("filter_months", [])
-
-            # 노드 중에 해당 년도의 해당 분기 월에 해당하는 노드가 있는지 확인
-            has_matching_date_node = False
-            for node in milestone.get("nodes", []):
-                date_str = node.get("date", "").strip().upper()
-
-                # 날짜 파싱
-                if "Q" in date_str:
-                    # 24.Q3 형식
-                    parts = date_str.split("Q")
-                    if len(parts) == 2:
-                        try:
-                            year = int(parts[0].replace(".", "").strip())
-                            quarter = int(parts[1].strip())
-                            # 분기를 월로 변환
-                            quarter_months = {
-                                1: [1, 2, 3],
-                                2: [4, 5, 6],
-                                3: [7, 8, 9],
-                                4: [10, 11, 12]
-                            }
-                            node_months = quarter_months.get(quarter, [])
-                            # 년도가 일치하고, 분기의 월이 겹치는지 확인
-                            if year == filter_year and any(
-                                    m in filter_months for m in node_months):
-                                has_matching_date_node = True
-                                break
-                        except:
-                            pass
-                else:
-                    # 24.10 형식
-                    parts = date_str.split(".")
-                    if len(parts) == 2:
-                        try:
-                            year = int(parts[0].strip())
-                            month = int(parts[1].strip())
-                            # 년도가 일치하고, 월이 필터 월에 포함되는지 확인
-                            if year == filter_year and month in filter_months:
-                                has_matching_date_node = True
-                                break
-                        except:
-                            pass
-
-            if not has_matching_date_node:
-                return False
-
-        # 키워드 검색: 제목과 부제목에서만
-        if keyword:
-            title = milestone.get("title", "").lower()
-            subtitle = milestone.get("subtitle", "").lower()
-            if keyword.lower() not in title and keyword.lower(
-            ) not in subtitle:
-                return False
-
-        # 내용 검색: 노드의 content 필드에서
-        content_keyword = self.filter_settings.get("content_keyword", "")
-        if content_keyword:
-            has_matching_content = False
-            for node in milestone.get("nodes", []):
-                node_content = node.get("content", "").lower()
-                if content_keyword.lower() in node_content:
-                    has_matching_content = True
-                    break
-            if not has_matching_content:
-                return False
-
-        # 모양 필터
-        if shape_filter:
-            has_matching_shape = any(
-                node.get("shape") == shape_filter
-                for node in milestone.get("nodes", []))
-            if not has_matching_shape:
-                return False
-
-        return True
+        """필터링 - 컴파일된 필터의 모든 조건을 만족하는지 확인"""
+        return self._current_filter_plan().matches(milestone)
 
     def _create_milestone_block(self, milestone: Dict):
         """라이트 모드 마일스톤 블록 생성"""
@@ -1004,6 +1294,7 @@ class MainWindow(QMainWindow):
         # 메인 UI에서는 350px 고정 높이로 스크롤 없이 전체 표시
         timeline.setFixedHeight(350)
         block_layout.addWidget(timeline)
+        block.timeline = timeline  # 노드 변경 시 타임라인만 다시 그리기 위해 보관
 
         # 위젯 반환 (추가는 호출하는 쪽에서)
         return block
@@ -1019,11 +1310,7 @@ class MainWindow(QMainWindow):
     def _edit_milestone(self, milestone_id: str):
         """마일스톤 수정"""
         # 마일스톤 찾기
-        milestone = None
-        for m in self.data_manager.get_milestones():
-            if m["id"] == milestone_id:
-                milestone = m
-                break
+        milestone = self.data_manager.get_milestone(milestone_id)
 
         if not milestone:
             self._show_message(QMessageBox.Icon.Warning, "경고",
@@ -1039,14 +1326,12 @@ class MainWindow(QMainWindow):
                 dialog.result["subtitle"],
                 dialog.result.get("category", "")
             )
-            self._refresh_ui()
 
     def _add_node_to_milestone(self, milestone_id: str):
         """노드 추가"""
         dialog = NodeDialog(self)
         if dialog.exec() and dialog.result:
             self.data_manager.add_node(milestone_id, dialog.result)
-            self._refresh_ui()
 
     def _on_node_selected(self, milestone_id: str, node_data: Optional[Dict]):
         """노드 선택 - 마일스톤별로 독립적으로 관리"""
@@ -1062,10 +1347,10 @@ class MainWindow(QMainWindow):
 
         dialog = NodeDialog(self, node_data=selected_node)
         if dialog.exec() and dialog.result:
-            self.data_manager.update_node(milestone_id, selected_node["id"],
-                                          dialog.result)
-            self.selected_nodes_by_milestone[milestone_id] = None
-            self._refresh_ui()
+            with self.data_manager.transaction():
+                self.data_manager.update_node(milestone_id, selected_node["id"],
+                                              dialog.result)
+                self.selected_nodes_by_milestone[milestone_id] = None
 
     def _delete_node(self, milestone_id: str):
         """노드 삭제 - 해당 마일스톤의 선택된 노드만 삭제"""
@@ -1101,9 +1386,9 @@ class MainWindow(QMainWindow):
         reply = msg.exec()
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.data_manager.delete_node(milestone_id, selected_node["id"])
-            self.selected_nodes_by_milestone[milestone_id] = None
-            self._refresh_ui()
+            with self.data_manager.transaction():
+                self.data_manager.delete_node(milestone_id, selected_node["id"])
+                self.selected_nodes_by_milestone[milestone_id] = None
 
     def _delete_node_shortcut(self):
         """단축키로 노드 삭제 - 선택된 노드 삭제"""
@@ -1123,19 +1408,11 @@ class MainWindow(QMainWindow):
 
     def _on_keyword_filter_changed(self, selected_keywords: List[str]):
         """키워드 필터 변경 핸들러"""
-        # 키워드가 선택되면 필터 적용
-        if selected_keywords:
-            self.filter_settings = {
-                "type": "keyword",
-                "keywords": selected_keywords
-            }
-            self._update_filter_status()
-        else:
-            # 키워드가 없으면 필터 해제
-            if self.filter_settings and self.filter_settings.get(
-                    "type") == "keyword":
-                self.clear_filter()
-                return  # clear_filter()가 _refresh_ui()를 호출하므로 여기서 종료
+        # 키워드 조건만 바꾸고 다른 필터는 유지 (키워드가 없으면 키워드 조건만 해제)
+        self._merge_filter_settings(type="keyword" if selected_keywords else None,
+                                    keywords=list(selected_keywords),
+                                    milestone_list_id=None, milestone_list_title=None)
+        self._update_filter_status()
 
         # Milestone List 선택 초기화 (키워드 변경 시)
         self.milestone_list_block.clear_selection()
@@ -1155,18 +1432,9 @@ class MainWindow(QMainWindow):
                 milestone_title = m.get("title", "")
                 break
         
-        # 필터 설정 업데이트 (기존 키워드 필터는 유지하고 마일스톤 선택 추가)
-        if self.filter_settings and self.filter_settings.get("type") == "keyword":
-            # 키워드 필터가 있으면 마일스톤 선택 정보 추가
-            self.filter_settings["milestone_list_id"] = milestone_id
-            self.filter_settings["milestone_list_title"] = milestone_title
-        else:
-            # 키워드 필터가 없으면 마일스톤 선택만 설정
-            self.filter_settings = {
-                "type": "milestone_list",
-                "milestone_list_id": milestone_id,
-                "milestone_list_title": milestone_title
-            }
+        # 필터 설정 업데이트 (기존 필터는 유지하고 마일스톤 선택 정보 추가)
+        self._merge_filter_settings(milestone_list_id=milestone_id,
+                                    milestone_list_title=milestone_title)
         
         # 필터 상태 표시 업데이트
         self._update_filter_status()
@@ -1194,43 +1462,22 @@ class MainWindow(QMainWindow):
             if widget:
                 widget.deleteLater()
 
-        # Milestone List에서 선택된 마일스톤이 있으면 해당 마일스톤만 표시
-        if self.selected_milestone_id_from_list:
-            # filtered_milestones에서 해당 마일스톤 찾기
-            selected_milestone = None
-            for m in self.filtered_milestones:
-                if m.get("id") == self.selected_milestone_id_from_list:
-                    selected_milestone = m
-                    break
-            
-            if selected_milestone:
-                milestone_widget = self._create_milestone_block(selected_milestone)
-                self.milestone_layout.addWidget(milestone_widget)
-                
-                # 페이지네이션 비활성화 (단일 마일스톤만 표시)
-                self.prev_btn.setEnabled(False)
-                self.next_btn.setEnabled(False)
-                self.milestone_nav_label.setText("1 / 1")
-            else:
-                # 선택된 마일스톤이 필터링된 목록에 없음
-                no_data_label = QLabel("선택된 마일스톤이 필터링되어 표시되지 않습니다.")
-                no_data_label.setStyleSheet("""
-                    font-size: 14px;
-                    color: #86868b;
-                    padding: 50px;
-                """)
-                no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.milestone_layout.addWidget(no_data_label)
-                
-                self.prev_btn.setEnabled(False)
-                self.next_btn.setEnabled(False)
-                self.milestone_nav_label.setText("0 / 0")
-            return
+        self._displayed_milestone_id = self._row3_milestone_id()
+        self._displayed_timeline = None
 
-        # Milestone List 선택이 없으면 기존 페이지네이션 방식
-        # 마일스톤이 없으면 빈 메시지 표시
-        if not self.filtered_milestones:
-            no_data_label = QLabel("마일스톤이 없습니다.")
+        if self._displayed_milestone_id is not None:
+            milestone = self.data_manager.get_milestone(self._displayed_milestone_id)
+            milestone_widget = self._create_milestone_block(milestone)
+            self.milestone_layout.addWidget(milestone_widget)
+            self._displayed_timeline = milestone_widget.timeline
+        else:
+            if self.selected_milestone_id_from_list:
+                # 선택된 마일스톤이 필터링된 목록에 없음
+                message = "선택된 마일스톤이 필터링되어 표시되지 않습니다."
+            else:
+                # 마일스톤이 없으면 빈 메시지 표시
+                message = "마일스톤이 없습니다."
+            no_data_label = QLabel(message)
             no_data_label.setStyleSheet("""
                 font-size: 14px;
                 color: #86868b;
@@ -1239,25 +1486,41 @@ class MainWindow(QMainWindow):
             no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.milestone_layout.addWidget(no_data_label)
 
+        self._update_milestone_nav()
+
+    def _row3_milestone_id(self) -> Optional[str]:
+        """행3에 표시할 마일스톤 ID (표시할 마일스톤이 없으면 None)"""
+        # Milestone List에서 선택된 마일스톤이 있으면 해당 마일스톤만 표시
+        if self.selected_milestone_id_from_list:
+            for m in self.filtered_milestones:
+                if m.get("id") == self.selected_milestone_id_from_list:
+                    return m["id"]
+            return None
+
+        # Milestone List 선택이 없으면 기존 페이지네이션 방식
+        if not self.filtered_milestones:
+            return None
+        return self.filtered_milestones[self.current_milestone_index]["id"]
+
+    def _update_milestone_nav(self):
+        """페이지네이션 레이블과 이전/다음 버튼 상태 갱신"""
+        if self._displayed_milestone_id is None:
             self.prev_btn.setEnabled(False)
             self.next_btn.setEnabled(False)
             self.milestone_nav_label.setText("0 / 0")
-            return
-
-        # 현재 마일스톤 표시
-        current_milestone = self.filtered_milestones[
-            self.current_milestone_index]
-        milestone_widget = self._create_milestone_block(current_milestone)
-        self.milestone_layout.addWidget(milestone_widget)
-
-        # 네비게이션 업데이트
-        total = len(self.filtered_milestones)
-        current = self.current_milestone_index + 1
-        self.milestone_nav_label.setText(f"{current} / {total}")
+        elif self.selected_milestone_id_from_list:
+            # 페이지네이션 비활성화 (단일 마일스톤만 표시)
+            self.prev_btn.setEnabled(False)
+            self.next_btn.setEnabled(False)
+            self.milestone_nav_label.setText("1 / 1")
+        else:
+            total = len(self.filtered_milestones)
+            current = self.current_milestone_index + 1
+            self.milestone_nav_label.setText(f"{current} / {total}")
 
-        # 버튼 활성화/비활성화
-        self.prev_btn.setEnabled(self.current_milestone_index > 0)
-        self.next_btn.setEnabled(self.current_milestone_index < total - 1)
+            # 버튼 활성화/비활성화
+            self.prev_btn.setEnabled(self.current_milestone_index > 0)
+            self.next_btn.setEnabled(self.current_milestone_index < total - 1)
 
     def _show_milestone_tree(self):
         """Milestone Tree 다이얼로그 표시"""
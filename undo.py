@@ -0,0 +1,191 @@
+"""실행 취소 모듈 - 역방향 레코드만 쌓는 실행 취소/다시 실행 기록
+
+트랜잭션 하나가 실행 취소 단계 하나입니다. 단계에는 데이터 사본 대신
+그 트랜잭션을 되돌리는 역방향 레코드(노드의 이전 값, 바뀐 마일스톤 필드,
+이전 키워드 목록 등)만 저장합니다. 노드는 불변 models.Node를 그대로
+공유하므로 복사 비용이 없습니다. 기록 전체의 추정 크기가 예산을 넘으면
+가장 오래된 단계부터 버리고, 같은 대상을 짧은 간격으로 연달아 수정하면
+한 단계로 합칩니다.
+"""
+
+import sys
+import time
+from collections import deque
+from collections.abc import Mapping
+from typing import Any, Deque, List, Optional, Tuple
+
+from json_stream import LazyMilestone
+
+
+# 기본 메모리 예산 (추정 바이트)
+DEFAULT_BUDGET = 1024 * 1024
+# 같은 대상의 수정을 한 단계로 합치는 간격 (초)
+DEFAULT_COALESCE_SECONDS = 1.0
+
+# 합칠 수 있는 역방향 레코드 (수정 계열)
+_COALESCE_OPS = ("update_node", "update_milestone", "set_keywords")
+
+
+class _Step:
+    """실행 취소 단계 하나 (역방향 레코드 리스트)"""
+
+    __slots__ = ("inverses", "size", "key", "time")
+
+    def __init__(self, inverses: List[Mapping]):
+        self.inverses = inverses
+        self.size = sum(estimate_size(inverse) for inverse in inverses)
+        self.key = _coalesce_key(inverses)
+        self.time = time.monotonic()
+
+
+class UndoHistory:
+    """예산이 정해진 실행 취소/다시 실행 스택"""
+
+    def __init__(self, budget: int = DEFAULT_BUDGET,
+                 coalesce_seconds: float = DEFAULT_COALESCE_SECONDS):
+        """
+        Args:
+            budget (int): 실행 취소/다시 실행 기록 전체의 최대 추정 크기 (바이트)
+            coalesce_seconds (float): 같은 대상의 연속 수정을 합치는 간격 (0이면 합치지 않음)
+        """
+        self.budget = budget
+        self.coalesce_seconds = coalesce_seconds
+        self._undo: Deque[_Step] = deque()
+        self._redo: List[_Step] = []
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """현재 기록의 추정 크기 (바이트)"""
+        return self._size
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def __len__(self) -> int:
+        return len(self._undo)
+
+    def clear(self) -> None:
+        """모든 기록을 지웁니다 (데이터를 새로 불러올 때)."""
+        self._undo.clear()
+        self._redo.clear()
+        self._size = 0
+
+    def record(self, inverses: List[Mapping]) -> None:
+        """새 편집의 역방향 레코드를 기록합니다 (다시 실행 기록은 지워짐).
+
+        Args:
+            inverses (List[Mapping]): 적용 순서대로의 역방향 레코드
+        """
+        if not inverses:
+            return
+        self._drop_redo()
+        step = _Step(inverses)
+        last = self._undo[-1] if self._undo else None
+        if (last is not None and step.key is not None and step.key == last.key
+                and step.time - last.time < self.coalesce_seconds):
+            # 먼저 기록된 역방향 레코드가 두 편집 이전 상태를 담고 있음
+            self._size -= last.size
+            last.inverses = [_merge_inverse(last.inverses[0], step.inverses[0])]
+            last.size = estimate_size(last.inverses[0])
+            last.time = step.time
+            self._size += last.size
+        else:
+            self._push_undo(step)
+        self._enforce_budget()
+
+    def pop_undo(self) -> Optional[List[Mapping]]:
+        """실행 취소할 단계의 역방향 레코드를 꺼냅니다 (없으면 None)."""
+        if not self._undo:
+            return None
+        step = self._undo.pop()
+        self._size -= step.size
+        return step.inverses
+
+    def pop_redo(self) -> Optional[List[Mapping]]:
+        """다시 실행할 단계의 레코드를 꺼냅니다 (없으면 None)."""
+        if not self._redo:
+            return None
+        step = self._redo.pop()
+        self._size -= step.size
+        return step.inverses
+
+    def push_undo(self, inverses: List[Mapping]) -> None:
+        """다시 실행한 결과를 실행 취소 기록에 넣습니다 (다시 실행 기록은 유지)."""
+        if inverses:
+            step = _Step(inverses)
+            step.key = None  # 다시 실행한 단계에는 이후 편집을 합치지 않음
+            self._push_undo(step)
+            self._enforce_budget()
+
+    def push_redo(self, inverses: List[Mapping]) -> None:
+        """실행 취소한 결과를 다시 실행 기록에 넣습니다."""
+        if inverses:
+            step = _Step(inverses)
+            step.key = None
+            self._redo.append(step)
+            self._size += step.size
+            self._enforce_budget()
+
+    def _push_undo(self, step: _Step) -> None:
+        self._undo.append(step)
+        self._size += step.size
+
+    def _drop_redo(self) -> None:
+        for step in self._redo:
+            self._size -= step.size
+        self._redo.clear()
+
+    def _enforce_budget(self) -> None:
+        """예산을 넘으면 가장 오래된 실행 취소 단계부터 버립니다.
+
+        최근 단계 하나는 예산을 넘더라도 남겨 둡니다.
+        """
+        while self._size > self.budget and len(self._undo) > 1:
+            self._size -= self._undo.popleft().size
+        while self._size > self.budget and self._redo and len(self._redo) + len(self._undo) > 1:
+            self._size -= self._redo.pop(0).size
+
+
+def _coalesce_key(inverses: List[Mapping]) -> Optional[Tuple]:
+    """한 단계로 합칠 수 있는 단계의 대상 키 (합칠 수 없으면 None)"""
+    if len(inverses) != 1 or inverses[0].get("op") not in _COALESCE_OPS:
+        return None
+    inverse = inverses[0]
+    op = inverse["op"]
+    if op == "update_node":
+        return (op, inverse["milestone_id"], inverse["node"]["id"])
+    if op == "update_milestone":
+        return (op, inverse["id"])
+    return (op,)
+
+
+def _merge_inverse(older: Mapping, newer: Mapping) -> Mapping:
+    """같은 대상의 두 역방향 레코드를 하나로 합칩니다.
+
+    마일스톤 필드 변경은 필드 단위 차이만 담으므로, 나중 편집에서만 바뀐
+    필드를 먼저 편집의 값(둘 다 바뀌었다면 먼저 것이 더 이전 값)과 합칩니다.
+    """
+    if older["op"] == "update_milestone":
+        return {**newer, **older}
+    return older
+
+
+def estimate_size(obj: Any) -> int:
+    """역방향 레코드의 대략적인 메모리 크기를 추정합니다 (바이트).
+
+    공유되는 intern 문자열도 한 번씩 세므로 실제보다 약간 크게 잡힙니다.
+    아직 노드를 불러오지 않은 마일스톤은 헤더만 셉니다.
+    """
+    if isinstance(obj, str):
+        return sys.getsizeof(obj)
+    if isinstance(obj, LazyMilestone) and not obj.is_loaded:
+        return 64 + sum(estimate_size(v) for v in dict.values(obj))
+    if isinstance(obj, Mapping):
+        return 64 + sum(estimate_size(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return 56 + 8 * len(obj) + sum(estimate_size(v) for v in obj)
+    return 32